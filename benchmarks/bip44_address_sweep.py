@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+"""
+BIP44 address sweep benchmark.
+
+Derives ``m/44'/0'/0'/0/i`` for a range of address indexes and, for each node,
+serializes the extended private key and encodes the P2PKH address. The ``hex``
+pipeline replays the hexadecimal round-trip ``BIP32HD`` and ``HDWallet`` used
+before the raw-bytes accessors: keys are read as hexadecimal strings, the
+extended key is serialized from ``"00" + private_key``, and the public key is
+parsed back from hexadecimal and hashed again for the address. The ``bytes``
+pipeline is the current ``xprivate_key()`` and ``address()``. Both use the same
+hash backends, so the difference is the hexadecimal round-trip alone. Only the
+serialization and encoding steps are timed, derivation is excluded.
+
+Usage: python benchmarks/bip44_address_sweep.py [--count 500] [--repeat 3]
+"""
+
+from typing import Callable
+
+import argparse
+import time
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import Bitcoin as Cryptocurrency
+from hdwallet.seeds import BIP39Seed
+from hdwallet.hds import (
+    BIP44HD, BIP32Node
+)
+from hdwallet.derivations import (
+    BIP44Derivation, CHANGES
+)
+from hdwallet.eccs import (
+    IPublicKey, SLIP10Secp256k1PublicKey, validate_and_get_public_key
+)
+from hdwallet.libs.base58 import (
+    ensure_string, check_encode
+)
+from hdwallet.crypto import hash160
+from hdwallet.keys import serialize
+from hdwallet.utils import (
+    get_bytes, integer_to_bytes, bytes_to_string
+)
+
+SEED: str = "000102030405060708090a0b0c0d0e0f"
+
+
+def hex_pipeline(hdwallet: HDWallet) -> str:
+    node: BIP32Node = hdwallet._hd.node()
+    private_key: str = bytes_to_string(node.private_key())
+    serialize(
+        version=integer_to_bytes(Cryptocurrency.NETWORKS.MAINNET.XPRIVATE_KEY_VERSIONS.P2PKH),
+        depth=node.depth(),
+        parent_fingerprint=bytes_to_string(node.parent_fingerprint()),
+        index=node.index(),
+        chain_code=bytes_to_string(node.chain_code()),
+        key=("00" + private_key),
+        encoded=True
+    )
+    public_key: IPublicKey = validate_and_get_public_key(
+        public_key=bytes_to_string(node.public_key()), public_key_cls=SLIP10Secp256k1PublicKey
+    )
+    return ensure_string(check_encode(
+        integer_to_bytes(Cryptocurrency.NETWORKS.MAINNET.PUBLIC_KEY_ADDRESS_PREFIX) +
+        hash160(get_bytes(bytes_to_string(public_key.raw_compressed()))),
+        alphabet=Cryptocurrency.PARAMS.ALPHABET
+    ))
+
+
+def bytes_pipeline(hdwallet: HDWallet) -> str:
+    hdwallet.xprivate_key()
+    return hdwallet.address()
+
+
+def sweep(pipeline: Callable[[HDWallet], str], count: int) -> float:
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=Cryptocurrency, hd=BIP44HD, network=Cryptocurrency.NETWORKS.MAINNET
+    ).from_seed(seed=BIP39Seed(seed=SEED))
+    elapsed: float = 0.0
+    for address in range(count):
+        hdwallet.update_derivation(
+            derivation=BIP44Derivation(
+                coin_type=Cryptocurrency.COIN_TYPE, account=0, change=CHANGES.EXTERNAL_CHAIN, address=address
+            )
+        )
+        start: float = time.perf_counter()
+        pipeline(hdwallet)
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="BIP44 address sweep benchmark")
+    parser.add_argument("--count", type=int, default=500, help="Number of addresses per sweep")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed sweeps, the best is reported")
+    args = parser.parse_args()
+
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=Cryptocurrency, hd=BIP44HD, network=Cryptocurrency.NETWORKS.MAINNET
+    ).from_seed(seed=BIP39Seed(seed=SEED))
+    assert hex_pipeline(hdwallet) == bytes_pipeline(hdwallet)
+
+    for name, pipeline in [("hex", hex_pipeline), ("bytes", bytes_pipeline)]:
+        best: float = min(sweep(pipeline, args.count) for _ in range(args.repeat))
+        print(f"{name:>5}: {args.count} addresses in {best:.3f}s ({args.count / best:,.0f} addresses/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+"""
+Generator multiplication benchmark for the pure-Python ECDSA backends.
+
+Multiplies the SLIP10-Secp256k1 and SLIP10-Nist256p1 generators by random
+256-bit scalars, once with the ``ecdsa`` package multiplication and once with
+the fixed-base table used by the point classes. The one-off table build time
+is reported separately for each window size.
+
+Usage: python benchmarks/generator_multiplication.py [--count 2000] [--window 4 6 8]
+"""
+
+from typing import Callable, List
+
+import argparse
+import secrets
+import time
+
+from ecdsa.ecdsa import (
+    generator_secp256k1, generator_256
+)
+
+from hdwallet.eccs.slip10.precomputed import FixedBaseTable
+
+
+def run(multiply: Callable[[int], object], scalars: List[int]) -> float:
+    start: float = time.perf_counter()
+    for scalar in scalars:
+        multiply(scalar)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generator multiplication benchmark")
+    parser.add_argument("--count", type=int, default=2000, help="Number of multiplications per run")
+    parser.add_argument("--window", type=int, nargs="+", default=[4, 6, 8], help="Table window sizes in bits")
+    args = parser.parse_args()
+
+    scalars: List[int] = [secrets.randbits(256) for _ in range(args.count)]
+    for name, generator in [("SLIP10-Secp256k1", generator_secp256k1), ("SLIP10-Nist256p1", generator_256)]:
+        print(name)
+        elapsed: float = run(lambda scalar: generator * scalar, scalars)
+        print(f"  ecdsa      : {elapsed / args.count * 1e6:8.1f} us/mul")
+        for window in args.window:
+            table: FixedBaseTable = FixedBaseTable(generator, window=window, threshold=0)
+            start: float = time.perf_counter()
+            table.table()
+            build: float = time.perf_counter() - start
+            elapsed = run(table.multiply, scalars)
+            print(f"  window {window:>2}  : {elapsed / args.count * 1e6:8.1f} us/mul (build {build:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
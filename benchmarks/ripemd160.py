@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+"""
+Pure-Python RIPEMD-160 benchmark.
+
+Hashes random 32-byte messages (the HASH160 case) and longer messages with the
+generic schedule-table loop the library used to ship, the unrolled
+``hdwallet.libs.ripemd160`` implementation and its ``ripemd160_many`` batch API,
+and OpenSSL when ``hashlib`` provides RIPEMD-160.
+
+Usage: python benchmarks/ripemd160.py [--count 5000] [--length 32 64 200]
+"""
+
+from typing import Callable, List
+
+import argparse
+import hashlib
+import os
+import struct
+import time
+
+from hdwallet.libs.ripemd160 import (
+    ripemd160, ripemd160_many
+)
+
+
+ML = [
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8,
+    3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12, 1, 9, 11, 10, 0, 8, 12, 4, 13, 3, 7, 15, 14, 5, 6, 2,
+    4, 0, 5, 9, 7, 12, 2, 10, 14, 1, 3, 8, 11, 6, 15, 13
+]
+MR = [
+    5, 14, 7, 0, 9, 2, 11, 4, 13, 6, 15, 8, 1, 10, 3, 12, 6, 11, 3, 7, 0, 13, 5, 10, 14, 15, 8, 12, 4, 9, 1, 2,
+    15, 5, 1, 3, 7, 14, 6, 9, 11, 8, 12, 2, 10, 0, 4, 13, 8, 6, 4, 1, 3, 11, 15, 0, 5, 12, 2, 13, 9, 7, 10, 14,
+    12, 15, 10, 4, 1, 5, 8, 7, 6, 2, 13, 14, 0, 3, 9, 11
+]
+RL = [
+    11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8, 7, 6, 8, 13, 11, 9, 7, 15, 7, 12, 15, 9, 11, 7, 13, 12,
+    11, 13, 6, 7, 14, 9, 13, 15, 14, 8, 13, 6, 5, 12, 7, 5, 11, 12, 14, 15, 14, 15, 9, 8, 9, 14, 5, 6, 8, 6, 5, 12,
+    9, 15, 5, 11, 6, 8, 13, 12, 5, 12, 13, 14, 11, 8, 5, 6
+]
+RR = [
+    8, 9, 9, 11, 13, 15, 15, 5, 7, 7, 8, 11, 14, 14, 12, 6, 9, 13, 15, 7, 12, 8, 9, 11, 7, 7, 12, 7, 6, 15, 13, 11,
+    9, 7, 15, 11, 8, 6, 6, 14, 12, 13, 5, 14, 13, 13, 7, 5, 15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8,
+    8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11
+]
+KL = [0, 0x5a827999, 0x6ed9eba1, 0x8f1bbcdc, 0xa953fd4e]
+KR = [0x50a28be6, 0x5c4dd124, 0x6d703ef3, 0x7a6d76e9, 0]
+
+
+def fi(x, y, z, i):
+    if i == 0:
+        return x ^ y ^ z
+    elif i == 1:
+        return (x & y) | (~x & z)
+    elif i == 2:
+        return (x | ~y) ^ z
+    elif i == 3:
+        return (x & z) | (y & ~z)
+    return x ^ (y | ~z)
+
+
+def rol(x, i):
+    return ((x << i) | ((x & 0xffffffff) >> (32 - i))) & 0xffffffff
+
+
+def compress(h0, h1, h2, h3, h4, block):
+    al, bl, cl, dl, el = h0, h1, h2, h3, h4
+    ar, br, cr, dr, er = h0, h1, h2, h3, h4
+    x = [struct.unpack("<L", block[4*i:4*(i+1)])[0] for i in range(16)]
+    for j in range(80):
+        rnd = j >> 4
+        al = rol(al + fi(bl, cl, dl, rnd) + x[ML[j]] + KL[rnd], RL[j]) + el
+        al, bl, cl, dl, el = el, al, bl, rol(cl, 10), dl
+        ar = rol(ar + fi(br, cr, dr, 4 - rnd) + x[MR[j]] + KR[rnd], RR[j]) + er
+        ar, br, cr, dr, er = er, ar, br, rol(cr, 10), dr
+    return h1 + cl + dr, h2 + dl + er, h3 + el + ar, h4 + al + br, h0 + bl + cr
+
+
+def generic(data):
+    state = (0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476, 0xc3d2e1f0)
+    for b in range(len(data) >> 6):
+        state = compress(*(list(state) + [data[64*b:64*(b+1)]]))
+    fin = data[len(data) & ~63:] + b"\x80" + b"\x00" * ((119 - len(data)) & 63) + struct.pack("<Q", 8 * len(data))
+    for b in range(len(fin) >> 6):
+        state = compress(*(list(state) + [fin[64*b:64*(b+1)]]))
+    return b"".join(struct.pack("<L", h & 0xffffffff) for h in state)
+
+
+def run(digest: Callable[[bytes], bytes], messages: List[bytes]) -> float:
+    start: float = time.perf_counter()
+    for message in messages:
+        digest(message)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pure-Python RIPEMD-160 benchmark")
+    parser.add_argument("--count", type=int, default=5000, help="Number of messages per run")
+    parser.add_argument("--length", type=int, nargs="+", default=[32, 64, 200], help="Message lengths in bytes")
+    args = parser.parse_args()
+
+    for length in args.length:
+        messages: List[bytes] = [os.urandom(length) for _ in range(args.count)]
+        assert [generic(message) for message in messages[:100]] == ripemd160_many(messages[:100])
+        print(f"{length} bytes")
+        baseline: float = run(generic, messages)
+        print(f"  generic   : {baseline / args.count * 1e6:8.1f} us/hash")
+        elapsed: float = run(ripemd160, messages)
+        print(f"  unrolled  : {elapsed / args.count * 1e6:8.1f} us/hash ({baseline / elapsed:.2f}x)")
+        start: float = time.perf_counter()
+        ripemd160_many(messages)
+        elapsed = time.perf_counter() - start
+        print(f"  batch     : {elapsed / args.count * 1e6:8.1f} us/hash ({baseline / elapsed:.2f}x)")
+        if "ripemd160" in hashlib.algorithms_available:
+            elapsed = run(lambda message: hashlib.new("ripemd160", message).digest(), messages)
+            print(f"  openssl   : {elapsed / args.count * 1e6:8.1f} us/hash")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    List, Dict, Type
+    Any, List, Dict, Type, Union
 )
 
 from ..exceptions import AddressError
@@ -161,6 +161,12 @@ class ADDRESSES:
         XinFinAddress.name(): XinFinAddress,
         ZilliqaAddress.name(): ZilliqaAddress
     }
+    public_key_hash: List[str] = [
+        P2PKHAddress.name(), P2SHAddress.name(), P2WPKHAddress.name(), P2WPKHInP2SHAddress.name()
+    ]
+    witness_script_hash: List[str] = [
+        P2WSHAddress.name(), P2WSHInP2SHAddress.name()
+    ]
 
     @classmethod
     def names(cls) -> List[str]:
@@ -217,6 +223,64 @@ class ADDRESSES:
 
         return name in cls.names()
 
+    @classmethod
+    def is_public_key_hash(cls, name: str) -> bool:
+        """
+        Check if a given address name encodes the HASH160 of the public key.
+
+        :param name: The name to check.
+        :type name: str
+
+        :return: True if the address is built from a public key hash, False otherwise.
+        :rtype: bool
+        """
+
+        return name in cls.public_key_hash
+
+    @classmethod
+    def encode_public_key_hash(cls, name: str, public_key_hash: Union[bytes, str], **kwargs: Any) -> str:
+        """
+        Encode a precomputed HASH160 of a public key, skipping the public key parsing and hashing.
+
+        :param name: The address name, one of :attr:`public_key_hash`.
+        :type name: str
+        :param public_key_hash: The 20-byte HASH160 of the public key.
+        :type public_key_hash: Union[bytes, str]
+        :param kwargs: The address ``encode`` keyword arguments.
+        :type kwargs: Any
+
+        :return: The encoded address.
+        :rtype: str
+        """
+
+        if not cls.is_public_key_hash(name=name):
+            raise AddressError(
+                "Invalid public key hash address name", expected=cls.public_key_hash, got=name
+            )
+        return cls.dictionary[name]._encode_public_key_hash(public_key_hash=public_key_hash, **kwargs)
+
+    @classmethod
+    def encode_witness_script_hash(cls, name: str, witness_script_hash: Union[bytes, str], **kwargs: Any) -> str:
+        """
+        Encode a precomputed P2WSH witness script hash, skipping the public key parsing and hashing.
+
+        :param name: The address name, one of :attr:`witness_script_hash`.
+        :type name: str
+        :param witness_script_hash: The 32-byte SHA256 of the witness script.
+        :type witness_script_hash: Union[bytes, str]
+        :param kwargs: The address ``encode`` keyword arguments.
+        :type kwargs: Any
+
+        :return: The encoded address.
+        :rtype: str
+        """
+
+        if name not in cls.witness_script_hash:
+            raise AddressError(
+                "Invalid witness script hash address name", expected=cls.witness_script_hash, got=name
+            )
+        return cls.dictionary[name]._encode_witness_script_hash(witness_script_hash=witness_script_hash, **kwargs)
+
 
 __all__: List[str] = [
     "IAddress", "ADDRESSES"
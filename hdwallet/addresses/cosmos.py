@@ -8,7 +8,6 @@ from typing import (
     Any, Union
 )
 
-from ..libs.ripemd160 import ripemd160
 from ..libs.bech32 import (
     bech32_encode, bech32_decode
 )
@@ -16,7 +15,7 @@ from ..eccs import (
     IPublicKey, SLIP10Secp256k1PublicKey, validate_and_get_public_key
 )
 from ..cryptocurrencies import Cosmos
-from ..crypto import sha256
+from ..crypto import hash160
 from ..utils import bytes_to_string
 from .iaddress import IAddress
 
@@ -53,9 +52,9 @@ class CosmosAddress(IAddress):
         public_key: IPublicKey = validate_and_get_public_key(
             public_key=public_key, public_key_cls=SLIP10Secp256k1PublicKey
         )
-        public_key_hash: bytes = ripemd160(sha256(
+        public_key_hash: bytes = hash160(
             public_key.raw_compressed()
-        ))
+        )
         return bech32_encode(
             kwargs.get("hrp", cls.hrp), public_key_hash
         )
@@ -17,8 +17,9 @@ from ..eccs import (
 )
 from ..cryptocurrencies import Bitcoin
 from ..crypto import hash160
+from ..exceptions import AddressError
 from ..utils import (
-    integer_to_bytes, bytes_to_string
+    get_bytes, integer_to_bytes, bytes_to_string
 )
 from .iaddress import IAddress
 
@@ -56,16 +57,35 @@ class P2PKHAddress(IAddress):
         :rtype: str
         """
 
-        public_key_address_prefix: bytes = integer_to_bytes(
-            kwargs.get("public_key_address_prefix", cls.public_key_address_prefix)
-        )
         public_key: IPublicKey = validate_and_get_public_key(
             public_key=public_key, public_key_cls=SLIP10Secp256k1PublicKey
         )
-        public_key_hash: bytes = hash160(
+        return cls._encode_public_key_hash(hash160(
             public_key.raw_compressed()
             if kwargs.get("public_key_type", PUBLIC_KEY_TYPES.COMPRESSED) == PUBLIC_KEY_TYPES.COMPRESSED else
             public_key.raw_uncompressed()
+        ), **kwargs)
+
+    @classmethod
+    def _encode_public_key_hash(cls, public_key_hash: Union[bytes, str], **kwargs: Any) -> str:
+        """
+        Encode the HASH160 of a public key into a P2PKH address, for callers holding the hash already.
+
+        :param public_key_hash: The 20-byte HASH160 of the public key.
+        :type public_key_hash: Union[bytes, str]
+        :param kwargs: The :meth:`encode` keyword arguments.
+        :type kwargs: Any
+
+        :return: The encoded P2PKH address.
+        :rtype: str
+        """
+
+        public_key_hash: bytes = get_bytes(public_key_hash)
+        if len(public_key_hash) != 20:
+            raise AddressError("Invalid public key hash length", expected=20, got=len(public_key_hash))
+
+        public_key_address_prefix: bytes = integer_to_bytes(
+            kwargs.get("public_key_address_prefix", cls.public_key_address_prefix)
         )
 
         return ensure_string(check_encode(
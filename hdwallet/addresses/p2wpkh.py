@@ -18,7 +18,10 @@ from ..eccs import (
 )
 from ..cryptocurrencies import Bitcoin
 from ..crypto import hash160
-from ..utils import bytes_to_string
+from ..exceptions import AddressError
+from ..utils import (
+    get_bytes, bytes_to_string
+)
 from .iaddress import IAddress
 
 
@@ -58,11 +61,30 @@ class P2WPKHAddress(IAddress):
         public_key: IPublicKey = validate_and_get_public_key(
             public_key=public_key, public_key_cls=SLIP10Secp256k1PublicKey
         )
-        public_key_hash: bytes = hash160(
+        return cls._encode_public_key_hash(hash160(
             public_key.raw_compressed()
             if kwargs.get("public_key_type", PUBLIC_KEY_TYPES.COMPRESSED) == PUBLIC_KEY_TYPES.COMPRESSED else
             public_key.raw_uncompressed()
-        )
+        ), **kwargs)
+
+    @classmethod
+    def _encode_public_key_hash(cls, public_key_hash: Union[bytes, str], **kwargs: Any) -> str:
+        """
+        Encode the HASH160 of a public key into a P2WPKH address, for callers holding the hash already.
+
+        :param public_key_hash: The 20-byte HASH160 of the public key.
+        :type public_key_hash: Union[bytes, str]
+        :param kwargs: The :meth:`encode` keyword arguments.
+        :type kwargs: Any
+
+        :return: The encoded P2WPKH address.
+        :rtype: str
+        """
+
+        public_key_hash: bytes = get_bytes(public_key_hash)
+        if len(public_key_hash) != 20:
+            raise AddressError("Invalid public key hash length", expected=20, got=len(public_key_hash))
+
         return ensure_string(segwit_encode(
             kwargs.get("hrp", cls.hrp),
             kwargs.get("witness_version", cls.witness_version),
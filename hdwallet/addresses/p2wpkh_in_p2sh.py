@@ -16,6 +16,7 @@ from ..eccs import (
     IPublicKey, SLIP10Secp256k1PublicKey, validate_and_get_public_key
 )
 from ..crypto import hash160
+from ..exceptions import AddressError
 from ..utils import (
     get_bytes, integer_to_bytes, bytes_to_string
 )
@@ -52,16 +53,35 @@ class P2WPKHInP2SHAddress(P2SHAddress):
         :rtype: str
         """
 
-        script_address_prefix: bytes = integer_to_bytes(
-            kwargs.get("script_address_prefix", cls.script_address_prefix)
-        )
         public_key: IPublicKey = validate_and_get_public_key(
             public_key=public_key, public_key_cls=SLIP10Secp256k1PublicKey
         )
-        public_key_hash: bytes = hash160(
+        return cls._encode_public_key_hash(hash160(
             public_key.raw_compressed()
             if kwargs.get("public_key_type", PUBLIC_KEY_TYPES.COMPRESSED) == PUBLIC_KEY_TYPES.COMPRESSED else
             public_key.raw_uncompressed()
+        ), **kwargs)
+
+    @classmethod
+    def _encode_public_key_hash(cls, public_key_hash: Union[bytes, str], **kwargs: Any) -> str:
+        """
+        Encode the HASH160 of a public key into a P2WPKH-In-P2SH address, for callers holding the hash already.
+
+        :param public_key_hash: The 20-byte HASH160 of the public key.
+        :type public_key_hash: Union[bytes, str]
+        :param kwargs: The :meth:`encode` keyword arguments.
+        :type kwargs: Any
+
+        :return: The encoded P2WPKH-In-P2SH address.
+        :rtype: str
+        """
+
+        public_key_hash: bytes = get_bytes(public_key_hash)
+        if len(public_key_hash) != 20:
+            raise AddressError("Invalid public key hash length", expected=20, got=len(public_key_hash))
+
+        script_address_prefix: bytes = integer_to_bytes(
+            kwargs.get("script_address_prefix", cls.script_address_prefix)
         )
         script_hash: bytes = hash160(get_bytes(
             "0014" + bytes_to_string(public_key_hash)
@@ -18,6 +18,7 @@ from ..eccs import (
 )
 from ..cryptocurrencies import Bitcoin
 from ..crypto import sha256
+from ..exceptions import AddressError
 from ..utils import (
     get_bytes, bytes_to_string
 )
@@ -40,20 +41,18 @@ class P2WSHAddress(P2WPKHAddress):
         return "P2WSH"
 
     @classmethod
-    def encode(cls, public_key: Union[bytes, str, IPublicKey], **kwargs: Any) -> str:
+    def script_hash(cls, public_key: Union[bytes, str, IPublicKey], **kwargs: Any) -> bytes:
         """
-        Encode a public key into a P2TR address.
+        Compute the SHA256 of the 1-of-1 multisig witness script of a public key.
 
-        :param public_key: The public key to encode.
+        :param public_key: The public key of the witness script.
         :type public_key: Union[bytes, str, IPublicKey]
         :param kwargs: Additional keyword arguments.
             - public_key_type: Type of the public key (compressed or uncompressed).
-            - hrp: Human-readable part (optional).
-            - version: Address version (optional).
         :type kwargs: Any
 
-        :return: The encoded P2TR address.
-        :rtype: str
+        :return: The witness script hash, which is the P2WSH witness program.
+        :rtype: bytes
         """
 
         public_key: IPublicKey = validate_and_get_public_key(
@@ -64,9 +63,47 @@ class P2WSHAddress(P2WPKHAddress):
             if kwargs.get("public_key_type", PUBLIC_KEY_TYPES.COMPRESSED) == PUBLIC_KEY_TYPES.COMPRESSED else
             public_key.raw_uncompressed()
         )
-        script_hash: bytes = sha256(get_bytes(
+        return sha256(get_bytes(
             "5121" + bytes_to_string(public_key_bytes) + "51ae"
         ))
+
+    @classmethod
+    def encode(cls, public_key: Union[bytes, str, IPublicKey], **kwargs: Any) -> str:
+        """
+        Encode a public key into a P2TR address.
+
+        :param public_key: The public key to encode.
+        :type public_key: Union[bytes, str, IPublicKey]
+        :param kwargs: Additional keyword arguments.
+            - public_key_type: Type of the public key (compressed or uncompressed).
+            - hrp: Human-readable part (optional).
+            - version: Address version (optional).
+        :type kwargs: Any
+
+        :return: The encoded P2TR address.
+        :rtype: str
+        """
+
+        return cls._encode_witness_script_hash(cls.script_hash(public_key, **kwargs), **kwargs)
+
+    @classmethod
+    def _encode_witness_script_hash(cls, witness_script_hash: Union[bytes, str], **kwargs: Any) -> str:
+        """
+        Encode a witness script hash into a P2WSH address, for callers holding the hash already.
+
+        :param witness_script_hash: The 32-byte SHA256 of the witness script, see :meth:`script_hash`.
+        :type witness_script_hash: Union[bytes, str]
+        :param kwargs: The :meth:`encode` keyword arguments.
+        :type kwargs: Any
+
+        :return: The encoded P2WSH address.
+        :rtype: str
+        """
+
+        witness_script_hash: bytes = get_bytes(witness_script_hash)
+        if len(witness_script_hash) != 32:
+            raise AddressError("Invalid witness script hash length", expected=32, got=len(witness_script_hash))
+
         return ensure_string(segwit_encode(
-            kwargs.get("hrp", cls.hrp), kwargs.get("version", cls.witness_version), script_hash
+            kwargs.get("hrp", cls.hrp), kwargs.get("version", cls.witness_version), witness_script_hash
         ))
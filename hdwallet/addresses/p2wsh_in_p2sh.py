@@ -11,17 +11,14 @@ from typing import (
 from ..libs.base58 import (
     ensure_string, check_encode
 )
-from ..consts import PUBLIC_KEY_TYPES
-from ..eccs import (
-    IPublicKey, SLIP10Secp256k1PublicKey, validate_and_get_public_key
-)
-from ..crypto import (
-    hash160, sha256
-)
+from ..eccs import IPublicKey
+from ..crypto import hash160
+from ..exceptions import AddressError
 from ..utils import (
     get_bytes, integer_to_bytes, bytes_to_string
 )
 from .p2sh import P2SHAddress
+from .p2wsh import P2WSHAddress
 
 
 class P2WSHInP2SHAddress(P2SHAddress):
@@ -54,21 +51,31 @@ class P2WSHInP2SHAddress(P2SHAddress):
         :rtype: str
         """
 
+        return cls._encode_witness_script_hash(P2WSHAddress.script_hash(public_key, **kwargs), **kwargs)
+
+    @classmethod
+    def _encode_witness_script_hash(cls, witness_script_hash: Union[bytes, str], **kwargs: Any) -> str:
+        """
+        Encode a witness script hash into a P2WSH-In-P2SH address, for callers holding the hash already.
+
+        :param witness_script_hash: The 32-byte SHA256 of the witness script.
+        :type witness_script_hash: Union[bytes, str]
+        :param kwargs: The :meth:`encode` keyword arguments.
+        :type kwargs: Any
+
+        :return: The encoded P2WSH-In-P2SH address.
+        :rtype: str
+        """
+
+        witness_script_hash: bytes = get_bytes(witness_script_hash)
+        if len(witness_script_hash) != 32:
+            raise AddressError("Invalid witness script hash length", expected=32, got=len(witness_script_hash))
+
         script_address_prefix: bytes = integer_to_bytes(
             kwargs.get("script_address_prefix", cls.script_address_prefix)
         )
-        public_key: IPublicKey = validate_and_get_public_key(
-            public_key=public_key, public_key_cls=SLIP10Secp256k1PublicKey
-        )
-        public_key_bytes: bytes = (
-            public_key.raw_compressed()
-            if kwargs.get("public_key_type", PUBLIC_KEY_TYPES.COMPRESSED) == PUBLIC_KEY_TYPES.COMPRESSED else
-            public_key.raw_uncompressed()
-        )
         script_hash: bytes = hash160(get_bytes(
-            "0020" + bytes_to_string(sha256(get_bytes(
-                "5121" + bytes_to_string(public_key_bytes) + "51ae"
-            )))
+            "0020" + bytes_to_string(witness_script_hash)
         ))
 
         return ensure_string(check_encode(
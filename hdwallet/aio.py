@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Any, AsyncIterator, Callable, Deque, Iterator, List, Optional, Tuple, Type, Union
+)
+from concurrent.futures import (
+    Executor, ProcessPoolExecutor
+)
+from collections import deque
+from itertools import islice
+
+import asyncio
+import functools
+
+from .hdwallet import HDWallet
+from .entropies import IEntropy
+from .mnemonics import IMnemonic
+from .seeds import ISeed
+from .derivations import IDerivation
+from .addresses import IAddress
+from .hds.bip32 import BIP32ChildKey
+from .parallel import (
+    DerivedAddress, ParallelDeriver
+)
+from .exceptions import Error
+
+
+def _apply(hdwallet: HDWallet, method: str, kwargs: dict) -> HDWallet:
+    """
+    Call a wallet method and return the wallet, run inside the executor.
+
+    :param hdwallet: The wallet to update, a fork when called by :class:`AsyncHDWallet`.
+    :type hdwallet: HDWallet
+    :param method: The method name.
+    :type method: str
+    :param kwargs: The method keyword arguments.
+    :type kwargs: dict
+
+    :return: The updated wallet.
+    :rtype: HDWallet
+    """
+
+    getattr(hdwallet, method)(**kwargs)
+    return hdwallet
+
+
+def _next_chunk(iterator: Iterator[Any], size: int) -> List[Any]:
+    """
+    Pull up to ``size`` items from an iterator, run inside the executor.
+
+    :param iterator: The iterator.
+    :type iterator: Iterator[Any]
+    :param size: The maximum number of items.
+    :type size: int
+
+    :return: The items, empty once the iterator is exhausted.
+    :rtype: List[Any]
+    """
+
+    return list(islice(iterator, size))
+
+
+class AsyncHDWallet:
+    """
+    Asyncio facade of :class:`hdwallet.hdwallet.HDWallet` running the expensive calls on an executor.
+
+    Seed stretching (``from_entropy``, ``from_mnemonic``, ``from_seed``), derivation and dumps
+    run on ``executor``, a ``ThreadPoolExecutor`` or a ``ProcessPoolExecutor``, or on the loop
+    default executor if None, so the event loop is never blocked. Updates are applied to a
+    :meth:`HDWallet.fork` and swapped in once they complete, so a cancelled call leaves the
+    wallet unchanged. Concurrent updates are serialized by an ``asyncio.Lock`` held from the
+    fork to the swap, so each one starts from the result of the previous one.
+
+    Bulk methods are async iterators computed ``chunk_size`` items at a time. At most
+    ``prefetch`` chunks are in flight ahead of the consumer, and closing the iterator or
+    cancelling its task stops scheduling new chunks, so derivation work stops early.
+
+    .. code-block:: python
+
+        >>> from hdwallet.aio import AsyncHDWallet
+        >>> wallet = AsyncHDWallet(hdwallet=HDWallet(cryptocurrency=Bitcoin, hd=BIP44HD))
+        >>> await wallet.from_mnemonic(mnemonic=BIP39Mnemonic(mnemonic=mnemonic))
+        >>> async for derived in wallet.iter_addresses(parent_path="m/44'/0'/0'/0", index=(0, 9999)):
+        ...     print(derived.index, derived.address)
+    """
+
+    _hdwallet: HDWallet
+    _executor: Optional[Executor]
+    _lock: asyncio.Lock
+
+    def __init__(self, hdwallet: HDWallet, executor: Optional[Executor] = None) -> None:
+        """
+        Initialize an AsyncHDWallet instance.
+
+        :param hdwallet: The wallet to wrap.
+        :type hdwallet: HDWallet
+        :param executor: The executor running the expensive calls, defaults to the loop default executor.
+        :type executor: Optional[Executor]
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        if not isinstance(hdwallet, HDWallet):
+            raise Error("Invalid HDWallet instance", expected=HDWallet, got=type(hdwallet))
+        if executor is not None and not isinstance(executor, Executor):
+            raise Error("Invalid executor instance", expected=Executor, got=type(executor))
+
+        self._hdwallet = hdwallet
+        self._executor = executor
+        self._lock = asyncio.Lock()
+
+    def hdwallet(self) -> HDWallet:
+        """
+        Get the wrapped wallet, for the cheap synchronous getters.
+
+        :return: The wrapped wallet.
+        :rtype: HDWallet
+        """
+
+        return self._hdwallet
+
+    def executor(self) -> Optional[Executor]:
+        """
+        Get the executor running the expensive calls.
+
+        :return: The executor, None for the loop default executor.
+        :rtype: Optional[Executor]
+        """
+
+        return self._executor
+
+    async def _run(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(function, *args, **kwargs)
+        )
+
+    async def _update(self, method: str, **kwargs) -> "AsyncHDWallet":
+        async with self._lock:
+            self._hdwallet = await self._run(_apply, self._hdwallet.fork(), method, kwargs)
+        return self
+
+    async def _stream(
+        self, tasks: Iterator[Callable[[], List[Any]]], prefetch: int, executor: Optional[Executor]
+    ) -> AsyncIterator[Any]:
+        if not isinstance(prefetch, int) or prefetch < 1:
+            raise Error("Invalid prefetch count", expected="positive integer", got=prefetch)
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            for task in tasks:
+                pending.append(loop.run_in_executor(executor, task))
+                if len(pending) >= prefetch:
+                    for item in await pending.popleft():
+                        yield item
+            while pending:
+                for item in await pending.popleft():
+                    yield item
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def from_entropy(self, entropy: IEntropy) -> "AsyncHDWallet":
+        """
+        Initialize the wallet from an entropy on the executor.
+
+        :param entropy: The entropy.
+        :type entropy: IEntropy
+
+        :return: The AsyncHDWallet instance.
+        :rtype: AsyncHDWallet
+        """
+
+        return await self._update("from_entropy", entropy=entropy)
+
+    async def from_mnemonic(self, mnemonic: IMnemonic) -> "AsyncHDWallet":
+        """
+        Initialize the wallet from a mnemonic on the executor, running the seed PBKDF2 off the loop.
+
+        :param mnemonic: The mnemonic.
+        :type mnemonic: IMnemonic
+
+        :return: The AsyncHDWallet instance.
+        :rtype: AsyncHDWallet
+        """
+
+        return await self._update("from_mnemonic", mnemonic=mnemonic)
+
+    async def from_seed(self, seed: ISeed) -> "AsyncHDWallet":
+        """
+        Initialize the wallet from a seed on the executor.
+
+        :param seed: The seed.
+        :type seed: ISeed
+
+        :return: The AsyncHDWallet instance.
+        :rtype: AsyncHDWallet
+        """
+
+        return await self._update("from_seed", seed=seed)
+
+    async def from_derivation(self, derivation: IDerivation) -> "AsyncHDWallet":
+        """
+        Drive the wallet along a derivation on the executor.
+
+        :param derivation: The derivation.
+        :type derivation: IDerivation
+
+        :return: The AsyncHDWallet instance.
+        :rtype: AsyncHDWallet
+        """
+
+        return await self._update("from_derivation", derivation=derivation)
+
+    async def update_derivation(self, derivation: IDerivation) -> "AsyncHDWallet":
+        """
+        Move the wallet to a new derivation on the executor.
+
+        :param derivation: The derivation.
+        :type derivation: IDerivation
+
+        :return: The AsyncHDWallet instance.
+        :rtype: AsyncHDWallet
+        """
+
+        return await self._update("update_derivation", derivation=derivation)
+
+    async def dump(self, exclude: Optional[set] = None, include: Optional[set] = None) -> dict:
+        """
+        Dump the wallet on the executor, as :meth:`HDWallet.dump`.
+
+        :param exclude: Optional set of keys to exclude from the dump.
+        :type exclude: Optional[set]
+        :param include: Optional set of keys to restrict the dump to.
+        :type include: Optional[set]
+
+        :return: The dump.
+        :rtype: dict
+        """
+
+        return await self._run(self._hdwallet.dump, exclude=exclude, include=include)
+
+    async def dumps(
+        self, exclude: Optional[set] = None, include: Optional[set] = None
+    ) -> Optional[Union[dict, List[dict]]]:
+        """
+        Dump every derivation on the executor, as :meth:`HDWallet.dumps`.
+
+        :param exclude: Optional set of keys to exclude from the dumps.
+        :type exclude: Optional[set]
+        :param include: Optional set of keys to restrict the dumps to.
+        :type include: Optional[set]
+
+        :return: The dumps.
+        :rtype: Optional[Union[dict, List[dict]]]
+        """
+
+        return await self._run(self._hdwallet.dumps, exclude=exclude, include=include)
+
+    async def derive_children(
+        self, parent_path: Optional[Union[str, IDerivation]] = None, start: int = 0, count: int = 1
+    ) -> List[BIP32ChildKey]:
+        """
+        Derive a batch of child keys on the executor, as :meth:`HDWallet.derive_children`.
+
+        :param parent_path: The derivation path of the parent node, the current node if None.
+        :type parent_path: Optional[Union[str, IDerivation]]
+        :param start: The first child index. Defaults to 0.
+        :type start: int
+        :param count: The number of children to derive. Defaults to 1.
+        :type count: int
+
+        :return: The derived child key records.
+        :rtype: List[BIP32ChildKey]
+        """
+
+        return await self._run(
+            self._hdwallet.derive_children, parent_path=parent_path, start=start, count=count
+        )
+
+    async def iter_derivations(
+        self, exclude: Optional[set] = None, include: Optional[set] = None, chunk_size: int = 100
+    ) -> AsyncIterator[dict]:
+        """
+        Asynchronously iterate the dumps of every derivation, as :meth:`HDWallet.iter_derivations`.
+
+        The derivation walk keeps its state in this process, so it runs one chunk at a time, only
+        when the consumer asks for it, on the executor if it is a thread executor and otherwise
+        on the loop default executor.
+
+        :param exclude: Optional set of keys to exclude from each dump.
+        :type exclude: Optional[set]
+        :param include: Optional set of keys to restrict each dump to.
+        :type include: Optional[set]
+        :param chunk_size: The number of dumps computed per executor call, defaults to 100.
+        :type chunk_size: int
+
+        :return: An async iterator of dictionaries, one per derived path.
+        :rtype: AsyncIterator[dict]
+        """
+
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise Error("Invalid chunk size", expected="positive integer", got=chunk_size)
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        executor: Optional[Executor] = (
+            None if isinstance(self._executor, ProcessPoolExecutor) else self._executor
+        )
+        iterator: Iterator[dict] = self._hdwallet.iter_derivations(exclude=exclude, include=include)
+        while True:
+            chunk: List[dict] = await loop.run_in_executor(
+                executor, functools.partial(_next_chunk, iterator, chunk_size)
+            )
+            if not chunk:
+                return
+            for item in chunk:
+                yield item
+
+    async def iter_addresses(
+        self,
+        index: Union[str, int, Tuple[int, int], Tuple[int, int, bool]],
+        parent_path: Optional[Union[str, IDerivation]] = None,
+        address: Optional[Union[str, Type[IAddress]]] = None,
+        hardened: bool = False,
+        chunk_size: int = 1000,
+        prefetch: int = 2
+    ) -> AsyncIterator[DerivedAddress]:
+        """
+        Asynchronously derive the addresses of a child index range, streamed in index order.
+
+        Chunks are derived with :meth:`ParallelDeriver.derive_chunk` on the executor, with at
+        most ``prefetch`` chunks in flight, so process executors derive chunks in parallel.
+
+        :param index: The index or inclusive index range, in any form accepted by ``normalize_index``.
+        :type index: Union[str, int, Tuple[int, int], Tuple[int, int, bool]]
+        :param parent_path: The derivation path of the parent node, the current node if None.
+        :type parent_path: Optional[Union[str, IDerivation]]
+        :param address: The address name or class, defaults to the wallet address.
+        :type address: Optional[Union[str, Type[IAddress]]]
+        :param hardened: Whether the indexes are hardened.
+        :type hardened: bool
+        :param chunk_size: The number of children derived per executor call, defaults to 1000.
+        :type chunk_size: int
+        :param prefetch: The maximum number of chunks in flight, defaults to 2.
+        :type prefetch: int
+
+        :return: An async iterator of derived addresses, invalid child indexes are skipped.
+        :rtype: AsyncIterator[DerivedAddress]
+        """
+
+        deriver: ParallelDeriver = ParallelDeriver(
+            hdwallet=self._hdwallet, parent_path=parent_path, address=address, workers=1, chunk_size=chunk_size
+        )
+        tasks: Iterator[Callable[[], List[DerivedAddress]]] = (
+            functools.partial(deriver.derive_chunk, start, stop, _hardened)
+            for start, stop, _hardened in deriver.chunks(index=index, hardened=hardened)
+        )
+        async for item in self._stream(tasks, prefetch=prefetch, executor=self._executor):
+            yield item
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from abc import (
+    ABC, abstractmethod
+)
+from collections import OrderedDict
+from typing import (
+    Any, FrozenSet, Hashable, Optional, Union
+)
+
+import threading
+import time
+
+from .exceptions import Error
+
+
+RESULT_FIELDS: FrozenSet[str] = frozenset({
+    "address", "public_key", "uncompressed", "compressed", "xpublic_key", "chain_code", "hash",
+    "fingerprint", "parent_fingerprint", "depth", "index", "path", "primary_address",
+    "integrated_address", "sub_address", "spend_public_key", "view_public_key"
+})
+PRIVATE_FIELDS: FrozenSet[str] = frozenset({
+    "private_key", "wif", "xprivate_key", "spend_private_key", "view_private_key"
+})
+
+
+class ICache(ABC):
+    """
+    Interface of the cache backends, e.g. the result cache of :class:`hdwallet.hdwallet.HDWallet`.
+
+    Backends map hashable keys to values and may drop entries at any time. Implement it to
+    keep results in an external store, keys then have to be serialized by the backend.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """
+        Get the cached value for a key.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param default: The value to return on a miss, defaults to None.
+        :type default: Optional[Any]
+
+        :return: The cached value, or ``default`` if the key is not cached.
+        :rtype: Optional[Any]
+        """
+
+    @abstractmethod
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value for a key.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param value: The value to cache.
+        :type value: Any
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all entries.
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+
+class LRUCache(ICache):
+    """
+    A bounded least-recently-used (LRU) cache with hit and miss counters.
+
+    Entries are evicted in least-recently-used order once ``max_size`` is reached,
+    a ``max_size`` of ``0`` disables the cache entirely. With a ``ttl``, entries also
+    expire that many seconds after they were stored. Lookups and updates are guarded
+    by a lock, so one cache can be shared between threads.
+    """
+
+    _max_size: int
+    _ttl: Optional[float]
+    _hits: int
+    _misses: int
+    _entries: "OrderedDict[Hashable, Any]"
+    _lock: threading.Lock
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[Union[int, float]] = None) -> None:
+        """
+        Initialize a new LRU cache.
+
+        :param max_size: The maximum number of entries to keep, defaults to 1024.
+        :type max_size: int
+        :param ttl: The number of seconds entries are kept, defaults to None (no expiry).
+        :type ttl: Optional[Union[int, float]]
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        if not isinstance(max_size, int) or max_size < 0:
+            raise Error(
+                "Invalid cache max size", expected="non-negative integer", got=max_size
+            )
+        if ttl is not None and (isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0):
+            raise Error(
+                "Invalid cache TTL", expected="positive number of seconds", got=ttl
+            )
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._hits = 0
+        self._misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """
+        Get the cached value for a key and mark it as most recently used.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param default: The value to return on a miss, defaults to None.
+        :type default: Optional[Any]
+
+        :return: The cached value, or ``default`` if the key is not cached.
+        :rtype: Optional[Any]
+        """
+
+        with self._lock:
+            try:
+                value: Any = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            if self._ttl is not None:
+                value, expires = value
+                if expires <= time.monotonic():
+                    del self._entries[key]
+                    self._misses += 1
+                    return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value for a key, evicting the least recently used entries if needed.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param value: The value to cache.
+        :type value: Any
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        if self._max_size == 0:
+            return None
+        if self._ttl is not None:
+            value = (value, time.monotonic() + self._ttl)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the hit and miss counters.
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def max_size(self) -> int:
+        """
+        Get the maximum number of entries.
+
+        :return: The maximum number of entries.
+        :rtype: int
+        """
+
+        return self._max_size
+
+    def ttl(self) -> Optional[float]:
+        """
+        Get the number of seconds entries are kept.
+
+        :return: The time to live, or None if entries do not expire.
+        :rtype: Optional[float]
+        """
+
+        return self._ttl
+
+    def hits(self) -> int:
+        """
+        Get the number of lookups served from the cache.
+
+        :return: The number of cache hits.
+        :rtype: int
+        """
+
+        return self._hits
+
+    def misses(self) -> int:
+        """
+        Get the number of lookups not found in the cache.
+
+        :return: The number of cache misses.
+        :rtype: int
+        """
+
+        return self._misses
+
+    def info(self) -> dict:
+        """
+        Get the cache statistics.
+
+        :return: A dictionary with ``hits``, ``misses``, ``size`` and ``max_size``.
+        :rtype: dict
+        """
+
+        return dict(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._entries),
+            max_size=self._max_size
+        )
+
+    def __getstate__(self) -> dict:
+        """
+        Get the pickling state, only the maximum size and TTL are kept so copies start empty.
+
+        :return: The pickling state.
+        :rtype: dict
+        """
+
+        return dict(max_size=self._max_size, ttl=self._ttl)
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(max_size=state["max_size"], ttl=state.get("ttl"))
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            if key not in self._entries:
+                return False
+            if self._ttl is not None and self._entries[key][1] <= time.monotonic():
+                del self._entries[key]
+                return False
+            return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
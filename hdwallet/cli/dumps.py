@@ -4,9 +4,7 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import (
-    Type, List, Tuple
-)
+from typing import Type
 from bip38 import BIP38
 
 import json
@@ -20,9 +18,7 @@ from ..seeds import SEEDS
 from ..hds import (
     BIP32HD, BIP44HD, BIP49HD, BIP84HD, BIP86HD, BIP141HD, CardanoHD, ElectrumV1HD, ElectrumV2HD, MoneroHD, HDS
 )
-from ..derivations import (
-    IDerivation, DERIVATIONS
-)
+from ..derivations import DERIVATIONS
 from ..cryptocurrencies import (
     ICryptocurrency, get_cryptocurrency
 )
@@ -270,100 +266,18 @@ def dumps(**kwargs) -> None:
         if kwargs.get("include_header"):
             hdwallet_csv.writeheader()
 
-        def drive(*args) -> List[str]:
-            def drive_helper(derivations, current_derivation: List[Tuple[int, bool]] = []) -> List[str]:
-                if not derivations:
-
-                    derivation_name: str = hdwallet._derivation.name()
-                    if derivation_name in [
-                        "BIP44", "BIP49", "BIP84", "BIP86"
-                    ]:
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=kwargs.get("derivation")
-                        ).__call__(
-                            coin_type=current_derivation[1][0],
-                            account=current_derivation[2][0],
-                            change=current_derivation[3][0],
-                            address=current_derivation[4][0]
-                        )
-                    elif derivation_name == "CIP1852":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=kwargs.get("derivation")
-                        ).__call__(
-                            coin_type=current_derivation[1][0],
-                            account=current_derivation[2][0],
-                            role=current_derivation[3][0],
-                            address=current_derivation[4][0]
-                        )
-                    elif derivation_name == 'Electrum':
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=kwargs.get("derivation")
-                        ).__call__(
-                            change=current_derivation[0][0],
-                            address=current_derivation[1][0]
-                        )
-                    elif derivation_name == "Monero":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=kwargs.get("derivation")
-                        ).__call__(
-                            minor=current_derivation[0][0],
-                            major=current_derivation[1][0]
-                        )
-                    elif derivation_name == "HDW":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=kwargs.get("derivation")
-                        ).__call__(
-                            account=current_derivation[0][0],
-                            ecc=current_derivation[1][0],
-                            address=current_derivation[2][0]
-                        )
-                    else:
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=kwargs.get("derivation")
-                        ).__call__(
-                            path="m/" + "/".join(
-                                [str(item[0]) + "'" if item[1] else str(item[0]) for item in current_derivation]
-                            )
-                        )
-
-                    hdwallet.update_derivation(
-                        derivation=_derivation
-                    )
-                    if kwargs.get("format") == "csv":
-                        new_dump: dict = { }
-                        dump: dict = hdwallet.dump(exclude={"root"})
-                        for key in [keys.split(":") for keys in _include.split(",")]:
-                            if len(key) == 2:
-                                new_dump.setdefault(f"{key[0]}:{key[1]}", dump[key[0]][key[1]])
-                            else:
-                                new_dump.setdefault(f"{key[0]}", dump[key[0]])
-                        hdwallet_csv.writerow(new_dump)
-
-                    elif kwargs.get("format") == "json":
-                        excludes = kwargs.get("exclude").split(",")
-                        dump: dict = hdwallet.dump(exclude={"root", *excludes})
-                        click.echo(json.dumps(dump, indent=4, ensure_ascii=False))
-
-                    return [_derivation.path()]
-
-                path: List[str] = []
-                if len(derivations[0]) == 3:
-                    for value in range(derivations[0][0], derivations[0][1] + 1):
-                        path += drive_helper(
-                            derivations[1:], current_derivation + [(value, derivations[0][2])]
-                        )
-                else:
-                    path += drive_helper(
-                        derivations[1:], current_derivation + [derivations[0]]
-                    )
-                return path
-            return drive_helper(args)
-
         if kwargs.get("format") == "csv":
             if hdwallet._derivation is None:
                 return None
 
-            drive(*hdwallet._derivation.derivations())
+            for dump in hdwallet.iter_derivations(include=set(_include.split(","))):
+                new_dump: dict = { }
+                for key in [keys.split(":") for keys in _include.split(",")]:
+                    if len(key) == 2:
+                        new_dump.setdefault(f"{key[0]}:{key[1]}", dump[key[0]][key[1]])
+                    else:
+                        new_dump.setdefault(f"{key[0]}", dump[key[0]])
+                hdwallet_csv.writerow(new_dump)
 
         elif kwargs.get("format") == "json":
             if hdwallet._derivation is None:
@@ -375,8 +289,8 @@ def dumps(**kwargs) -> None:
                     hdwallet.dump(exclude={'derivation', *excludes}), indent=4, ensure_ascii=False
                 ))
 
-
-            drive(*hdwallet._derivation.derivations())
+            for dump in hdwallet.iter_derivations(exclude=set(excludes)):
+                click.echo(json.dumps(dump, indent=4, ensure_ascii=False))
         else:
             click.echo(click.style(
                 f"Wrong format, (expected= json | csv, got='{kwargs.get('format')}')"
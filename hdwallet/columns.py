@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from array import array
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+)
+
+from .exceptions import Error
+
+
+class DerivationRow:
+    """
+    A lazy view of one row of a :class:`DerivationColumns`, values are decoded on access.
+    """
+
+    __slots__ = ("_columns", "_position")
+
+    def __init__(self, columns: "DerivationColumns", position: int) -> None:
+        """
+        Initialize a row view.
+
+        :param columns: The columns holding the row.
+        :type columns: DerivationColumns
+        :param position: The row position.
+        :type position: int
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        self._columns = columns
+        self._position = position
+
+    def __getitem__(self, field: str) -> Union[int, bytes, str]:
+        return self._columns.value(position=self._position, field=field)
+
+    def __getattr__(self, field: str) -> Union[int, bytes, str]:
+        try:
+            return self._columns.value(position=self._position, field=field)
+        except Error as error:
+            raise AttributeError(field) from error
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, DerivationRow) and self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        return f"DerivationRow({self.as_dict()!r})"
+
+    def as_dict(self) -> Dict[str, Union[int, bytes, str]]:
+        """
+        Decode the whole row.
+
+        :return: The row values by field name.
+        :rtype: Dict[str, Union[int, bytes, str]]
+        """
+
+        return {
+            field: self._columns.value(position=self._position, field=field) for field in self._columns.fields()
+        }
+
+
+class DerivationColumns:
+    """
+    Columnar (struct-of-arrays) result set for large derivation sweeps.
+
+    Every field is kept as one contiguous column instead of one dictionary per row:
+    integers in an ``array('I')``, bytes in a fixed-width buffer, and strings in a
+    single UTF-8 buffer with an offsets array. Fields listed in ``hex_fields`` are
+    hexadecimal strings stored as raw bytes and decoded back to hexadecimal on access.
+    The column kinds are taken from the first appended row.
+
+    Rows are appended from dictionaries, where ``parent:key`` fields select nested
+    values as in the CLI, or from any object exposing the fields as attributes, such
+    as :class:`hdwallet.parallel.DerivedAddress` or :class:`hdwallet.hds.bip32.BIP32ChildKey`.
+
+    .. code-block:: python
+
+        >>> from hdwallet.columns import DerivationColumns
+        >>> columns = DerivationColumns(fields=["index", "public_key", "address"])
+        >>> columns.extend(deriver.derive(index=(0, 999_999)))
+        >>> columns[42].address
+        >>> columns.to_numpy()["index"]
+    """
+
+    _fields: List[str]
+    _hex_fields: List[str]
+    _kinds: Dict[str, str]
+    _integers: Dict[str, array]
+    _buffers: Dict[str, bytearray]
+    _widths: Dict[str, int]
+    _offsets: Dict[str, array]
+    _length: int
+
+    def __init__(self, fields: Sequence[str], hex_fields: Optional[Iterable[str]] = None) -> None:
+        """
+        Initialize an empty DerivationColumns instance.
+
+        :param fields: The field names, one column each.
+        :type fields: Sequence[str]
+        :param hex_fields: The fields holding hexadecimal strings to store as raw bytes.
+        :type hex_fields: Optional[Iterable[str]]
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        if not fields or len(set(fields)) != len(fields):
+            raise Error("Invalid columns fields", expected="non-empty unique field names", got=fields)
+
+        self._fields = list(fields)
+        self._hex_fields = [field for field in (hex_fields or []) if field in self._fields]
+        self._kinds = { }
+        self._integers = { }
+        self._buffers = { }
+        self._widths = { }
+        self._offsets = { }
+        self._length = 0
+
+    def fields(self) -> List[str]:
+        """
+        Get the field names.
+
+        :return: The field names, in column order.
+        :rtype: List[str]
+        """
+
+        return list(self._fields)
+
+    def kind(self, field: str) -> Optional[str]:
+        """
+        Get the storage kind of a column.
+
+        :param field: The field name.
+        :type field: str
+
+        :return: ``int``, ``bytes``, ``hex`` or ``str``, or None before the first row.
+        :rtype: Optional[str]
+        """
+
+        if field not in self._fields:
+            raise Error("Unknown column field", expected=self._fields, got=field)
+        return self._kinds.get(field)
+
+    @staticmethod
+    def _get(row: Any, field: str) -> Any:
+        if isinstance(row, Mapping):
+            value: Any = row
+            for key in field.split(":"):
+                value = value[key]
+            return value
+        return getattr(row, field)
+
+    def _setup(self, field: str, value: Any) -> None:
+        if isinstance(value, int) and not isinstance(value, bool):
+            self._kinds[field] = "int"
+            self._integers[field] = array("I")
+        elif isinstance(value, (bytes, bytearray)) or (isinstance(value, str) and field in self._hex_fields):
+            self._kinds[field] = "bytes" if isinstance(value, (bytes, bytearray)) else "hex"
+            self._buffers[field] = bytearray()
+            self._widths[field] = len(value) if self._kinds[field] == "bytes" else len(value) // 2
+        elif isinstance(value, str):
+            self._kinds[field] = "str"
+            self._buffers[field] = bytearray()
+            self._offsets[field] = array("Q", [0])
+        else:
+            raise Error(f"Invalid {field} column value", expected="int, bytes or str", got=type(value))
+
+    def append(self, row: Any) -> "DerivationColumns":
+        """
+        Append one row.
+
+        :param row: A dictionary or an object exposing the fields as attributes.
+        :type row: Any
+
+        :return: The DerivationColumns instance.
+        :rtype: DerivationColumns
+        """
+
+        values: List[Any] = [self._get(row, field) for field in self._fields]
+        if not self._kinds:
+            try:
+                for field, value in zip(self._fields, values):
+                    self._setup(field, value)
+            except Error:
+                for columns in (self._kinds, self._integers, self._buffers, self._widths, self._offsets):
+                    columns.clear()
+                raise
+
+        encoded: List[Any] = []
+        for field, value in zip(self._fields, values):
+            kind: str = self._kinds[field]
+            if kind == "int":
+                if not isinstance(value, int) or not 0 <= value <= 0xFFFFFFFF:
+                    raise Error(f"Invalid {field} column value", expected="32-bit unsigned integer", got=value)
+            elif kind == "bytes" or kind == "hex":
+                if kind == "hex" and isinstance(value, str):
+                    try:
+                        value = bytes.fromhex(value)
+                    except ValueError as error:
+                        raise Error(f"Invalid {field} column value", expected="hexadecimal string", got=value) from error
+                if not isinstance(value, (bytes, bytearray)) or len(value) != self._widths[field]:
+                    raise Error(
+                        f"Invalid {field} column value", expected=f"{self._widths[field]} bytes", got=value
+                    )
+            elif not isinstance(value, str):
+                raise Error(f"Invalid {field} column value", expected="str", got=type(value))
+            encoded.append(value)
+
+        for field, value in zip(self._fields, encoded):
+            kind: str = self._kinds[field]
+            if kind == "int":
+                self._integers[field].append(value)
+            elif kind == "str":
+                self._buffers[field] += value.encode("utf-8")
+                self._offsets[field].append(len(self._buffers[field]))
+            else:
+                self._buffers[field] += value
+        self._length += 1
+        return self
+
+    def extend(self, rows: Iterable[Any]) -> "DerivationColumns":
+        """
+        Append every row of an iterable, consuming it lazily.
+
+        :param rows: The rows, dictionaries or objects exposing the fields as attributes.
+        :type rows: Iterable[Any]
+
+        :return: The DerivationColumns instance.
+        :rtype: DerivationColumns
+        """
+
+        for row in rows:
+            self.append(row)
+        return self
+
+    def value(self, position: int, field: str) -> Union[int, bytes, str]:
+        """
+        Decode a single value.
+
+        :param position: The row position, negative positions count from the end.
+        :type position: int
+        :param field: The field name.
+        :type field: str
+
+        :return: The value.
+        :rtype: Union[int, bytes, str]
+        """
+
+        if field not in self._fields:
+            raise Error("Unknown column field", expected=self._fields, got=field)
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError("DerivationColumns index out of range")
+
+        kind: str = self._kinds[field]
+        if kind == "int":
+            return self._integers[field][position]
+        elif kind == "str":
+            offsets: array = self._offsets[field]
+            return self._buffers[field][offsets[position]:offsets[position + 1]].decode("utf-8")
+        width: int = self._widths[field]
+        value: bytes = bytes(self._buffers[field][position * width:(position + 1) * width])
+        return value.hex() if kind == "hex" else value
+
+    def column(self, field: str) -> Union[array, bytes, List[str]]:
+        """
+        Get a whole column.
+
+        :param field: The field name.
+        :type field: str
+
+        :return: A copy of the ``array('I')`` for integers, the concatenated fixed-width
+                 buffer for bytes and hexadecimal fields, or the list of strings.
+        :rtype: Union[array, bytes, List[str]]
+        """
+
+        kind: Optional[str] = self.kind(field)
+        if kind is None:
+            return []
+        elif kind == "int":
+            return array("I", self._integers[field])
+        elif kind == "str":
+            return [self.value(position, field) for position in range(self._length)]
+        return bytes(self._buffers[field])
+
+    def nbytes(self) -> int:
+        """
+        Get the memory held by the column buffers.
+
+        :return: The number of bytes of every column buffer and offsets array.
+        :rtype: int
+        """
+
+        return (
+            sum(len(column) * column.itemsize for column in self._integers.values()) +
+            sum(len(buffer) for buffer in self._buffers.values()) +
+            sum(len(offsets) * offsets.itemsize for offsets in self._offsets.values())
+        )
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Export every column as a NumPy array, NumPy must be installed.
+
+        Integer columns become ``uint32`` arrays, bytes and hexadecimal columns
+        ``(rows, width)`` ``uint8`` arrays of the raw bytes, and strings ``str`` arrays.
+
+        :return: The NumPy arrays by field name.
+        :rtype: Dict[str, numpy.ndarray]
+        """
+
+        try:
+            import numpy
+        except ImportError as error:
+            raise Error(
+                "NumPy is required for columnar export", detail="(install it with: pip install hdwallet[numpy])"
+            ) from error
+
+        arrays: Dict[str, Any] = { }
+        for field in self._fields:
+            kind: Optional[str] = self._kinds.get(field)
+            if kind is None:
+                arrays[field] = numpy.empty(0)
+            elif kind == "int":
+                arrays[field] = numpy.frombuffer(self._integers[field].tobytes(), dtype=numpy.uint32)
+            elif kind == "str":
+                arrays[field] = numpy.array(self.column(field), dtype=str)
+            else:
+                arrays[field] = numpy.frombuffer(
+                    bytes(self._buffers[field]), dtype=numpy.uint8
+                ).reshape(self._length, self._widths[field])
+        return arrays
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, position: int) -> DerivationRow:
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError("DerivationColumns index out of range")
+        return DerivationRow(columns=self, position=position)
+
+    def __iter__(self) -> Iterator[DerivationRow]:
+        for position in range(self._length):
+            yield DerivationRow(columns=self, position=position)
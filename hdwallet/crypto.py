@@ -5,10 +5,10 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Optional, Union, Tuple
+    Callable, Dict, List, Optional, Sequence, Union, Tuple
 )
-from Crypto.Hash import ( 
-    SHA512, SHA3_256, keccak
+from Crypto.Hash import (
+    RIPEMD160, SHA256, SHA512, SHA3_256, keccak
 )
 from Crypto.Cipher import ChaCha20_Poly1305
 from Crypto.Protocol.KDF import PBKDF2
@@ -17,14 +17,251 @@ import binascii
 import crcmod.predefined
 import hashlib
 import hmac
+import os
+import time
+import warnings
 
 from .libs.ripemd160 import ripemd160 as r160
 from .consts import SLIP10_SECP256K1_CONST
+from .exceptions import Error
 from .utils import (
     get_bytes, encode, integer_to_bytes
 )
 
 
+def _hashlib_backend(name: str) -> Callable[[bytes], bytes]:
+    hashlib.new(name, b"")
+    constructor = getattr(hashlib, name, None) or (lambda data: hashlib.new(name, data))
+    return lambda data: constructor(data).digest()
+
+
+class HASHES:
+    """
+    Registry of the hash backends serving each hash primitive of this module.
+
+    At import every backend of a primitive is cross-checked against a known test vector,
+    the correct ones are timed on a few short inputs and the fastest one is selected.
+    Backends are ``hashlib`` (OpenSSL), ``pycryptodome``, ``binascii`` and the pure-Python
+    or ``crcmod`` fallbacks. A backend can be forced with the ``HDWALLET_HASH_BACKENDS``
+    environment variable, e.g. ``ripemd160=python,keccak256=pycryptodome``, or with :meth:`use`.
+    Unknown primitives or backends in the environment variable only warn and keep the
+    automatic selection, while explicit :meth:`use` and :meth:`setup` overrides raise.
+
+    +--------------+--------------------------------------------+
+    | Primitive    | Backends                                   |
+    +==============+============================================+
+    | ripemd160    | hashlib, pycryptodome, python              |
+    +--------------+--------------------------------------------+
+    | sha256       | hashlib, pycryptodome                      |
+    +--------------+--------------------------------------------+
+    | sha512       | hashlib, pycryptodome                      |
+    +--------------+--------------------------------------------+
+    | sha512_256   | hashlib, pycryptodome                      |
+    +--------------+--------------------------------------------+
+    | sha3_256     | hashlib, pycryptodome                      |
+    +--------------+--------------------------------------------+
+    | keccak256    | pycryptodome                               |
+    +--------------+--------------------------------------------+
+    | xmodem_crc   | binascii, crcmod                           |
+    +--------------+--------------------------------------------+
+    """
+
+    vectors: Dict[str, Tuple[bytes, str]] = {
+        "ripemd160": (b"abc", "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"),
+        "sha256": (b"abc", "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"),
+        "sha512": (
+            b"abc", "ddaf35a193617abacc417349ae20413112e6fa4e89a97ea20a9eeee64b55d39a"
+                    "2192992a274fc1a836ba3c23a3feebbd454d4423643ce80e2a9ac94fa54ca49f"
+        ),
+        "sha512_256": (b"abc", "53048e2681941ef99b2e29b76b4c7dabe4c2d0c634fc6d46e0e2f13107e7af23"),
+        "sha3_256": (b"abc", "3a985da74fe225b2045c172d6bd390bd855f086e3e9d525b46bfe24511431532"),
+        "keccak256": (b"abc", "4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45"),
+        "xmodem_crc": (b"123456789", "31c3")
+    }
+    factories: Dict[str, Dict[str, Callable[[], Callable[[bytes], bytes]]]] = {
+        "ripemd160": {
+            "hashlib": lambda: _hashlib_backend("ripemd160"),
+            "pycryptodome": lambda: (lambda data: RIPEMD160.new(data).digest()),
+            "python": lambda: r160
+        },
+        "sha256": {
+            "hashlib": lambda: _hashlib_backend("sha256"),
+            "pycryptodome": lambda: (lambda data: SHA256.new(data).digest())
+        },
+        "sha512": {
+            "hashlib": lambda: _hashlib_backend("sha512"),
+            "pycryptodome": lambda: (lambda data: SHA512.new(data).digest())
+        },
+        "sha512_256": {
+            "hashlib": lambda: _hashlib_backend("sha512_256"),
+            "pycryptodome": lambda: (lambda data: SHA512.new(data, truncate="256").digest())
+        },
+        "sha3_256": {
+            "hashlib": lambda: _hashlib_backend("sha3_256"),
+            "pycryptodome": lambda: (lambda data: SHA3_256.new(data).digest())
+        },
+        "keccak256": {
+            "pycryptodome": lambda: (lambda data: keccak.new(data=data, digest_bits=256).digest())
+        },
+        "xmodem_crc": {
+            "binascii": lambda: (lambda data: binascii.crc_hqx(data, 0).to_bytes(2, "big")),
+            "crcmod": lambda: (lambda data: crcmod.predefined.Crc("xmodem").new(data).digest())
+        }
+    }
+
+    digests: Dict[str, Callable[[bytes], bytes]] = { }
+    selected: Dict[str, str] = { }
+    timings: Dict[str, Dict[str, Optional[float]]] = { }
+
+    @classmethod
+    def primitives(cls) -> List[str]:
+        """
+        Get the hash primitive names.
+
+        :return: The primitive names.
+        :rtype: List[str]
+        """
+
+        return list(cls.factories.keys())
+
+    @classmethod
+    def backends(cls, primitive: str) -> List[str]:
+        """
+        Get the backends of a primitive that passed the self-test.
+
+        :param primitive: The primitive name, e.g. ``ripemd160``.
+        :type primitive: str
+
+        :return: The correct backend names, fastest first.
+        :rtype: List[str]
+        """
+
+        if primitive not in cls.factories:
+            raise Error("Invalid hash primitive", expected=cls.primitives(), got=primitive)
+        timings: Dict[str, Optional[float]] = cls.timings[primitive]
+        return sorted(
+            [backend for backend, timing in timings.items() if timing is not None], key=lambda backend: timings[backend]
+        )
+
+    @classmethod
+    def benchmark(cls, primitive: str, rounds: int = 16) -> Dict[str, Optional[float]]:
+        """
+        Cross-check every backend of a primitive against its test vector and time the correct ones.
+
+        :param primitive: The primitive name, e.g. ``ripemd160``.
+        :type primitive: str
+        :param rounds: The number of 33-byte inputs hashed per backend, defaults to 16.
+        :type rounds: int
+
+        :return: The seconds per call of each backend, None if it is unavailable or incorrect.
+        :rtype: Dict[str, Optional[float]]
+        """
+
+        if primitive not in cls.factories:
+            raise Error("Invalid hash primitive", expected=cls.primitives(), got=primitive)
+        data, expected = cls.vectors[primitive]
+        timings: Dict[str, Optional[float]] = { }
+        for backend, factory in cls.factories[primitive].items():
+            try:
+                digest: Callable[[bytes], bytes] = factory()
+                if digest(data).hex() != expected:
+                    timings[backend] = None
+                    continue
+            except (ValueError, TypeError, AttributeError, ImportError):
+                timings[backend] = None
+                continue
+            inputs: List[bytes] = [bytes([index]) * 33 for index in range(rounds)]
+            start: float = time.perf_counter()
+            for item in inputs:
+                digest(item)
+            timings[backend] = (time.perf_counter() - start) / rounds
+        cls.timings[primitive] = timings
+        return timings
+
+    @classmethod
+    def use(cls, primitive: str, backend: Optional[str] = None) -> str:
+        """
+        Select the backend serving a primitive.
+
+        :param primitive: The primitive name, e.g. ``ripemd160``.
+        :type primitive: str
+        :param backend: The backend name, or None for the fastest correct one.
+        :type backend: Optional[str]
+
+        :return: The selected backend name.
+        :rtype: str
+        """
+
+        if primitive not in cls.timings:
+            cls.benchmark(primitive)
+        backends: List[str] = cls.backends(primitive)
+        if backend is None:
+            if not backends:
+                raise Error(f"No working {primitive} hash backend")
+            backend = backends[0]
+        elif backend not in backends:
+            raise Error(f"Invalid {primitive} hash backend", expected=backends, got=backend)
+        cls.digests[primitive] = cls.factories[primitive][backend]()
+        cls.selected[primitive] = backend
+        return backend
+
+    @classmethod
+    def report(cls) -> Dict[str, str]:
+        """
+        Get the backend serving each primitive.
+
+        :return: The backend name of each primitive.
+        :rtype: Dict[str, str]
+        """
+
+        return dict(cls.selected)
+
+    @classmethod
+    def setup(cls, overrides: Optional[str] = None) -> Dict[str, str]:
+        """
+        Self-test, benchmark and select the backends of every primitive.
+
+        :param overrides: Comma separated ``primitive=backend`` overrides, defaults to
+                          the ``HDWALLET_HASH_BACKENDS`` environment variable, whose invalid
+                          entries are warned about and replaced by the automatic selection.
+        :type overrides: Optional[str]
+
+        :return: The backend name of each primitive.
+        :rtype: Dict[str, str]
+        """
+
+        strict: bool = overrides is not None
+        if overrides is None:
+            overrides = os.environ.get("HDWALLET_HASH_BACKENDS", "")
+        forced: Dict[str, str] = { }
+        for override in filter(None, [item.strip() for item in overrides.split(",")]):
+            primitive, _, backend = override.partition("=")
+            if primitive.strip() not in cls.factories:
+                if strict:
+                    raise Error("Invalid hash primitive", expected=cls.primitives(), got=primitive.strip())
+                warnings.warn(
+                    f"Ignoring unknown HDWALLET_HASH_BACKENDS hash primitive {primitive.strip()!r}", RuntimeWarning
+                )
+                continue
+            forced[primitive.strip()] = backend.strip()
+        for primitive in cls.factories:
+            cls.benchmark(primitive)
+            try:
+                cls.use(primitive, forced.get(primitive))
+            except Error:
+                if strict or primitive not in forced:
+                    raise
+                warnings.warn(
+                    f"Ignoring invalid HDWALLET_HASH_BACKENDS {primitive} hash backend "
+                    f"{forced[primitive]!r}, using automatic selection", RuntimeWarning
+                )
+                cls.use(primitive)
+        return cls.report()
+
+
+HASHES.setup()
+
+
 def hmac_sha256(key: Union[bytes, str], data: Union[bytes, str]) -> bytes:
     """
     Generate an HMAC-SHA256 hash of the given data using the provided key.
@@ -69,6 +306,99 @@ def hmac_sha512(key: Union[bytes, str], data: Union[bytes, str]) -> bytes:
     ).digest()
 
 
+class HMACSHA512:
+    """
+    HMAC-SHA512 context with a precomputed key schedule.
+
+    The inner and outer SHA-512 states of the key are hashed once, and every
+    :meth:`copy` or :meth:`compute` clones them instead of redoing the ipad and
+    opad blocks. Build one per parent chain code and reuse it for every sibling.
+    """
+
+    __slots__ = ("_inner", "_outer")
+
+    _translate_ipad: bytes = bytes((value ^ 0x36) for value in range(256))
+    _translate_opad: bytes = bytes((value ^ 0x5C) for value in range(256))
+
+    def __init__(self, key: Union[bytes, str], data: Optional[Union[bytes, str]] = None) -> None:
+        """
+        Initialize an HMAC-SHA512 context.
+
+        :param key: The key for the HMAC algorithm, as bytes or a string.
+        :type key: Union[bytes, str]
+        :param data: Optional data to start the message with, as bytes or a string.
+        :type data: Optional[Union[bytes, str]]
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        key = encode(key)
+        if len(key) > 128:
+            key = hashlib.sha512(key).digest()
+        key = key.ljust(128, b"\x00")
+        self._inner = hashlib.sha512(key.translate(self._translate_ipad))
+        self._outer = hashlib.sha512(key.translate(self._translate_opad))
+        if data is not None:
+            self._inner.update(encode(data))
+
+    def copy(self) -> "HMACSHA512":
+        """
+        Copy the context, the copy can be updated independently.
+
+        :return: The copied context.
+        :rtype: HMACSHA512
+        """
+
+        context: HMACSHA512 = HMACSHA512.__new__(HMACSHA512)
+        context._inner = self._inner.copy()
+        context._outer = self._outer
+        return context
+
+    def update(self, data: Union[bytes, str]) -> "HMACSHA512":
+        """
+        Append data to the message.
+
+        :param data: The data to append, as bytes or a string.
+        :type data: Union[bytes, str]
+
+        :return: The context.
+        :rtype: HMACSHA512
+        """
+
+        self._inner.update(encode(data))
+        return self
+
+    def digest(self) -> bytes:
+        """
+        Get the HMAC-SHA512 of the message so far, the context is not consumed.
+
+        :return: The 64-byte HMAC-SHA512 digest.
+        :rtype: bytes
+        """
+
+        outer = self._outer.copy()
+        outer.update(self._inner.digest())
+        return outer.digest()
+
+    def compute(self, data: bytes) -> bytes:
+        """
+        Get the HMAC-SHA512 of the context message followed by the data, leaving the context unchanged.
+
+        :param data: The data, as bytes.
+        :type data: bytes
+
+        :return: The 64-byte HMAC-SHA512 digest.
+        :rtype: bytes
+        """
+
+        inner = self._inner.copy()
+        inner.update(data)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
+
 def blake2b(data: Union[bytes, str], digest_size: int, key: Union[bytes, str] = b"", salt: Union[bytes, str] = b"") -> bytes:
     """
     Generate a BLAKE2b hash of the given data with optional key and salt.
@@ -264,7 +594,7 @@ def sha256(data: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
 
-    return hashlib.sha256(get_bytes(data)).digest()
+    return HASHES.digests["sha256"](get_bytes(data))
 
 
 def double_sha256(data: Union[str, bytes]) -> bytes:
@@ -278,7 +608,8 @@ def double_sha256(data: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
 
-    return hashlib.sha256(sha256(data)).digest()
+    digest: Callable[[bytes], bytes] = HASHES.digests["sha256"]
+    return digest(digest(get_bytes(data)))
 
 
 def hash160(data: Union[str, bytes]) -> bytes:
@@ -292,7 +623,81 @@ def hash160(data: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
 
-    return ripemd160(sha256(data))
+    return HASHES.digests["ripemd160"](HASHES.digests["sha256"](get_bytes(data)))
+
+
+def _batch(data: Union[bytes, bytearray, memoryview, Sequence[bytes]], width: Optional[int]) -> Sequence[bytes]:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        if not isinstance(width, int) or width < 1 or len(data) % width:
+            raise Error(
+                "Invalid batch buffer", expected="buffer length multiple of a positive width",
+                got=f"{len(data)} bytes with width {width}"
+            )
+        buffer: bytes = bytes(data)
+        return [buffer[position:position + width] for position in range(0, len(buffer), width)]
+    if not isinstance(data, Sequence) or isinstance(data, str):
+        raise Error("Invalid batch", expected="sequence of bytes or bytes-like buffer", got=type(data))
+    for item in data:
+        if not isinstance(item, (bytes, bytearray, memoryview)):
+            raise Error("Invalid batch item", expected="bytes-like", got=type(item))
+        if width is not None and len(item) != width:
+            raise Error("Invalid batch item length", expected=width, got=len(item))
+    return data
+
+
+def hash160_many(data: Union[bytes, bytearray, memoryview, Sequence[bytes]], width: Optional[int] = None) -> bytes:
+    """
+    Calculate the HASH160 hash of every item of a batch.
+
+    The hash backends are resolved and the input validated once per batch instead of once per item.
+
+    :param data: The items, a sequence of bytes or a contiguous buffer of ``width`` bytes items.
+    :type data: Union[bytes, bytearray, memoryview, Sequence[bytes]]
+    :param width: The item width, required for buffers, e.g. ``33`` for compressed public keys.
+    :type width: Optional[int]
+
+    :return: The 20-byte digests of the items, concatenated in order.
+    :rtype: bytes
+    """
+
+    _ripemd160: Callable[[bytes], bytes] = HASHES.digests["ripemd160"]
+    _sha256: Callable[[bytes], bytes] = HASHES.digests["sha256"]
+    return b"".join([_ripemd160(_sha256(item)) for item in _batch(data, width)])
+
+
+def sha256d_many(data: Union[bytes, bytearray, memoryview, Sequence[bytes]], width: Optional[int] = None) -> bytes:
+    """
+    Calculate the double SHA-256 hash of every item of a batch.
+
+    :param data: The items, a sequence of bytes or a contiguous buffer of ``width`` bytes items.
+    :type data: Union[bytes, bytearray, memoryview, Sequence[bytes]]
+    :param width: The item width, required for buffers.
+    :type width: Optional[int]
+
+    :return: The 32-byte digests of the items, concatenated in order.
+    :rtype: bytes
+    """
+
+    _sha256: Callable[[bytes], bytes] = HASHES.digests["sha256"]
+    return b"".join([_sha256(_sha256(item)) for item in _batch(data, width)])
+
+
+def keccak256_many(data: Union[bytes, bytearray, memoryview, Sequence[bytes]], width: Optional[int] = None) -> bytes:
+    """
+    Calculate the Keccak-256 hash of every item of a batch.
+
+    :param data: The items, a sequence of bytes or a contiguous buffer of ``width`` bytes items,
+                 e.g. ``64`` for uncompressed public keys without their prefix.
+    :type data: Union[bytes, bytearray, memoryview, Sequence[bytes]]
+    :param width: The item width, required for buffers.
+    :type width: Optional[int]
+
+    :return: The 32-byte digests of the items, concatenated in order.
+    :rtype: bytes
+    """
+
+    _keccak256: Callable[[bytes], bytes] = HASHES.digests["keccak256"]
+    return b"".join([_keccak256(item) for item in _batch(data, width)])
 
 
 def crc32(data: Union[bytes, str]) -> bytes:
@@ -322,8 +727,7 @@ def xmodem_crc(data: Union[bytes, str]) -> bytes:
     :rtype: bytes
     """
 
-    xmodem = crcmod.predefined.Crc("xmodem")
-    return xmodem.new(encode(data)).digest()
+    return HASHES.digests["xmodem_crc"](encode(data))
 
 
 def pbkdf2_hmac_sha512(
@@ -364,7 +768,7 @@ def kekkak256(data: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
 
-    return keccak.new(data=encode(data), digest_bits=256).digest()
+    return HASHES.digests["keccak256"](encode(data))
 
 
 def ripemd160(data: Union[str, bytes]) -> bytes:
@@ -378,9 +782,7 @@ def ripemd160(data: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
 
-    if "ripemd160" in hashlib.algorithms_available:
-        hashlib.new("ripemd160", get_bytes(data)).digest()
-    return r160(get_bytes(data))
+    return HASHES.digests["ripemd160"](get_bytes(data))
 
 
 def get_checksum(data: Union[str, bytes]) -> bytes:
@@ -411,7 +813,7 @@ def sha512(data: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
 
-    return hashlib.sha512(encode(data)).digest()
+    return HASHES.digests["sha512"](encode(data))
 
 
 def sha512_256(data: Union[str, bytes]) -> bytes:
@@ -425,9 +827,7 @@ def sha512_256(data: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
 
-    if "sha512_256" in hashlib.algorithms_available:
-        return hashlib.new("sha512_256", encode(data)).digest()
-    return SHA512.new(encode(data), truncate="256").digest()
+    return HASHES.digests["sha512_256"](encode(data))
 
 
 def sha3_256(data: Union[str, bytes]) -> bytes:
@@ -441,6 +841,4 @@ def sha3_256(data: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
 
-    if "sha3_256" in hashlib.algorithms_available:
-        return hashlib.new("sha3_256", encode(data)).digest()
-    return SHA3_256.new(encode(data)).digest()
+    return HASHES.digests["sha3_256"](encode(data))
@@ -5,7 +5,7 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    List, Dict, Type
+    List, Dict, Tuple, Type, Union
 )
 
 from ..exceptions import DerivationError
@@ -23,6 +23,7 @@ from .electrum import ElectrumDerivation
 from .monero import MoneroDerivation
 from .hdw import HDWDerivation
 from .iderivation import IDerivation
+from .plan import DerivationPlan
 
 
 class DERIVATIONS:
@@ -110,6 +111,57 @@ class DERIVATIONS:
 
         return cls.dictionary[name]
 
+    @classmethod
+    def from_derivations(
+        cls, name: str, derivations: List[Union[Tuple[int, bool], Tuple[int, int, bool]]]
+    ) -> IDerivation:
+        """
+        Create a derivation from its name and its ``derivations()`` components.
+
+        Components are ``(index, hardened)`` tuples, or ``(from, to, hardened)`` tuples for ranges.
+        Unknown names are created as :class:`hdwallet.derivations.custom.CustomDerivation`.
+
+        :param name: The name of the derivation class.
+        :type name: str
+        :param derivations: The derivation components.
+        :type derivations: List[Union[Tuple[int, bool], Tuple[int, int, bool]]]
+
+        :return: The derivation instance.
+        :rtype: IDerivation
+        """
+
+        values: list = [
+            item[0] if len(item) == 2 else (item[0], item[1]) for item in derivations
+        ]
+        if name in [
+            "BIP44", "BIP49", "BIP84", "BIP86"
+        ]:
+            return cls.derivation(name=name).__call__(
+                coin_type=values[1], account=values[2], change=values[3], address=values[4]
+            )
+        elif name == "CIP1852":
+            return cls.derivation(name=name).__call__(
+                coin_type=values[1], account=values[2], role=values[3], address=values[4]
+            )
+        elif name == "Electrum":
+            return cls.derivation(name=name).__call__(
+                change=values[0], address=values[1]
+            )
+        elif name == "Monero":
+            return cls.derivation(name=name).__call__(
+                minor=values[0], major=values[1]
+            )
+        elif name == "HDW":
+            return cls.derivation(name=name).__call__(
+                account=values[0], ecc=values[1], address=values[2]
+            )
+        return CustomDerivation(
+            path="m/" + "/".join([
+                (f"{item[0]}" if len(item) == 2 else f"{item[0]}-{item[1]}") + ("'" if item[-1] else "")
+                for item in derivations
+            ])
+        )
+
     @classmethod
     def is_derivation(cls, name: str) -> bool:
         """
@@ -126,7 +178,7 @@ class DERIVATIONS:
 
 
 __all__: List[str] = [
-    "IDerivation", "CHANGES", "ROLES", "DERIVATIONS"
+    "IDerivation", "CHANGES", "ROLES", "DERIVATIONS", "DerivationPlan"
 ] + [
     cls.__name__ for cls in DERIVATIONS.classes()
 ]
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Iterator, List, Tuple
+)
+
+from .iderivation import IDerivation
+
+
+class DerivationPlan:
+    """
+    Compiled expansion plan of a derivation and its index ranges.
+
+    The ``derivations()`` components are compiled once into one ``range`` of integer
+    indexes per level, with the hardened bit set, and its hardened flag. The leading
+    levels holding a single value form the prefix shared by every leaf, and the leaves
+    are produced lazily depth-first, the last level varying fastest, as
+    :meth:`hdwallet.hdwallet.HDWallet.iter_derivations` and the ``dumps`` command dump them.
+    Memory stays constant regardless of the range sizes.
+    """
+
+    _name: str
+    _levels: Tuple[range, ...]
+    _hardened: Tuple[bool, ...]
+    _prefix: Tuple[int, ...]
+    _count: int
+
+    def __init__(self, derivation: IDerivation) -> None:
+        """
+        Compile the plan of a derivation.
+
+        :param derivation: The derivation, with or without index ranges.
+        :type derivation: IDerivation
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        levels: List[range] = []
+        hardened: List[bool] = []
+        for component in derivation.derivations():
+            offset: int = 0x80000000 if component[-1] else 0
+            levels.append(range(
+                component[0] + offset, (component[1] if len(component) == 3 else component[0]) + offset + 1
+            ))
+            hardened.append(component[-1])
+
+        self._name = derivation.name()
+        self._levels = tuple(levels)
+        self._hardened = tuple(hardened)
+
+        prefix: List[int] = []
+        for level in self._levels:
+            if len(level) != 1:
+                break
+            prefix.append(level[0])
+        self._prefix = tuple(prefix)
+
+        self._count = 1
+        for level in self._levels:
+            self._count *= len(level)
+
+    def name(self) -> str:
+        """
+        Get the name of the compiled derivation.
+
+        :return: The derivation name.
+        :rtype: str
+        """
+
+        return self._name
+
+    def levels(self) -> List[range]:
+        """
+        Get the integer indexes of every level, with the hardened bit set.
+
+        :return: The index range of each level, in path order.
+        :rtype: List[range]
+        """
+
+        return list(self._levels)
+
+    def prefix(self) -> Tuple[int, ...]:
+        """
+        Get the integer indexes shared by every leaf.
+
+        :return: The indexes of the leading single value levels.
+        :rtype: Tuple[int, ...]
+        """
+
+        return self._prefix
+
+    def count(self) -> int:
+        """
+        Get the number of leaves.
+
+        :return: The number of derivation paths of the plan.
+        :rtype: int
+        """
+
+        return self._count
+
+    def indexes(self) -> Iterator[Tuple[int, ...]]:
+        """
+        Iterate the integer index vector of every leaf.
+
+        :return: An iterator of index vectors, in plan order.
+        :rtype: Iterator[Tuple[int, ...]]
+        """
+
+        if self._count == 0:
+            return
+        positions: List[int] = [0] * len(self._levels)
+        indexes: List[int] = [level[0] for level in self._levels]
+        while True:
+            yield tuple(indexes)
+            depth: int = len(self._levels) - 1
+            while depth >= 0:
+                positions[depth] += 1
+                if positions[depth] < len(self._levels[depth]):
+                    indexes[depth] = self._levels[depth][positions[depth]]
+                    break
+                positions[depth] = 0
+                indexes[depth] = self._levels[depth][0]
+                depth -= 1
+            else:
+                return
+
+    def derivation(self, components: Tuple[Tuple[int, bool], ...]) -> IDerivation:
+        """
+        Create the derivation of one leaf.
+
+        :param components: The ``(index, hardened)`` values of the leaf, as yielded by the plan.
+        :type components: Tuple[Tuple[int, bool], ...]
+
+        :return: The derivation instance, of the same class as the compiled one.
+        :rtype: IDerivation
+        """
+
+        from . import DERIVATIONS
+
+        return DERIVATIONS.from_derivations(name=self._name, derivations=list(components))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Tuple[Tuple[Tuple[int, bool], ...], Tuple[int, ...]]]:
+        for indexes in self.indexes():
+            yield tuple(
+                (index & 0x7FFFFFFF, hardened) for index, hardened in zip(indexes, self._hardened)
+            ), indexes
@@ -5,7 +5,9 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import Any
-from ecdsa.ecdsa import curve_256
+from ecdsa.ecdsa import (
+    curve_256, generator_256
+)
 from ecdsa.ellipticcurve import (
     Point, PointJacobi
 )
@@ -13,6 +15,7 @@ from ecdsa import keys
 
 from ....consts import SLIP10_SECP256K1_CONST
 from ...iecc import IPoint
+from ..precomputed import FixedBaseTable
 from ....utils import (
     bytes_to_integer, integer_to_bytes
 )
@@ -20,6 +23,8 @@ from ....utils import (
 
 class SLIP10Nist256p1Point(IPoint):
 
+    GENERATOR_TABLE: FixedBaseTable = FixedBaseTable(generator_256)
+
     point: PointJacobi
 
     def __init__(self, point: PointJacobi) -> None:
@@ -197,6 +202,8 @@ class SLIP10Nist256p1Point(IPoint):
         :rtype: IPoint
         """
 
+        if self.point is generator_256:
+            return self.__class__(self.GENERATOR_TABLE.multiply(scalar))
         return self.__class__(self.point * scalar)
 
     def __rmul__(self, scalar: int) -> IPoint:
@@ -14,6 +14,7 @@ from ....consts import SLIP10_SECP256K1_CONST
 from ...iecc import (
     IPublicKey, IPrivateKey
 )
+from .point import SLIP10Nist256p1Point
 from .public_key import SLIP10Nist256p1PublicKey
 
 
@@ -56,7 +57,7 @@ class SLIP10Nist256p1PrivateKey(IPrivateKey):
 
         try:
             return cls(
-                SigningKey.from_string(
+                SLIP10Nist256p1Point.GENERATOR_TABLE.signing_key(
                     private_key, curve=curves.NIST256p
                 )
             )
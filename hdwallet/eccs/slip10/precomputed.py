@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    List, Optional, Tuple, Union
+)
+from ecdsa.ellipticcurve import (
+    INFINITY, Point, PointJacobi
+)
+from ecdsa.curves import Curve
+from ecdsa.keys import (
+    MalformedPointError, SigningKey, VerifyingKey
+)
+from ecdsa.util import string_to_number
+from ecdsa import ecdsa
+
+import hashlib
+import threading
+
+
+class FixedBaseTable:
+    """
+    Fixed-base windowed table for multiplying a generator point by arbitrary scalars.
+
+    The scalar is split into ``window``-bit digits and the table holds every
+    ``digit * 2^(window * i) * G`` in affine coordinates, so a multiplication is at
+    most one mixed Jacobian addition per digit and a single inversion, without any
+    doubling. Building the table costs a few thousand point additions, so the first
+    ``threshold`` multiplications fall back to the generator's own multiplication and
+    the table is only built, once and shared by every thread of the process, when a
+    workload keeps multiplying the generator. Both public key derivation from private
+    keys, with :meth:`signing_key`, and generator point multiplications count toward it.
+    """
+
+    _generator: PointJacobi
+    _window: int
+    _p: int
+    _a: int
+    _order: int
+    _threshold: int
+    _count: int
+    _table: Optional[List[List[Optional[Tuple[int, int]]]]]
+    _lock: threading.Lock
+
+    def __init__(self, generator: PointJacobi, window: int = 6, threshold: int = 1024) -> None:
+        """
+        Initialize a fixed-base table for a generator point.
+
+        :param generator: The generator point, its order must be set.
+        :type generator: PointJacobi
+        :param window: The digit width in bits, defaults to 6.
+        :type window: int
+        :param threshold: The number of multiplications before the table is built, defaults to 1024.
+        :type threshold: int
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        self._generator = generator
+        self._window = window
+        self._p = generator.curve().p()
+        self._a = generator.curve().a() % self._p
+        self._order = generator.order()
+        self._threshold = threshold
+        self._count = 0
+        self._table = None
+        self._lock = threading.Lock()
+
+    def _double(self, x: int, y: int, z: int) -> Tuple[int, int, int]:
+        p: int = self._p
+        if not y or not z:
+            return 0, 1, 0
+        xx, yy, zz = (x * x) % p, (y * y) % p, (z * z) % p
+        yyyy: int = (yy * yy) % p
+        s: int = (2 * ((x + yy) ** 2 - xx - yyyy)) % p
+        m: int = (3 * xx + self._a * zz * zz) % p
+        x3: int = (m * m - 2 * s) % p
+        return x3, (m * (s - x3) - 8 * yyyy) % p, ((y + z) ** 2 - yy - zz) % p
+
+    def _add_affine(self, x1: int, y1: int, z1: int, x2: int, y2: int) -> Tuple[int, int, int]:
+        p: int = self._p
+        if not z1:
+            return x2, y2, 1
+        z1z1: int = (z1 * z1) % p
+        h: int = (x2 * z1z1 - x1) % p
+        r: int = (2 * (y2 * z1 * z1z1 - y1)) % p
+        if not h:
+            return self._double(x1, y1, z1) if not r else (0, 1, 0)
+        hh: int = (h * h) % p
+        i: int = 4 * hh
+        j: int = (h * i) % p
+        v: int = (x1 * i) % p
+        x3: int = (r * r - j - 2 * v) % p
+        return x3, (r * (v - x3) - 2 * y1 * j) % p, ((z1 + h) ** 2 - z1z1 - hh) % p
+
+    def _affine(self, x: int, y: int, z: int) -> Optional[Tuple[int, int]]:
+        if not z:
+            return None
+        p: int = self._p
+        z_inverse: int = pow(z, p - 2, p)
+        z_inverse_square: int = (z_inverse * z_inverse) % p
+        return (x * z_inverse_square) % p, (y * z_inverse_square * z_inverse) % p
+
+    def table(self) -> List[List[Optional[Tuple[int, int]]]]:
+        """
+        Get the precomputed table, building it on first use.
+
+        :return: One row per digit position, each row indexed by the digit value.
+        :rtype: List[List[Optional[Tuple[int, int]]]]
+        """
+
+        if self._table is None:
+            with self._lock:
+                if self._table is None:
+                    windows: int = -(-self._order.bit_length() // self._window)
+                    base: Tuple[int, int] = (self._generator.x(), self._generator.y())
+                    table: List[List[Optional[Tuple[int, int]]]] = []
+                    for _ in range(windows):
+                        row: List[Optional[Tuple[int, int]]] = [None, base]
+                        point: Tuple[int, int, int] = (base[0], base[1], 1)
+                        for _ in range(2, 1 << self._window):
+                            point = self._add_affine(*point, *base)
+                            row.append(self._affine(*point))
+                        table.append(row)
+                        point = (base[0], base[1], 1)
+                        for _ in range(self._window):
+                            point = self._double(*point)
+                        base = self._affine(*point)
+                    self._table = table
+        return self._table
+
+    def multiply(self, scalar: int) -> Union[PointJacobi, Point]:
+        """
+        Multiply the generator point by a scalar.
+
+        :param scalar: The scalar to multiply by, reduced modulo the generator order.
+        :type scalar: int
+
+        :return: The resulting point, or the point at infinity for a zero scalar.
+        :rtype: Union[PointJacobi, Point]
+        """
+
+        scalar %= self._order
+        if not scalar:
+            return INFINITY
+        if self._table is None and self._count < self._threshold:
+            self._count += 1
+            return self._generator * scalar
+
+        mask: int = (1 << self._window) - 1
+        point: Tuple[int, int, int] = (0, 1, 0)
+        for row in self.table():
+            digit: int = scalar & mask
+            if digit:
+                point = self._add_affine(*point, *row[digit])
+            scalar >>= self._window
+            if not scalar:
+                break
+
+        affine: Optional[Tuple[int, int]] = self._affine(*point)
+        if affine is None:
+            return INFINITY
+        return PointJacobi(self._generator.curve(), affine[0], affine[1], 1, self._order)
+
+    def signing_key(self, key_bytes: bytes, curve: Curve) -> SigningKey:
+        """
+        Create an ``ecdsa`` signing key, computing its verifying key with :meth:`multiply`.
+
+        :param key_bytes: The private key bytes.
+        :type key_bytes: bytes
+        :param curve: The curve of the generator point.
+        :type curve: Curve
+
+        :return: The signing key, equal to ``SigningKey.from_string(key_bytes, curve=curve)``.
+        :rtype: SigningKey
+        """
+
+        if len(key_bytes) != curve.baselen:
+            raise MalformedPointError(
+                f"Invalid length of private key, received {len(key_bytes)}, expected {curve.baselen}"
+            )
+        secret: int = string_to_number(key_bytes)
+        if not 1 <= secret < curve.order:
+            raise MalformedPointError(
+                f"Invalid value for secexp, expected integer between 1 and {curve.order}"
+            )
+
+        point: Union[PointJacobi, Point] = self.multiply(secret)
+        signing_key: SigningKey = SigningKey(_error__please_use_generate=True)
+        signing_key.curve = curve
+        signing_key.default_hashfunc = hashlib.sha1
+        signing_key.baselen = curve.baselen
+        signing_key.verifying_key = VerifyingKey.from_public_point(
+            point.scale() if isinstance(point, PointJacobi) else point, curve, hashlib.sha1, False
+        )
+        signing_key.privkey = ecdsa.Private_key(signing_key.verifying_key.pubkey, secret)
+        signing_key.privkey.order = curve.order
+        return signing_key
@@ -5,7 +5,9 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import Any
-from ecdsa.ecdsa import curve_secp256k1
+from ecdsa.ecdsa import (
+    curve_secp256k1, generator_secp256k1
+)
 from ecdsa.ellipticcurve import (
     Point, PointJacobi
 )
@@ -15,6 +17,7 @@ import coincurve
 
 from ....consts import SLIP10_SECP256K1_CONST
 from ...iecc import IPoint
+from ..precomputed import FixedBaseTable
 from ....utils import (
     bytes_to_integer, integer_to_bytes
 )
@@ -196,6 +199,8 @@ class SLIP10Secp256k1PointCoincurve(IPoint):
 
 class SLIP10Secp256k1PointECDSA(IPoint):
 
+    GENERATOR_TABLE: FixedBaseTable = FixedBaseTable(generator_secp256k1)
+
     point: PointJacobi
 
     def __init__(self, point_obj: PointJacobi) -> None:
@@ -362,6 +367,8 @@ class SLIP10Secp256k1PointECDSA(IPoint):
         :rtype: IPoint
         """
 
+        if self.point is generator_secp256k1:
+            return self.__class__(self.GENERATOR_TABLE.multiply(scalar))
         return self.__class__(self.point * scalar)
 
     def __rmul__(self, scalar: int) -> IPoint:
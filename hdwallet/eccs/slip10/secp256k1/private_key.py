@@ -16,6 +16,7 @@ from ....consts import SLIP10_SECP256K1_CONST
 from ...iecc import (
     IPublicKey, IPrivateKey
 )
+from .point import SLIP10Secp256k1PointECDSA
 from .public_key import (
     SLIP10Secp256k1PublicKeyCoincurve, SLIP10Secp256k1PublicKeyECDSA
 )
@@ -147,7 +148,7 @@ class SLIP10Secp256k1PrivateKeyECDSA(IPrivateKey):
 
         try:
             return cls(
-                SigningKey.from_string(
+                SLIP10Secp256k1PointECDSA.GENERATOR_TABLE.signing_key(
                     key_bytes, curve=curves.SECP256k1
                 )
             )
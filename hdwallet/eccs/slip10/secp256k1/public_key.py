@@ -150,6 +150,24 @@ class SLIP10Secp256k1PublicKeyCoincurve(IPublicKey):
             point[0], point[1]
         )
 
+    def tweak_add(self, tweak: bytes) -> "SLIP10Secp256k1PublicKeyCoincurve":
+        """
+        Add ``tweak * G`` to the public key without leaving libsecp256k1.
+
+        This is the public child key step of BIP32 in a single call, avoiding
+        the intermediate point objects and generic scalar multiplication.
+
+        :param tweak: The 32-byte big-endian scalar to add.
+        :type tweak: bytes
+
+        :return: The tweaked public key.
+        :rtype: SLIP10Secp256k1PublicKeyCoincurve
+
+        :raises ValueError: If the tweak is out of range or the result is the point at infinity.
+        """
+
+        return type(self)(self.verify_key.add(tweak))
+
 
 class SLIP10Secp256k1PublicKeyECDSA(IPublicKey):
 
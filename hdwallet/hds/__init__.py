@@ -20,6 +20,7 @@ from .electrum import (
     ElectrumV1HD, ElectrumV2HD
 )
 from .monero import MoneroHD
+from .node import BIP32Node
 from ..exceptions import HDError
 from .ihd import IHD
 
@@ -131,7 +132,7 @@ class HDS:
 
 
 __all__: List[str] = [
-    "IHD", "HDS"
+    "IHD", "HDS", "BIP32Node"
 ] + [
     cls.__name__ for cls in HDS.classes()
 ]
@@ -26,6 +26,8 @@ from .bip32 import BIP32HD
 
 class AlgorandHD(BIP32HD):
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """
         Initialize a AlgorandHD instance.
@@ -115,6 +117,7 @@ class AlgorandHD(BIP32HD):
 
         if cc is None:
             raise DerivationError("Chain code is not set")
+        context = self._node.chain_code_hmac()
 
         # Hardened derivation requires private key
         if index & 0x80000000:
@@ -125,9 +128,9 @@ class AlgorandHD(BIP32HD):
             kR = self._private_key.raw()[32:]
 
             data = bytes([0x00]) + kL + kR + index_bytes
-            z = hmac.new(cc, data, hashlib.sha512).digest()
+            z = context.compute(data)
             data = bytes([0x01]) + kL + kR + index_bytes
-            child_cc = hmac.new(cc, data, hashlib.sha512).digest()[32:]
+            child_cc = context.compute(data)[32:]
 
             zL, zR = z[:32], z[32:]
 
@@ -171,9 +174,9 @@ class AlgorandHD(BIP32HD):
 
             A = self._public_key.raw_compressed()[1:]
             data = bytes([0x02]) + A + index_bytes
-            z = hmac.new(cc, data, hashlib.sha512).digest()
+            z = context.compute(data)
             data = bytes([0x03]) + A + index_bytes
-            child_cc = hmac.new(cc, data, hashlib.sha512).digest()[32:]
+            child_cc = context.compute(data)[32:]
 
             zL = z[:32]
 
@@ -200,7 +203,6 @@ class AlgorandHD(BIP32HD):
         self._chain_code = child_cc
         self._depth += 1
         self._index = index
-        self._fingerprint = get_bytes(self.fingerprint())
 
         return self
 
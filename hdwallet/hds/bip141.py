@@ -14,7 +14,7 @@ from ..consts import (
     PUBLIC_KEY_TYPES, SEMANTICS
 )
 from ..addresses import (
-    P2WPKHAddress, P2WPKHInP2SHAddress, P2WSHAddress, P2WSHInP2SHAddress
+    ADDRESSES, P2WPKHAddress, P2WPKHInP2SHAddress, P2WSHAddress, P2WSHInP2SHAddress
 )
 from ..exceptions import (
     Error, AddressError
@@ -24,6 +24,8 @@ from .bip32 import BIP32HD
 
 class BIP141HD(BIP32HD):
 
+    __slots__ = ("_address", "_xprivate_key_version", "_xpublic_key_version", "_semantic")
+
     _address: str
     _xprivate_key_version: Union[bytes, int]
     _xpublic_key_version: Union[bytes, int]
@@ -234,15 +236,17 @@ class BIP141HD(BIP32HD):
         if address is None:
             address = self._address
         if address == P2WPKHAddress.name():
-            return P2WPKHAddress.encode(
-                public_key=self._public_key,
+            return ADDRESSES.encode_public_key_hash(
+                name=P2WPKHAddress.name(),
+                public_key_hash=self._node.hash(),
                 hrp=hrp,
                 witness_version=witness_version,
                 public_key_type=self._public_key_type
             )
         elif address == P2WPKHInP2SHAddress.name():
-            return P2WPKHInP2SHAddress.encode(
-                public_key=self._public_key,
+            return ADDRESSES.encode_public_key_hash(
+                name=P2WPKHInP2SHAddress.name(),
+                public_key_hash=self._node.hash(),
                 script_address_prefix=script_address_prefix,
                 public_key_type=self._public_key_type
             )
@@ -5,31 +5,29 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Optional, Union, List, Type
+    Optional, Union, List, Tuple, Type, NamedTuple
 )
-from hashlib import sha256
 
 import hmac
 import hashlib
-import struct
 
-from ..libs.ripemd160 import ripemd160
 from ..libs.base58 import check_decode
+from ..cache import LRUCache
 from ..eccs import (
-    IPoint, IPublicKey, IPrivateKey, IEllipticCurveCryptography, KholawEd25519PrivateKey
+    IPublicKey, IPrivateKey, IEllipticCurveCryptography
 )
 from ..seeds import ISeed
 from ..derivations import (
     IDerivation, CustomDerivation
 )
 from ..addresses import (
-    P2PKHAddress, P2SHAddress, P2TRAddress, P2WPKHAddress, P2WPKHInP2SHAddress, P2WSHAddress, P2WSHInP2SHAddress
+    ADDRESSES, P2PKHAddress, P2SHAddress, P2TRAddress, P2WPKHAddress, P2WPKHInP2SHAddress, P2WSHAddress, P2WSHInP2SHAddress
 )
 from ..consts import (
     PUBLIC_KEY_TYPES, WIF_TYPES
 )
 from ..cryptocurrencies import Bitcoin
-from ..crypto import hmac_sha512
+from ..crypto import hash160_many
 from ..wif import (
     private_key_to_wif, wif_to_private_key, get_wif_type
 )
@@ -40,33 +38,44 @@ from ..exceptions import (
     Error, AddressError, DerivationError, XPrivateKeyError, XPublicKeyError, PublicKeyError, PrivateKeyError, SeedError, WIFError
 )
 from ..utils import (
-    get_bytes, get_hmac, bytes_to_integer, integer_to_bytes, bytes_to_string, reset_bits, set_bits
+    get_bytes, get_hmac, integer_to_bytes, bytes_to_string, reset_bits, set_bits
 )
 from .ihd import IHD
+from .node import BIP32Node
+
+
+class BIP32ChildKey(NamedTuple):
+    """
+    Compact record of a child key produced by :meth:`BIP32HD.derive_children`.
+    """
+
+    index: int
+    depth: int
+    private_key: Optional[bytes]
+    public_key: bytes
+    chain_code: bytes
+    fingerprint: bytes
+    parent_fingerprint: bytes
+    hash: bytes
 
 
 class BIP32HD(IHD):
 
-    _seed: Optional[bytes] = None
-    _hmac: Optional[bytes] = None
-    _root_private_key: Optional[IPrivateKey] = None
-    _root_chain_code: Optional[bytes] = None
-    _root_public_key: Optional[IPublicKey] = None
-    _private_key: Optional[IPrivateKey] = None
-    _chain_code: Optional[bytes] = None
-    _public_key: Optional[IPublicKey] = None
-    _public_key_type: str = PUBLIC_KEY_TYPES.COMPRESSED
-    _wif_type: str = WIF_TYPES.WIF_COMPRESSED
-    _wif_prefix: Optional[int] = None
-    _fingerprint: Optional[bytes] = None
-    _parent_fingerprint: Optional[bytes] = None
-    _strict: Optional[bool] = None
+    __slots__ = (
+        "_seed", "_hmac", "_root_node", "_node", "_public_key_type", "_wif_type", "_wif_prefix", "_strict", "_node_cache"
+    )
+
+    _seed: Optional[bytes]
+    _hmac: Optional[bytes]
+    _root_node: Optional[BIP32Node]
+    _node: Optional[BIP32Node]
+    _public_key_type: str
+    _wif_type: str
+    _wif_prefix: Optional[int]
+    _strict: Optional[bool]
     _derivation: IDerivation
-    _root_depth: int = 0
-    _root_index: int = 0
-    _depth: int = 0
-    _index: int = 0
-    
+    _node_cache: Optional[LRUCache]
+
     def __init__(
         self, ecc: Type[IEllipticCurveCryptography], public_key_type: str = PUBLIC_KEY_TYPES.COMPRESSED, **kwargs
     ) -> None:
@@ -78,7 +87,8 @@ class BIP32HD(IHD):
         :param public_key_type: The type of public key to be used, either `PUBLIC_KEY_TYPES.COMPRESSED` or
                                 `PUBLIC_KEY_TYPES.UNCOMPRESSED`. Defaults to `PUBLIC_KEY_TYPES.COMPRESSED`.
         :type public_key_type: str
-        :param kwargs: Additional keyword arguments for custom derivation paths and indexes.
+        :param kwargs: Additional keyword arguments for custom derivation paths and indexes,
+                       and ``cache_size`` for the number of derived nodes to keep (``0`` disables it).
         :type kwargs: dict
 
         :return: None
@@ -86,6 +96,11 @@ class BIP32HD(IHD):
 
         super(BIP32HD, self).__init__(**kwargs)
 
+        self._seed = None
+        self._hmac = None
+        self._root_node = None
+        self._node = None
+        self._strict = None
         self._ecc: IEllipticCurveCryptography = ecc.__call__()
         if public_key_type == PUBLIC_KEY_TYPES.UNCOMPRESSED:
             self._wif_type = WIF_TYPES.WIF
@@ -102,6 +117,120 @@ class BIP32HD(IHD):
         self._derivation = CustomDerivation(
             path=kwargs.get("path", None), indexes=kwargs.get("indexes", None)
         )
+        self._node_cache = LRUCache(
+            max_size=kwargs.get("cache_size", 1024)
+        )
+
+    def _replace_node(self, node: Optional[BIP32Node], **kwargs) -> BIP32Node:
+        """
+        Returns a copy of the given node with the given fields replaced, or a new node if it is None.
+
+        :param node: The node to copy.
+        :type node: Optional[BIP32Node]
+        :param kwargs: The node fields to replace.
+        :type kwargs: dict
+
+        :return: The new node.
+        :rtype: BIP32Node
+        """
+
+        if node is None:
+            return BIP32Node(
+                ecc=self._ecc, public_key_type=self._public_key_type, parent_fingerprint=None, **kwargs
+            )
+        return node.replace(public_key_type=self._public_key_type, **kwargs)
+
+    @property
+    def _root_private_key(self) -> Optional[IPrivateKey]:
+        return self._root_node.ecc_private_key() if self._root_node else None
+
+    @_root_private_key.setter
+    def _root_private_key(self, root_private_key: Optional[IPrivateKey]) -> None:
+        self._root_node = self._replace_node(self._root_node, private_key=root_private_key)
+
+    @property
+    def _root_chain_code(self) -> Optional[bytes]:
+        return self._root_node.chain_code() if self._root_node else None
+
+    @_root_chain_code.setter
+    def _root_chain_code(self, root_chain_code: Optional[bytes]) -> None:
+        self._root_node = self._replace_node(self._root_node, chain_code=root_chain_code)
+
+    @property
+    def _root_public_key(self) -> Optional[IPublicKey]:
+        return self._root_node.ecc_public_key() if self._root_node else None
+
+    @_root_public_key.setter
+    def _root_public_key(self, root_public_key: Optional[IPublicKey]) -> None:
+        self._root_node = self._replace_node(self._root_node, public_key=root_public_key)
+
+    @property
+    def _root_depth(self) -> int:
+        return self._root_node.depth() if self._root_node else 0
+
+    @_root_depth.setter
+    def _root_depth(self, root_depth: int) -> None:
+        self._root_node = self._replace_node(self._root_node, depth=root_depth)
+
+    @property
+    def _root_index(self) -> int:
+        return self._root_node.index() if self._root_node else 0
+
+    @_root_index.setter
+    def _root_index(self, root_index: int) -> None:
+        self._root_node = self._replace_node(self._root_node, index=root_index)
+
+    @property
+    def _private_key(self) -> Optional[IPrivateKey]:
+        return self._node.ecc_private_key() if self._node else None
+
+    @_private_key.setter
+    def _private_key(self, private_key: Optional[IPrivateKey]) -> None:
+        self._node = self._replace_node(self._node, private_key=private_key)
+
+    @property
+    def _chain_code(self) -> Optional[bytes]:
+        return self._node.chain_code() if self._node else None
+
+    @_chain_code.setter
+    def _chain_code(self, chain_code: Optional[bytes]) -> None:
+        self._node = self._replace_node(self._node, chain_code=chain_code)
+
+    @property
+    def _public_key(self) -> Optional[IPublicKey]:
+        return self._node.ecc_public_key() if self._node else None
+
+    @_public_key.setter
+    def _public_key(self, public_key: Optional[IPublicKey]) -> None:
+        self._node = self._replace_node(self._node, public_key=public_key)
+
+    @property
+    def _depth(self) -> int:
+        return self._node.depth() if self._node else 0
+
+    @_depth.setter
+    def _depth(self, depth: int) -> None:
+        self._node = self._replace_node(self._node, depth=depth)
+
+    @property
+    def _index(self) -> int:
+        return self._node.index() if self._node else 0
+
+    @_index.setter
+    def _index(self, index: int) -> None:
+        self._node = self._replace_node(self._node, index=index)
+
+    @property
+    def _fingerprint(self) -> Optional[bytes]:
+        return self._node.fingerprint() if self._node else None
+
+    @property
+    def _parent_fingerprint(self) -> Optional[bytes]:
+        return self._node.parent_fingerprint() if self._node else None
+
+    @_parent_fingerprint.setter
+    def _parent_fingerprint(self, parent_fingerprint: Optional[bytes]) -> None:
+        self._node = self._replace_node(self._node, parent_fingerprint=parent_fingerprint)
 
     @classmethod
     def name(cls) -> str:
@@ -190,23 +319,26 @@ class BIP32HD(IHD):
                 get_hmac(ecc_name=self._ecc.NAME), integer_to_bytes(0x01) + self._seed, hashlib.sha256
             ).digest()
 
-            self._root_private_key, self._root_chain_code = (
+            root_private_key, root_chain_code = (
                 self._ecc.PRIVATE_KEY.from_bytes(
                     (kl_bytes + kr_bytes)
                 ), chain_code_bytes
             )
         else:
-            self._root_private_key, self._root_chain_code = (
+            root_private_key, root_chain_code = (
                 self._ecc.PRIVATE_KEY.from_bytes(
                     self._hmac[:hmac_half_length]
                 ), self._hmac[hmac_half_length:]
             )
 
-        self._private_key, self._chain_code, self._parent_fingerprint = (
-            self._root_private_key, self._root_chain_code, (integer_to_bytes(0x00) * 4)
+        self._root_node = BIP32Node(
+            ecc=self._ecc,
+            chain_code=root_chain_code,
+            private_key=root_private_key,
+            public_key=root_private_key.public_key(),
+            public_key_type=self._public_key_type
         )
-        self._root_public_key = self._root_private_key.public_key()
-        self._public_key = self._root_public_key
+        self._node = self._root_node
         self._strict = True
         self.__update__()
         return self
@@ -238,17 +370,16 @@ class BIP32HD(IHD):
         version, depth, parent_fingerprint, index, chain_code, key = deserialize(
             key=xprivate_key, encoded=encoded
         )
-        self._root_chain_code = chain_code
-        self._root_private_key = self._ecc.PRIVATE_KEY.from_bytes(key[1:])
-        self._root_public_key = self._root_private_key.public_key()
-        self._root_depth = depth
-        self._parent_fingerprint = parent_fingerprint
-        self._root_index = index
-        self._chain_code = self._root_chain_code
-        self._private_key = self._root_private_key
-        self._public_key = self._root_public_key
-        self._depth = self._root_depth
-        self._index = self._root_index
+        self._root_node = BIP32Node(
+            ecc=self._ecc,
+            chain_code=chain_code,
+            private_key=self._ecc.PRIVATE_KEY.from_bytes(key[1:]),
+            depth=depth,
+            index=index,
+            parent_fingerprint=parent_fingerprint,
+            public_key_type=self._public_key_type
+        )
+        self._node = self._root_node
         self._strict = is_root_key(
             key=xprivate_key, encoded=encoded
         )
@@ -282,15 +413,16 @@ class BIP32HD(IHD):
         version, depth, parent_fingerprint, index, chain_code, key = deserialize(
             key=xpublic_key, encoded=encoded
         )
-        self._root_chain_code = chain_code
-        self._root_public_key = self._ecc.PUBLIC_KEY.from_bytes(key)
-        self._root_depth = depth
-        self._parent_fingerprint = parent_fingerprint
-        self._root_index = index
-        self._chain_code = self._root_chain_code
-        self._public_key = self._root_public_key
-        self._depth = self._root_depth
-        self._index = self._root_index
+        self._root_node = BIP32Node(
+            ecc=self._ecc,
+            chain_code=chain_code,
+            public_key=self._ecc.PUBLIC_KEY.from_bytes(key),
+            depth=depth,
+            index=index,
+            parent_fingerprint=parent_fingerprint,
+            public_key_type=self._public_key_type
+        )
+        self._node = self._root_node
         self._strict = is_root_key(
             key=xpublic_key, encoded=encoded
         )
@@ -374,8 +506,7 @@ class BIP32HD(IHD):
             raise DerivationError("Invalid derivation instance", expected=IDerivation, got=type(derivation))
 
         self._derivation = derivation
-        for index in self._derivation.indexes():
-            self.drive(index)
+        self.drive_indexes(indexes=self._derivation.indexes())
         return self
 
     def update_derivation(self, derivation: IDerivation) -> "BIP32HD":
@@ -398,6 +529,82 @@ class BIP32HD(IHD):
         )
         return self
 
+    def update_node(self, node: BIP32Node, derivation: Optional[IDerivation] = None) -> "BIP32HD":
+        """
+        Moves the BIP32HD instance to an already derived node, without driving any index.
+
+        :param node: The node to move to, derived from the root node of this instance.
+        :type node: BIP32Node
+        :param derivation: The derivation of the node, if None the current derivation is kept.
+        :type derivation: Optional[IDerivation]
+
+        :return: The updated BIP32HD instance.
+        :rtype: BIP32HD
+        """
+
+        if derivation is not None:
+            if not isinstance(derivation, IDerivation):
+                raise DerivationError("Invalid derivation instance", expected=IDerivation, got=type(derivation))
+            self._derivation = derivation
+        self._node = node
+        return self
+
+    def to_state(self) -> bytes:
+        """
+        Serializes the root node, the current node and the derivation into a compact state.
+
+        :return: The state bytes.
+        :rtype: bytes
+        """
+
+        def pack_node(node: Optional[BIP32Node]) -> Optional[tuple]:
+            if node is None:
+                return None
+            return (
+                node.private_key(), node.public_key(), node.chain_code(),
+                node.depth(), node.index(), node.parent_fingerprint()
+            )
+
+        return self._pack_state(
+            self._ecc.NAME, self._public_key_type, self._wif_prefix, self._strict, self._seed,
+            pack_node(self._root_node), pack_node(self._node)
+        )
+
+    def from_state(self, state: bytes) -> "BIP32HD":
+        """
+        Restores the BIP32HD instance from a state produced by :meth:`to_state`, without deriving any key.
+
+        :param state: The state bytes.
+        :type state: bytes
+
+        :return: The restored BIP32HD instance.
+        :rtype: BIP32HD
+        """
+
+        ecc, public_key_type, wif_prefix, strict, seed, root_node, node = self._unpack_state(state)
+        if ecc != self._ecc.NAME:
+            raise Error(f"Invalid {self.name()} state ECC", expected=self._ecc.NAME, got=ecc)
+
+        def unpack_node(values: Optional[tuple]) -> Optional[BIP32Node]:
+            if values is None:
+                return None
+            private_key, public_key, chain_code, depth, index, parent_fingerprint = values
+            return BIP32Node(
+                ecc=self._ecc, chain_code=chain_code, private_key=private_key, public_key=public_key, depth=depth,
+                index=index, parent_fingerprint=parent_fingerprint, public_key_type=public_key_type
+            )
+
+        self._public_key_type = public_key_type
+        self._wif_type = (
+            WIF_TYPES.WIF if public_key_type == PUBLIC_KEY_TYPES.UNCOMPRESSED else WIF_TYPES.WIF_COMPRESSED
+        )
+        self._wif_prefix = wif_prefix
+        self._strict = strict
+        self._seed = seed
+        self._root_node = unpack_node(root_node)
+        self._node = unpack_node(node)
+        return self
+
     def clean_derivation(self) -> "BIP32HD":
         """
         Cleans the derivation path of the BIP32HD instance.
@@ -406,238 +613,231 @@ class BIP32HD(IHD):
         :rtype: BIP32HD
         """
 
-        if self._root_private_key:
-            self._private_key, self._chain_code, self._parent_fingerprint = (
-                self._root_private_key, self._root_chain_code, (integer_to_bytes(0x00) * 4)
+        if self._root_node and (self._root_node.private_key() or self._root_node.public_key()):
+            self._node = self._root_node.replace(
+                depth=0, index=self._index, parent_fingerprint=(integer_to_bytes(0x00) * 4)
             )
-            self._public_key = self._private_key.public_key()
             self._derivation.clean()
-            self._depth = 0
-        elif self._root_public_key:
-            self._public_key, self._chain_code, self._parent_fingerprint = (
-                self._root_public_key, self._root_chain_code, (integer_to_bytes(0x00) * 4)
-            )
-            self._derivation.clean()
-            self._depth = 0
         return self
 
-    def drive(self, index: int) -> Optional["BIP32HD"]:
+    def drive_indexes(self, indexes: List[int]) -> "BIP32HD":
         """
-        Drives the BIP32HD instance forward along the derivation path by deriving a child key at the given index.
+        Drives the BIP32HD instance forward along the given derivation indexes.
 
-        :param index: The index to derive the child key.
-        :type index: int
+        When the instance is at its root node, every intermediate node is kept in a bounded
+        LRU cache keyed by the root node and the index prefix. The longest cached prefix of
+        ``indexes`` is restored and only the remaining suffix is derived, so moving between
+        sibling paths costs a single child step.
 
-        :return: The updated BIP32HD instance with the derived child key, or None if the derivation fails.
-        :rtype: Optional[BIP32HD]
+        :param indexes: The derivation indexes to drive.
+        :type indexes: List[int]
+
+        :return: The updated BIP32HD instance.
+        :rtype: BIP32HD
         """
 
-        hmac_half_length: int = hashlib.sha512().digest_size // 2
+        node: Optional[BIP32Node] = self._node
+        if self._node_cache is None or self._node_cache.max_size() == 0 or not (
+            node and self._root_node and node.chain_code() and
+            node.chain_code() == self._root_node.chain_code() and
+            node.private_key() == self._root_node.private_key() and
+            (node.private_key() is not None or node.public_key() == self._root_node.public_key())
+        ):
+            for index in indexes:
+                self.drive(index)
+            return self
 
-        if self._ecc.NAME == "Kholaw-Ed25519":
-            index_bytes: bytes = integer_to_bytes(
-                data=index, bytes_num=4, endianness="little"
+        root: Tuple[int, bytes, bytes] = (
+            node.depth(), node.chain_code(), (
+                node.private_key() if node.private_key() is not None else node.public_key()
             )
-            if self._private_key:
-                if index & 0x80000000:
-                    if self._private_key is None:
-                        raise DerivationError("Hardened derivation path is invalid for xpublic key")
-                    z_hmac: bytes = hmac_sha512(self._chain_code, (
-                        integer_to_bytes(0x00) + self._private_key.raw() + index_bytes
-                    ))
-                    _hmac: bytes = hmac_sha512(self._chain_code, (
-                        integer_to_bytes(0x01) + self._private_key.raw() + index_bytes
-                    ))
-                else:
-                    z_hmac: bytes = hmac_sha512(self._chain_code, (
-                        integer_to_bytes(0x02) + self._public_key.raw_compressed()[1:] + index_bytes
-                    ))
-                    _hmac: bytes = hmac_sha512(self._chain_code, (
-                        integer_to_bytes(0x03) + self._public_key.raw_compressed()[1:] + index_bytes
-                    ))
+        )
+        indexes: Tuple[int, ...] = tuple(indexes)
+        position: int = 0
+        while position < len(indexes):
+            node = self._node_cache.get((root, indexes[:position + 1]))
+            if node is None:
+                break
+            self._node = node
+            position += 1
+
+        for position in range(position, len(indexes)):
+            self.drive(indexes[position])
+            self._node_cache.put((root, indexes[:position + 1]), self._node)
+        return self
 
-                def new_private_key_left_part(zl: bytes, kl: bytes, ecc: IEllipticCurveCryptography) -> bytes:
-                    zl: int = bytes_to_integer(zl[:28], endianness="little")
-                    kl: int = bytes_to_integer(kl, endianness="little")
-
-                    private_key_left: int = (zl * 8) + kl
-                    if private_key_left % ecc.ORDER == 0:
-                        raise Error("Computed child key is not valid, very unlucky index")
-
-                    return integer_to_bytes(
-                        private_key_left, bytes_num=(
-                            KholawEd25519PrivateKey.length() // 2
-                        ), endianness="little"
-                    )
-
-                def new_private_key_right_part(zr: bytes, kr: bytes) -> bytes:
-                    zr: int = bytes_to_integer(zr, endianness="little")
-                    kr: int = (zr + bytes_to_integer(kr, endianness="little")) % (2 ** 256)
-
-                    return integer_to_bytes(
-                        kr, bytes_num=(
-                            KholawEd25519PrivateKey.length() // 2
-                        ), endianness="little"
-                    )
-
-                z_hmacl, z_hmacr, _hmacl, _hmacr = (
-                    z_hmac[:hmac_half_length], z_hmac[hmac_half_length:],
-                    _hmac[:hmac_half_length], _hmac[hmac_half_length:]
-                )
+    def cache_info(self) -> dict:
+        """
+        Retrieves the statistics of the derived node cache.
 
-                kl_bytes, kr_bytes = (
-                    new_private_key_left_part(
-                        zl=z_hmacl, kl=self._private_key.raw()[:hmac_half_length], ecc=self._ecc
-                    ), new_private_key_right_part(
-                        zr=z_hmacr, kr=self._private_key.raw()[hmac_half_length:]
-                    )
-                )
+        :return: A dictionary with ``hits``, ``misses``, ``size`` and ``max_size``.
+        :rtype: dict
+        """
 
-                self._private_key, self._chain_code, self._parent_fingerprint = (
-                    self._ecc.PRIVATE_KEY.from_bytes(
-                        kl_bytes + kr_bytes
-                    ),
-                    _hmacr,
-                    get_bytes(self.fingerprint())
-                )
-                self._public_key = self._private_key.public_key()
-                self._depth, self._index, self._fingerprint = (
-                    (self._depth + 1), index, get_bytes(self.fingerprint())
-                )
-            else:
-                if index & 0x80000000:
-                    raise DerivationError("Hardened derivation path is invalid for xpublic key")
-                z_hmac: bytes = hmac_sha512(self._chain_code, (
-                    integer_to_bytes(0x02) + self._public_key.raw_compressed()[1:] + index_bytes
-                ))
-                _hmac: bytes = hmac_sha512(self._chain_code, (
-                    integer_to_bytes(0x03) + self._public_key.raw_compressed()[1:] + index_bytes
-                ))
+        return self._node_cache.info() if self._node_cache is not None else dict(
+            hits=0, misses=0, size=0, max_size=0
+        )
 
-                def new_public_key_point(public_key: IPublicKey, zl: bytes, ecc: IEllipticCurveCryptography) -> IPoint:
-                    zl: int = bytes_to_integer(zl[:28], endianness="little")
-                    return public_key.point() + ((zl * 8) * ecc.GENERATOR)
+    def cache_clear(self) -> "BIP32HD":
+        """
+        Clears the derived node cache and its statistics.
 
-                z_hmacl, z_hmacr, _hmacl, _hmacr = (
-                    z_hmac[:hmac_half_length], z_hmac[hmac_half_length:],
-                    _hmac[:hmac_half_length], _hmac[hmac_half_length:]
-                )
+        :return: The BIP32HD instance.
+        :rtype: BIP32HD
+        """
 
-                new_public_key_point: IPoint = new_public_key_point(
-                    public_key=self._public_key, zl=z_hmacl, ecc=self._ecc
-                )
-                if new_public_key_point.x() == 0 and new_public_key_point.y() == 1:
-                    raise Error("Computed public child key is not valid, very unlucky index")
-                new_public_key: IPublicKey = self._ecc.PUBLIC_KEY.from_point(
-                    new_public_key_point
-                )
-                self._parent_fingerprint = get_bytes(self.fingerprint())
-                self._chain_code, self._public_key = (
-                    _hmacr, new_public_key
-                )
-                self._depth, self._index, self._fingerprint = (
-                    (self._depth + 1), index, get_bytes(self.fingerprint())
-                )
+        if self._node_cache is not None:
+            self._node_cache.clear()
+        return self
 
-            return self
+    def node(self, parent_path: Optional[Union[str, IDerivation]] = None) -> Optional[BIP32Node]:
+        """
+        Retrieves the immutable node at a derivation path without moving the instance.
 
-        elif self._ecc.NAME in [
-            "SLIP10-Ed25519", "SLIP10-Ed25519-Blake2b", "SLIP10-Ed25519-Monero"
-        ]:
-            if not self._private_key:
-                raise DerivationError(
-                    f"On {self._ecc.NAME} ECC, public key derivation is not supported"
-                )
+        :param parent_path: The derivation path of the node, e.g. ``m/44'/0'/0'/0``.
+                            If None, the current node is returned.
+        :type parent_path: Optional[Union[str, IDerivation]]
 
-            index_bytes: bytes = struct.pack(">L", index)
-            data_bytes: bytes = (
-                integer_to_bytes(0x00) + self._private_key.raw() + index_bytes
-            )
+        :return: The node at the given path.
+        :rtype: Optional[BIP32Node]
+        """
+
+        if parent_path is None:
+            return self._node
+
+        indexes: List[int] = (
+            parent_path.indexes() if isinstance(parent_path, IDerivation) else
+            CustomDerivation(path=parent_path).indexes()
+        )
+        if not (self._root_node and (self._root_node.private_key() or self._root_node.public_key())):
+            raise DerivationError("You can't drive this master key")
 
-            _hmac: bytes = (
-                hmac.digest(
-                    self._chain_code, data_bytes, "sha512"
-                ) if hasattr(hmac, "digest") else hmac.new(
-                    self._chain_code, data_bytes, hashlib.sha512
-                ).digest()
+        state: Optional[BIP32Node] = self._node
+        try:
+            self._node = self._root_node.replace(
+                depth=0, parent_fingerprint=(integer_to_bytes(0x00) * 4)
             )
-            _hmacl, _hmacr = _hmac[:hmac_half_length], _hmac[hmac_half_length:]
+            self.drive_indexes(indexes=indexes)
+            return self._node
+        finally:
+            self._node = state
+
+    def derive_children(
+        self, parent_path: Optional[Union[str, IDerivation]] = None, start: int = 0, count: int = 1
+    ) -> List[BIP32ChildKey]:
+        """
+        Derives a batch of consecutive child keys of a single parent node.
 
-            new_private_key: IPrivateKey = self._ecc.PRIVATE_KEY.from_bytes(_hmacl)
+        The parent node is derived once, and its chain code, serialized public key
+        and fingerprint are shared by every child of the batch. Indexes producing
+        an invalid child key are skipped. The instance itself is left unchanged.
+
+        :param parent_path: The derivation path of the parent node, e.g. ``m/44'/0'/0'/0``.
+                            If None, the current node is used as the parent.
+        :type parent_path: Optional[Union[str, IDerivation]]
+        :param start: The first child index, defaults to 0.
+        :type start: int
+        :param count: The number of children to derive, defaults to 1.
+        :type count: int
+
+        :return: The list of derived child key records.
+        :rtype: List[BIP32ChildKey]
+        """
 
-            self._parent_fingerprint = get_bytes(self.fingerprint())
-            self._private_key, self._chain_code, self._public_key = (
-                new_private_key, _hmacr, new_private_key.public_key()
+        if not isinstance(start, int) or not isinstance(count, int) or start < 0 or count < 0:
+            raise DerivationError(
+                "Invalid child index range", expected="non-negative integers", got=(start, count)
             )
-            self._depth, self._index, self._fingerprint = (
-                (self._depth + 1), index, get_bytes(self.fingerprint())
+        if start + count > 0x100000000:
+            raise DerivationError(
+                "Child index out of range", expected=f"<= {0xFFFFFFFF}", got=(start + count - 1)
             )
 
-        elif self._ecc.NAME in [
-            "SLIP10-Nist256p1", "SLIP10-Secp256k1"
-        ]:
-            index_bytes: bytes = struct.pack(">L", index)
-            if not self._root_private_key and not self._root_public_key:
-                raise DerivationError("You can't drive this master key")
+        state: Optional[BIP32Node] = self._node
+        try:
+            self._node = self.node(parent_path=parent_path)
             if not self._chain_code:
                 raise DerivationError("You can't drive xprivate_key and private_key")
 
-            if index & 0x80000000:
-                if self._private_key is None:
-                    raise DerivationError("Hardened derivation path is invalid for xpublic key")
-                data_bytes: bytes = (
-                    integer_to_bytes(0x00) + self._private_key.raw() + index_bytes
-                )
-            else:
-                data_bytes: bytes = (
-                    self._public_key.raw_compressed() + index_bytes
-                )
+            parent_fingerprint: bytes = get_bytes(self.fingerprint())
+            depth: int = self._depth + 1
+            children: List[BIP32ChildKey] = []
+
+            if type(self).drive is not BIP32HD.drive or self._ecc.NAME not in [
+                "SLIP10-Nist256p1", "SLIP10-Secp256k1"
+            ]:
+                parent: BIP32Node = self._node
+                for index in range(start, start + count):
+                    self._node = parent
+                    if self.drive(index) is None or self._depth != depth:
+                        continue
+                    children.append(BIP32ChildKey(
+                        index=index,
+                        depth=depth,
+                        private_key=(self._private_key.raw() if self._private_key else None),
+                        public_key=get_bytes(self.public_key()),
+                        chain_code=self._chain_code,
+                        fingerprint=self._fingerprint,
+                        parent_fingerprint=parent_fingerprint,
+                        hash=self._node.hash()
+                    ))
+                return children
+
+            parent: BIP32Node = self._node
+            uncompressed: bool = self._public_key_type == PUBLIC_KEY_TYPES.UNCOMPRESSED
+            derived: List[Tuple[int, Optional[bytes], bytes, bytes]] = []
+
+            for index in range(start, start + count):
+                child: Optional[Tuple[Optional[bytes], IPublicKey, bytes]] = parent.child_raw(index)
+                if child is None:
+                    continue
+                child_private_key_bytes, child_public_key, child_chain_code = child
+                derived.append((
+                    index,
+                    child_private_key_bytes,
+                    child_public_key.raw_uncompressed() if uncompressed else child_public_key.raw_compressed(),
+                    child_chain_code
+                ))
 
-            _hmac: bytes = (
-                hmac.digest(
-                    self._chain_code, data_bytes, "sha512"
-                ) if hasattr(hmac, "digest") else hmac.new(
-                    self._chain_code, data_bytes, hashlib.sha512
-                ).digest()
-            )
-            _hmacl, _hmacr = _hmac[:hmac_half_length], _hmac[hmac_half_length:]
+            hashes: bytes = hash160_many([child[2] for child in derived])
+            for position, (index, child_private_key_bytes, child_public_key_bytes, child_chain_code) in enumerate(derived):
+                child_hash: bytes = hashes[position * 20:(position + 1) * 20]
+                children.append(BIP32ChildKey(
+                    index=index,
+                    depth=depth,
+                    private_key=child_private_key_bytes,
+                    public_key=child_public_key_bytes,
+                    chain_code=child_chain_code,
+                    fingerprint=child_hash[:4],
+                    parent_fingerprint=parent_fingerprint,
+                    hash=child_hash
+                ))
+            return children
+        finally:
+            self._node = state
 
-            _hmacl_int: int = bytes_to_integer(_hmacl)
-            if _hmacl_int > self._ecc.ORDER:
-                return None
+    def drive(self, index: int) -> Optional["BIP32HD"]:
+        """
+        Drives the BIP32HD instance forward along the derivation path by deriving a child key at the given index.
 
-            if self._private_key:
-                private_key_int: int = bytes_to_integer(self._private_key.raw())
-                key_int = (_hmacl_int + private_key_int) % self._ecc.ORDER
-                if key_int == 0:
-                    return None
+        :param index: The index to derive the child key.
+        :type index: int
 
-                new_private_key: IPrivateKey = self._ecc.PRIVATE_KEY.from_bytes((
-                    integer_to_bytes(0x00) * 32 + integer_to_bytes(key_int)
-                )[-32:])
+        :return: The updated BIP32HD instance with the derived child key, or None if the derivation fails.
+        :rtype: Optional[BIP32HD]
+        """
 
-                self._parent_fingerprint = get_bytes(self.fingerprint())
-                self._private_key, self._chain_code, self._public_key = (
-                    new_private_key, _hmacr, new_private_key.public_key()
-                )
-                self._depth, self._index, self._fingerprint = (
-                    (self._depth + 1), index, get_bytes(self.fingerprint())
-                )
-            else:
-                new_public_key_point: IPoint = (
-                    self._public_key.point() + (self._ecc.GENERATOR * bytes_to_integer(_hmacl))
-                )
-                new_public_key: IPublicKey = self._ecc.PUBLIC_KEY.from_point(
-                    new_public_key_point
-                )
+        if self._ecc.NAME in [
+            "SLIP10-Nist256p1", "SLIP10-Secp256k1"
+        ] and not (self._root_node and (self._root_node.private_key() or self._root_node.public_key())):
+            raise DerivationError("You can't drive this master key")
 
-                self._parent_fingerprint = get_bytes(self.fingerprint())
-                self._chain_code, self._public_key = (
-                    _hmacr, new_public_key
-                )
-                self._depth, self._index, self._fingerprint = (
-                    (self._depth + 1), index, get_bytes(self.fingerprint())
-                )
+        node: Optional[BIP32Node] = (
+            self._node if self._node else self._replace_node(self._node)
+        ).child(index)
+        if node is None:
+            return None
+        self._node = node
         return self
 
     def seed(self) -> Optional[str]:
@@ -665,7 +865,7 @@ class BIP32HD(IHD):
         :rtype: Optional[str]
         """
 
-        if not self.root_private_key():
+        if not self._root_private_key:
             return None
 
         return serialize(
@@ -675,10 +875,10 @@ class BIP32HD(IHD):
             depth=self._root_depth,
             parent_fingerprint=(integer_to_bytes(0x00) * 4),
             index=self._root_index,
-            chain_code=self.root_chain_code(),
-            key=("00" + self.root_private_key()),
+            chain_code=self._root_chain_code,
+            key=(integer_to_bytes(0x00) + self._root_private_key.raw()),
             encoded=encoded
-        ) if self.root_chain_code() else None
+        ) if self._root_chain_code else None
 
     def root_xpublic_key(
         self, version: Union[bytes, int] = Bitcoin.NETWORKS.MAINNET.XPUBLIC_KEY_VERSIONS.P2PKH, encoded: bool = True
@@ -702,12 +902,10 @@ class BIP32HD(IHD):
             depth=self._root_depth,
             parent_fingerprint=(integer_to_bytes(0x00) * 4),
             index=self._root_index,
-            chain_code=self.root_chain_code(),
-            key=self.root_public_key(
-                public_key_type=PUBLIC_KEY_TYPES.COMPRESSED
-            ),
+            chain_code=self._root_chain_code,
+            key=self._root_public_key.raw_compressed(),
             encoded=encoded
-        ) if self.root_chain_code() else None
+        ) if self._root_chain_code else None
 
     def root_private_key(self) -> Optional[str]:
         """
@@ -802,7 +1000,8 @@ class BIP32HD(IHD):
         :rtype: Optional[str]
         """
 
-        if not self.private_key():
+        private_key: Optional[bytes] = self.private_key_bytes()
+        if not private_key:
             return None
 
         return serialize(
@@ -810,12 +1009,12 @@ class BIP32HD(IHD):
                 integer_to_bytes(version) if isinstance(version, int) else get_bytes(version)
             ),
             depth=self._depth,
-            parent_fingerprint=self.parent_fingerprint(),
+            parent_fingerprint=self._parent_fingerprint,
             index=self._index,
-            chain_code=self.chain_code(),
-            key=("00" + self.private_key()),
+            chain_code=self._chain_code,
+            key=(integer_to_bytes(0x00) + private_key),
             encoded=encoded
-        ) if self.chain_code() else None
+        ) if self._chain_code else None
 
     def xpublic_key(
         self, version: Union[bytes, int] = Bitcoin.NETWORKS.MAINNET.XPUBLIC_KEY_VERSIONS.P2PKH, encoded: bool = True
@@ -837,14 +1036,24 @@ class BIP32HD(IHD):
                 integer_to_bytes(version) if isinstance(version, int) else get_bytes(version)
             ),
             depth=self._depth,
-            parent_fingerprint=self.parent_fingerprint(),
+            parent_fingerprint=self._parent_fingerprint,
             index=self._index,
-            chain_code=self.chain_code(),
-            key=self.public_key(
+            chain_code=self._chain_code,
+            key=self.public_key_bytes(
                 public_key_type=PUBLIC_KEY_TYPES.COMPRESSED
             ),
             encoded=encoded
-        ) if self.chain_code() else None
+        ) if self._chain_code else None
+
+    def private_key_bytes(self) -> Optional[bytes]:
+        """
+        Retrieves the raw private key bytes.
+
+        :return: The private key bytes, or None if the private key is not set.
+        :rtype: Optional[bytes]
+        """
+
+        return self._node.private_key() if self._node else None
 
     def private_key(self) -> Optional[str]:
         """
@@ -854,7 +1063,8 @@ class BIP32HD(IHD):
         :rtype: Optional[str]
         """
 
-        return bytes_to_string(self._private_key.raw()) if self._private_key else None
+        private_key: Optional[bytes] = self.private_key_bytes()
+        return bytes_to_string(private_key) if private_key else None
 
     def wif(self, wif_type: Optional[str] = None) -> Optional[str]:
         """
@@ -881,9 +1091,10 @@ class BIP32HD(IHD):
         else:
             _wif_type: str = self._wif_type
 
+        private_key: Optional[bytes] = self.private_key_bytes()
         return private_key_to_wif(
-            private_key=self.private_key(), wif_type=_wif_type, wif_prefix=self._wif_prefix
-        ) if self.private_key() else None
+            private_key=private_key, wif_type=_wif_type, wif_prefix=self._wif_prefix
+        ) if private_key else None
 
     def wif_type(self) -> Optional[str]:
         """
@@ -895,6 +1106,16 @@ class BIP32HD(IHD):
 
         return self._wif_type if self.wif() else None
 
+    def chain_code_bytes(self) -> Optional[bytes]:
+        """
+        Retrieves the raw chain code bytes associated with the current instance.
+
+        :return: The chain code bytes if available, otherwise None.
+        :rtype: Optional[bytes]
+        """
+
+        return self._node.chain_code() if self._node else None
+
     def chain_code(self) -> Optional[str]:
         """
         Retrieves the chain code associated with the current instance.
@@ -903,7 +1124,38 @@ class BIP32HD(IHD):
         :rtype: Optional[str]
         """
 
-        return bytes_to_string(self._chain_code) if self._chain_code else None
+        chain_code: Optional[bytes] = self.chain_code_bytes()
+        return bytes_to_string(chain_code) if chain_code else None
+
+    def public_key_bytes(self, public_key_type: Optional[str] = None) -> Optional[bytes]:
+        """
+        Retrieves the raw public key bytes associated with the current instance.
+
+        :param public_key_type: Optional. Specifies the type of public key to return.
+                                If not provided, defaults to the type set during initialization.
+        :type public_key_type: Optional[str]
+
+        :return: The public key bytes based on the specified type, or None if the public key is not set.
+        :rtype: Optional[bytes]
+        """
+
+        if public_key_type:
+            if public_key_type not in PUBLIC_KEY_TYPES.get_types():
+                raise Error(
+                    f"Invalid {self.name()} public key type",
+                    expected=PUBLIC_KEY_TYPES.get_types(),
+                    got=public_key_type
+                )
+            _public_key_type: str = public_key_type
+        else:
+            _public_key_type: str = self._public_key_type
+
+        if not self._node:
+            return None
+        if _public_key_type == PUBLIC_KEY_TYPES.COMPRESSED:
+            return self._node.public_key()
+        public_key: Optional[IPublicKey] = self._node.ecc_public_key()
+        return public_key.raw_uncompressed() if public_key else None
 
     def public_key(self, public_key_type: Optional[str] = None):
         """
@@ -951,7 +1203,7 @@ class BIP32HD(IHD):
         :rtype: str
         """
 
-        return bytes_to_string(self._public_key.raw_compressed())
+        return bytes_to_string(self.public_key_bytes(public_key_type=PUBLIC_KEY_TYPES.COMPRESSED))
 
     def uncompressed(self) -> str:
         """
@@ -961,7 +1213,7 @@ class BIP32HD(IHD):
         :rtype: str
         """
 
-        return bytes_to_string(self._public_key.raw_uncompressed())
+        return bytes_to_string(self.public_key_bytes(public_key_type=PUBLIC_KEY_TYPES.UNCOMPRESSED))
 
     def hash(self) -> str:
         """
@@ -971,7 +1223,7 @@ class BIP32HD(IHD):
         :rtype: str
         """
 
-        return bytes_to_string(ripemd160(sha256(get_bytes(self.public_key())).digest()))
+        return bytes_to_string(self._node.hash())
 
     def fingerprint(self) -> str:
         """
@@ -1073,14 +1325,16 @@ class BIP32HD(IHD):
         """
 
         if address == P2PKHAddress.name():
-            return P2PKHAddress.encode(
-                public_key=self._public_key,
+            return ADDRESSES.encode_public_key_hash(
+                name=P2PKHAddress.name(),
+                public_key_hash=self._node.hash(),
                 public_key_address_prefix=public_key_address_prefix,
                 public_key_type=self._public_key_type
             )
         elif address == P2SHAddress.name():
-            return P2SHAddress.encode(
-                public_key=self._public_key,
+            return ADDRESSES.encode_public_key_hash(
+                name=P2SHAddress.name(),
+                public_key_hash=self._node.hash(),
                 script_address_prefix=script_address_prefix,
                 public_key_type=self._public_key_type
             )
@@ -1092,15 +1346,17 @@ class BIP32HD(IHD):
                 public_key_type=self._public_key_type
             )
         elif address == P2WPKHAddress.name():
-            return P2WPKHAddress.encode(
-                public_key=self._public_key,
+            return ADDRESSES.encode_public_key_hash(
+                name=P2WPKHAddress.name(),
+                public_key_hash=self._node.hash(),
                 hrp=hrp,
                 witness_version=witness_version,
                 public_key_type=self._public_key_type
             )
         elif address == P2WPKHInP2SHAddress.name():
-            return P2WPKHInP2SHAddress.encode(
-                public_key=self._public_key,
+            return ADDRESSES.encode_public_key_hash(
+                name=P2WPKHInP2SHAddress.name(),
+                public_key_hash=self._node.hash(),
                 script_address_prefix=script_address_prefix,
                 public_key_type=self._public_key_type
             )
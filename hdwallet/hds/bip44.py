@@ -11,7 +11,9 @@ from typing import (
 from ..cryptocurrencies import Bitcoin
 from ..eccs import IEllipticCurveCryptography
 from ..consts import PUBLIC_KEY_TYPES
-from ..addresses import P2PKHAddress
+from ..addresses import (
+    ADDRESSES, P2PKHAddress
+)
 from ..exceptions import DerivationError
 from ..derivations import (
     IDerivation, BIP44Derivation
@@ -21,6 +23,8 @@ from .bip32 import BIP32HD
 
 class BIP44HD(BIP32HD):
 
+    __slots__ = ()
+
     _derivation: BIP44Derivation
 
     def __init__(
@@ -148,8 +152,7 @@ class BIP44HD(BIP32HD):
 
         self.clean_derivation()
         self._derivation = derivation
-        for index in self._derivation.indexes():
-            self.drive(index)
+        self.drive_indexes(indexes=self._derivation.indexes())
         return self
 
     def address(
@@ -166,8 +169,9 @@ class BIP44HD(BIP32HD):
         :rtype: str
         """
 
-        return P2PKHAddress.encode(
-            public_key=self._public_key,
+        return ADDRESSES.encode_public_key_hash(
+            name=P2PKHAddress.name(),
+            public_key_hash=self._node.hash(),
             public_key_address_prefix=public_key_address_prefix,
             public_key_type=self._public_key_type
         )
@@ -11,7 +11,9 @@ from typing import (
 from ..cryptocurrencies import Bitcoin
 from ..eccs import IEllipticCurveCryptography
 from ..consts import PUBLIC_KEY_TYPES
-from ..addresses import P2WPKHInP2SHAddress
+from ..addresses import (
+    ADDRESSES, P2WPKHInP2SHAddress
+)
 from ..exceptions import DerivationError
 from ..derivations import (
     IDerivation, BIP49Derivation
@@ -21,6 +23,8 @@ from .bip44 import BIP44HD
 
 class BIP49HD(BIP44HD):
 
+    __slots__ = ()
+
     _derivation: BIP49Derivation
 
     def __init__(
@@ -74,8 +78,7 @@ class BIP49HD(BIP44HD):
 
         self.clean_derivation()
         self._derivation = derivation
-        for index in self._derivation.indexes():
-            self.drive(index)
+        self.drive_indexes(indexes=self._derivation.indexes())
         return self
 
     def root_xprivate_key(
@@ -159,8 +162,9 @@ class BIP49HD(BIP44HD):
         :rtype: str
         """
 
-        return P2WPKHInP2SHAddress.encode(
-            public_key=self._public_key,
+        return ADDRESSES.encode_public_key_hash(
+            name=P2WPKHInP2SHAddress.name(),
+            public_key_hash=self._node.hash(),
             script_address_prefix=script_address_prefix,
             public_key_type=self._public_key_type
         )
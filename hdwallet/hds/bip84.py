@@ -11,7 +11,9 @@ from typing import (
 from ..cryptocurrencies import Bitcoin
 from ..eccs import IEllipticCurveCryptography
 from ..consts import PUBLIC_KEY_TYPES
-from ..addresses import P2WPKHAddress
+from ..addresses import (
+    ADDRESSES, P2WPKHAddress
+)
 from ..exceptions import DerivationError
 from ..derivations import (
     IDerivation, BIP84Derivation
@@ -21,6 +23,8 @@ from .bip44 import BIP44HD
 
 class BIP84HD(BIP44HD):
 
+    __slots__ = ()
+
     _derivation: BIP84Derivation
 
     def __init__(
@@ -75,8 +79,7 @@ class BIP84HD(BIP44HD):
 
         self.clean_derivation()
         self._derivation = derivation
-        for index in self._derivation.indexes():
-            self.drive(index)
+        self.drive_indexes(indexes=self._derivation.indexes())
         return self
 
     def root_xprivate_key(
@@ -166,8 +169,9 @@ class BIP84HD(BIP44HD):
         :rtype: str
         """
 
-        return P2WPKHAddress.encode(
-            public_key=self._public_key,
+        return ADDRESSES.encode_public_key_hash(
+            name=P2WPKHAddress.name(),
+            public_key_hash=self._node.hash(),
             hrp=hrp,
             witness_version=witness_version,
             public_key_type=self._public_key_type
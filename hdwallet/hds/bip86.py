@@ -21,6 +21,8 @@ from .bip44 import BIP44HD
 
 class BIP86HD(BIP44HD):
 
+    __slots__ = ()
+
     _derivation: BIP86Derivation
 
     def __init__(
@@ -73,8 +75,7 @@ class BIP86HD(BIP44HD):
 
         self.clean_derivation()
         self._derivation = derivation
-        for index in self._derivation.indexes():
-            self.drive(index)
+        self.drive_indexes(indexes=self._derivation.indexes())
         return self
 
     def root_xprivate_key(
@@ -40,6 +40,8 @@ from .bip32 import BIP32HD
 
 class CardanoHD(BIP32HD):
 
+    __slots__ = ("_cardano_type",)
+
     _cardano_type: str
 
     def __init__(self, cardano_type: str) -> None:
@@ -282,17 +284,17 @@ class CardanoHD(BIP32HD):
             if index & 0x80000000:
                 if self._private_key is None:
                     raise DerivationError("Hardened derivation path is invalid for xpublic key")
-                z_hmac: bytes = hmac_sha512(self._chain_code, (
+                z_hmac: bytes = self._node.chain_code_hmac().compute((
                     b"\x00" + self._private_key.raw() + index_bytes
                 ))
-                _hmac: bytes = hmac_sha512(self._chain_code, (
+                _hmac: bytes = self._node.chain_code_hmac().compute((
                     b"\x01" + self._private_key.raw() + index_bytes
                 ))
             else:
-                z_hmac: bytes = hmac_sha512(self._chain_code, (
+                z_hmac: bytes = self._node.chain_code_hmac().compute((
                     b"\x02" + self._public_key.raw_compressed()[1:] + index_bytes
                 ))
-                _hmac: bytes = hmac_sha512(self._chain_code, (
+                _hmac: bytes = self._node.chain_code_hmac().compute((
                     b"\x03" + self._public_key.raw_compressed()[1:] + index_bytes
                 ))
 
@@ -355,16 +357,16 @@ class CardanoHD(BIP32HD):
                 get_bytes(self.fingerprint())
             )
             self._public_key = self._private_key.public_key()
-            self._depth, self._index, self._fingerprint = (
-                (self._depth + 1), index, get_bytes(self.fingerprint())
+            self._depth, self._index = (
+                (self._depth + 1), index
             )
         else:
             if index & 0x80000000:
                 raise DerivationError("Hardened derivation path is invalid for xpublic key")
-            z_hmac: bytes = hmac_sha512(self._chain_code, (
+            z_hmac: bytes = self._node.chain_code_hmac().compute((
                 b"\x02" + self._public_key.raw_compressed()[1:] + index_bytes
             ))
-            _hmac: bytes = hmac_sha512(self._chain_code, (
+            _hmac: bytes = self._node.chain_code_hmac().compute((
                 b"\x03" + self._public_key.raw_compressed()[1:] + index_bytes
             ))
 
@@ -393,8 +395,8 @@ class CardanoHD(BIP32HD):
             self._chain_code, self._public_key = (
                 _hmacr, new_public_key
             )
-            self._depth, self._index, self._fingerprint = (
-                (self._depth + 1), index, get_bytes(self.fingerprint())
+            self._depth, self._index = (
+                (self._depth + 1), index
             )
         return self
 
@@ -34,14 +34,19 @@ from ..ihd import IHD
 
 class ElectrumV1HD(IHD):
 
-    _seed: Optional[bytes] = None
+    __slots__ = (
+        "_seed", "_master_private_key", "_master_public_key", "_private_key", "_public_key",
+        "_public_key_type", "_wif_type", "_wif_prefix"
+    )
+
+    _seed: Optional[bytes]
     _master_private_key: Optional[IPrivateKey]
     _master_public_key: IPublicKey
     _private_key: Optional[IPrivateKey]
     _public_key: IPublicKey
     _public_key_type: str
     _wif_type: str
-    _wif_prefix: Optional[int] = None
+    _wif_prefix: Optional[int]
     _derivation: ElectrumDerivation
 
     def __init__(self, public_key_type: str = PUBLIC_KEY_TYPES.UNCOMPRESSED, **kwargs) -> None:
@@ -67,6 +72,7 @@ class ElectrumV1HD(IHD):
             )
         self._wif_prefix = kwargs.get("wif_prefix", Bitcoin.NETWORKS.MAINNET.WIF_PREFIX)
         self._public_key_type = public_key_type
+        self._seed = None
         self._master_private_key = None
         self._private_key = None
         self._derivation = ElectrumDerivation(
@@ -230,6 +236,50 @@ class ElectrumV1HD(IHD):
         self.__update__()
         return self
 
+    def to_state(self) -> bytes:
+        """
+        Serializes the master and current keys and the derivation into a compact state.
+
+        :return: The state bytes.
+        :rtype: bytes
+        """
+
+        return self._pack_state(
+            self._public_key_type, self._wif_prefix, self._seed,
+            self._master_private_key.raw() if self._master_private_key else None,
+            self._master_public_key.raw_compressed(),
+            self._private_key.raw() if self._private_key else None,
+            self._public_key.raw_compressed()
+        )
+
+    def from_state(self, state: bytes) -> "ElectrumV1HD":
+        """
+        Restores the ElectrumV1HD instance from a state produced by :meth:`to_state`, without deriving any key.
+
+        :param state: The state bytes.
+        :type state: bytes
+
+        :return: The restored ElectrumV1HD instance.
+        :rtype: ElectrumV1HD
+        """
+
+        (
+            public_key_type, wif_prefix, seed, master_private_key, master_public_key, private_key, public_key
+        ) = self._unpack_state(state)
+        self._public_key_type = public_key_type
+        self._wif_type = (
+            WIF_TYPES.WIF if public_key_type == PUBLIC_KEY_TYPES.UNCOMPRESSED else WIF_TYPES.WIF_COMPRESSED
+        )
+        self._wif_prefix = wif_prefix
+        self._seed = seed
+        self._master_private_key = (
+            SLIP10Secp256k1PrivateKey.from_bytes(master_private_key) if master_private_key else None
+        )
+        self._master_public_key = SLIP10Secp256k1PublicKey.from_bytes(master_public_key)
+        self._private_key = SLIP10Secp256k1PrivateKey.from_bytes(private_key) if private_key else None
+        self._public_key = SLIP10Secp256k1PublicKey.from_bytes(public_key)
+        return self
+
     def drive(self, change_index: int, address_index: int) -> "ElectrumV1HD":
         """
         Drives the HD wallet by calculating keys based on the given change and address indexes.
@@ -31,10 +31,13 @@ from ..ihd import IHD
 
 class ElectrumV2HD(IHD):
 
+    __slots__ = ("_mode", "_wif_type", "_public_key_type", "_wif_prefix", "_bip32_hd")
+
     _mode: str
     _wif_type: str
     _public_key_type: str
-    _wif_prefix: Optional[int] = None
+    _wif_prefix: Optional[int]
+    _bip32_hd: BIP32HD
     _derivation: ElectrumDerivation
 
     def __init__(
@@ -72,7 +75,7 @@ class ElectrumV2HD(IHD):
             )
         self._wif_prefix = kwargs.get("wif_prefix", Bitcoin.NETWORKS.MAINNET.WIF_PREFIX)
         self._public_key_type = public_key_type
-        self._bip32_hd: BIP32HD = BIP32HD(
+        self._bip32_hd = BIP32HD(
             ecc=Bitcoin.ECC, public_key_type=self._public_key_type
         )
         self._derivation = ElectrumDerivation(
@@ -166,6 +169,51 @@ class ElectrumV2HD(IHD):
         self.__update__()
         return self
 
+    def to_state(self) -> bytes:
+        """
+        Serializes the mode, the inner BIP32 HD and the derivation into a compact state.
+
+        :return: The state bytes.
+        :rtype: bytes
+        """
+
+        return self._pack_state(
+            self._mode, self._public_key_type, self._wif_prefix, self._bip32_hd.to_state()
+        )
+
+    def from_state(self, state: bytes) -> "ElectrumV2HD":
+        """
+        Restores the ElectrumV2HD instance from a state produced by :meth:`to_state`, without deriving any key.
+
+        :param state: The state bytes.
+        :type state: bytes
+
+        :return: The restored ElectrumV2HD instance.
+        :rtype: ElectrumV2HD
+        """
+
+        mode, public_key_type, wif_prefix, bip32_state = self._unpack_state(state)
+        self._mode = mode
+        self._public_key_type = public_key_type
+        self._wif_type = (
+            WIF_TYPES.WIF if public_key_type == PUBLIC_KEY_TYPES.UNCOMPRESSED else WIF_TYPES.WIF_COMPRESSED
+        )
+        self._wif_prefix = wif_prefix
+        self._bip32_hd.from_state(bip32_state)
+        return self
+
+    def fork(self) -> "ElectrumV2HD":
+        """
+        Creates an independent copy of the ElectrumV2HD instance at its current derivation.
+
+        :return: The forked ElectrumV2HD instance.
+        :rtype: ElectrumV2HD
+        """
+
+        hd: ElectrumV2HD = super(ElectrumV2HD, self).fork()
+        hd._bip32_hd = self._bip32_hd.fork()
+        return hd
+
     def drive(self, change_index: int, address_index: int) -> "ElectrumV2HD":
         """
         Drive the derivation of keys based on the change index and address index.
@@ -5,15 +5,25 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Union, List, Optional
+    Any, Union, List, Optional, Tuple
 )
 
+import copy
+
 from ..eccs import IEllipticCurveCryptography
-from ..derivations import IDerivation
+from ..derivations import (
+    IDerivation, DERIVATIONS
+)
+from ..exceptions import HDError
+from ..utils import (
+    pack_state, unpack_state
+)
 
 
 class IHD:
 
+    __slots__ = ("_ecc", "_derivation")
+
     _ecc: IEllipticCurveCryptography
     _derivation: IDerivation
 
@@ -164,6 +174,58 @@ class IHD:
         :rtype: HD
         """
 
+    def fork(self) -> "IHD":
+        """
+        Creates an independent copy of the HD instance at its current derivation.
+
+        The seed, root and derived keys are immutable and shared with the fork, only the
+        derivation state is copied, so driving the fork never affects this instance.
+
+        :return: The forked HD instance.
+        :rtype: HD
+        """
+
+        hd: IHD = copy.copy(self)
+        hd._derivation = copy.deepcopy(self._derivation)
+        return hd
+
+    def to_state(self) -> bytes:
+        """
+        Serializes the key material and the current derivation of the HD instance into a compact state.
+
+        The state holds raw keys and the derivation components, so :meth:`from_state` rebuilds the
+        instance without any seed processing or key derivation. It contains private keys and must be
+        protected like them.
+
+        :return: The state bytes.
+        :rtype: bytes
+        """
+
+    def from_state(self, state: bytes) -> "IHD":
+        """
+        Restores the HD instance from a state produced by :meth:`to_state` of the same HD class.
+
+        :param state: The state bytes.
+        :type state: bytes
+
+        :return: The restored HD instance.
+        :rtype: HD
+        """
+
+    def _pack_state(self, *values: Any) -> bytes:
+        return pack_state((
+            self.name(), self._derivation.name(), self._derivation.derivations(), *values
+        ))
+
+    def _unpack_state(self, state: bytes) -> Tuple[Any, ...]:
+        values: Tuple[Any, ...] = unpack_state(state)
+        if len(values) < 3 or values[0] != self.name():
+            raise HDError(
+                f"Invalid {self.name()} state", expected=self.name(), got=(values[0] if values else None)
+            )
+        self._derivation = DERIVATIONS.from_derivations(name=values[1], derivations=list(values[2]))
+        return values[3:]
+
     def derivation(self) -> IDerivation:
         """
         Retrieves the derivation method used for key generation.
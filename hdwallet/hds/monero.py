@@ -31,9 +31,13 @@ from .ihd import IHD
 
 class MoneroHD(IHD):
 
+    __slots__ = (
+        "_network", "_seed", "_private_key", "_spend_private_key", "_view_private_key", "_spend_public_key", "_view_public_key"
+    )
+
     _network: INetwork
-    _seed: Optional[bytes] = None
-    _private_key: Optional[bytes] = None
+    _seed: Optional[bytes]
+    _private_key: Optional[bytes]
 
     _spend_private_key: Optional[IPrivateKey]
     _view_private_key: Union[IPrivateKey]
@@ -55,6 +59,8 @@ class MoneroHD(IHD):
         super(MoneroHD, self).__init__(
             ecc=SLIP10Ed25519MoneroECC, **kwargs
         )
+        self._seed = None
+        self._private_key = None
 
         try:
             if not isinstance(network, str) and issubclass(network, INetwork):
@@ -184,6 +190,45 @@ class MoneroHD(IHD):
         self.__update__()
         return self
 
+    def to_state(self) -> bytes:
+        """
+        Serializes the network, the spend and view keys and the derivation into a compact state.
+
+        :return: The state bytes.
+        :rtype: bytes
+        """
+
+        return self._pack_state(
+            self._network.NAME, self._seed, self._private_key,
+            self._spend_private_key.raw() if self._spend_private_key else None,
+            self._view_private_key.raw(), self._spend_public_key.raw_compressed(), self._view_public_key.raw_compressed()
+        )
+
+    def from_state(self, state: bytes) -> "MoneroHD":
+        """
+        Restores the MoneroHD instance from a state produced by :meth:`to_state`, without deriving any key.
+
+        :param state: The state bytes.
+        :type state: bytes
+
+        :return: The restored MoneroHD instance.
+        :rtype: MoneroHD
+        """
+
+        (
+            network, seed, private_key, spend_private_key, view_private_key, spend_public_key, view_public_key
+        ) = self._unpack_state(state)
+        self._network = Monero.NETWORKS.get_network(network=network)
+        self._seed = seed
+        self._private_key = private_key
+        self._spend_private_key = (
+            SLIP10Ed25519MoneroPrivateKey.from_bytes(spend_private_key) if spend_private_key else None
+        )
+        self._view_private_key = SLIP10Ed25519MoneroPrivateKey.from_bytes(view_private_key)
+        self._spend_public_key = SLIP10Ed25519MoneroPublicKey.from_bytes(spend_public_key)
+        self._view_public_key = SLIP10Ed25519MoneroPublicKey.from_bytes(view_public_key)
+        return self
+
     def from_spend_private_key(self, spend_private_key: Union[bytes, str, IPrivateKey]) -> "MoneroHD":
         """
         Initialize the MoneroHD instance from a spend private key.
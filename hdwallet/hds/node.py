@@ -0,0 +1,547 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Any, Optional, Union, Tuple, Type
+)
+
+import hashlib
+import struct
+
+from ..eccs import (
+    IPoint, IPublicKey, IPrivateKey, IEllipticCurveCryptography, KholawEd25519PrivateKey
+)
+from ..eccs.slip10.secp256k1 import SLIP10Secp256k1PublicKeyCoincurve
+from ..consts import PUBLIC_KEY_TYPES
+from ..crypto import (
+    HMACSHA512, hash160
+)
+from ..exceptions import (
+    Error, DerivationError
+)
+from ..utils import (
+    bytes_to_integer, integer_to_bytes
+)
+
+
+class BIP32Node:
+    """
+    Immutable value object holding a single node of a BIP32/SLIP10 key tree.
+
+    Keys are kept as raw bytes, the matching elliptic curve key objects are only
+    materialized on demand. Nodes are hashable, picklable and safe to share across
+    threads, and :meth:`child` derives a new node without touching the parent.
+    """
+
+    __slots__ = (
+        "_ecc",
+        "_chain_code",
+        "_private_key",
+        "_public_key",
+        "_depth",
+        "_index",
+        "_parent_fingerprint",
+        "_hash",
+        "_public_key_type",
+        "_private_key_object",
+        "_public_key_object",
+        "_hmac"
+    )
+
+    _ecc: Type[IEllipticCurveCryptography]
+    _chain_code: Optional[bytes]
+    _private_key: Optional[bytes]
+    _public_key: Optional[bytes]
+    _depth: int
+    _index: int
+    _parent_fingerprint: Optional[bytes]
+    _hash: Optional[bytes]
+    _public_key_type: str
+    _private_key_object: Optional[IPrivateKey]
+    _public_key_object: Optional[IPublicKey]
+    _hmac: Optional[HMACSHA512]
+
+    def __init__(
+        self,
+        ecc: Type[IEllipticCurveCryptography],
+        chain_code: Optional[bytes] = None,
+        private_key: Optional[Union[bytes, IPrivateKey]] = None,
+        public_key: Optional[Union[bytes, IPublicKey]] = None,
+        depth: int = 0,
+        index: int = 0,
+        parent_fingerprint: Optional[bytes] = (integer_to_bytes(0x00) * 4),
+        public_key_type: str = PUBLIC_KEY_TYPES.COMPRESSED,
+        hash: Optional[bytes] = None
+    ) -> None:
+        """
+        Initialize a BIP32Node instance.
+
+        :param ecc: The elliptic curve cryptography class of the node.
+        :type ecc: Type[IEllipticCurveCryptography]
+        :param chain_code: The chain code of the node.
+        :type chain_code: Optional[bytes]
+        :param private_key: The private key as raw bytes or a private key object.
+        :type private_key: Optional[Union[bytes, IPrivateKey]]
+        :param public_key: The public key as raw bytes or a public key object, derived from the private key if omitted.
+        :type public_key: Optional[Union[bytes, IPublicKey]]
+        :param depth: The depth of the node, defaults to 0.
+        :type depth: int
+        :param index: The index of the node, defaults to 0.
+        :type index: int
+        :param parent_fingerprint: The fingerprint of the parent node, defaults to zero bytes.
+        :type parent_fingerprint: Optional[bytes]
+        :param public_key_type: The public key type hashed into the fingerprint, defaults to compressed.
+        :type public_key_type: str
+        :param hash: The precomputed HASH160 of the public key, computed once on demand if omitted.
+        :type hash: Optional[bytes]
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        if isinstance(ecc, IEllipticCurveCryptography):
+            ecc = type(ecc)
+
+        private_key_object: Optional[IPrivateKey] = None
+        if isinstance(private_key, IPrivateKey):
+            private_key_object, private_key = private_key, private_key.raw()
+        public_key_object: Optional[IPublicKey] = None
+        if isinstance(public_key, IPublicKey):
+            public_key_object, public_key = public_key, None
+
+        set_attribute = object.__setattr__
+        set_attribute(self, "_ecc", ecc)
+        set_attribute(self, "_chain_code", chain_code)
+        set_attribute(self, "_private_key", private_key)
+        set_attribute(self, "_public_key", public_key)
+        set_attribute(self, "_depth", depth)
+        set_attribute(self, "_index", index)
+        set_attribute(self, "_parent_fingerprint", parent_fingerprint)
+        set_attribute(self, "_hash", hash)
+        set_attribute(self, "_public_key_type", public_key_type)
+        set_attribute(self, "_private_key_object", private_key_object)
+        set_attribute(self, "_public_key_object", public_key_object)
+        set_attribute(self, "_hmac", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise Error(f"{type(self).__name__} is immutable, use replace() to create a modified copy")
+
+    def __delattr__(self, name: str) -> None:
+        raise Error(f"{type(self).__name__} is immutable, use replace() to create a modified copy")
+
+    def __reduce__(self) -> Tuple[type, tuple]:
+        return type(self), (
+            self._ecc,
+            self._chain_code,
+            self._private_key,
+            self.public_key(),
+            self._depth,
+            self._index,
+            self._parent_fingerprint,
+            self._public_key_type,
+            self._hash
+        )
+
+    def __key__(self) -> tuple:
+        return (
+            self._ecc.NAME,
+            self._chain_code,
+            self._private_key,
+            self.public_key(),
+            self._depth,
+            self._index,
+            self._parent_fingerprint,
+            self._public_key_type
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BIP32Node):
+            return NotImplemented
+        return self.__key__() == other.__key__()
+
+    def __hash__(self) -> int:
+        return hash(self.__key__())
+
+    def __repr__(self) -> str:
+        fingerprint: Optional[bytes] = self.fingerprint()
+        return (
+            f"{type(self).__name__}(ecc={self._ecc.NAME!r}, depth={self._depth}, index={self._index}, "
+            f"fingerprint={fingerprint.hex() if fingerprint else None!r}, private={self._private_key is not None})"
+        )
+
+    def replace(self, **kwargs) -> "BIP32Node":
+        """
+        Create a copy of the node with the given fields replaced.
+
+        Replacing the private key keeps the current public key, replacing the
+        public key drops the cached hash unless a new one is given.
+
+        :param kwargs: The fields to replace, any of the constructor arguments.
+        :type kwargs: dict
+
+        :return: The new node.
+        :rtype: BIP32Node
+        """
+
+        fields: dict = dict(
+            ecc=self._ecc,
+            chain_code=self._chain_code,
+            private_key=(
+                self._private_key_object if self._private_key_object is not None else self._private_key
+            ),
+            public_key=None,
+            depth=self._depth,
+            index=self._index,
+            parent_fingerprint=self._parent_fingerprint,
+            public_key_type=self._public_key_type,
+            hash=None
+        )
+        if "public_key" not in kwargs:
+            fields["public_key"] = (
+                self.ecc_public_key() if self._public_key_object is not None or "private_key" in kwargs
+                else self._public_key
+            )
+            if kwargs.get("public_key_type", self._public_key_type) == self._public_key_type:
+                fields["hash"] = self._hash
+        fields.update(kwargs)
+        return type(self)(**fields)
+
+    def ecc(self) -> Type[IEllipticCurveCryptography]:
+        """
+        Get the elliptic curve cryptography class of the node.
+
+        :return: The elliptic curve cryptography class.
+        :rtype: Type[IEllipticCurveCryptography]
+        """
+
+        return self._ecc
+
+    def chain_code(self) -> Optional[bytes]:
+        """
+        Get the chain code of the node.
+
+        :return: The chain code, or None if not set.
+        :rtype: Optional[bytes]
+        """
+
+        return self._chain_code
+
+    def private_key(self) -> Optional[bytes]:
+        """
+        Get the raw private key of the node.
+
+        :return: The raw private key, or None for public-only nodes.
+        :rtype: Optional[bytes]
+        """
+
+        return self._private_key
+
+    def public_key(self) -> Optional[bytes]:
+        """
+        Get the raw compressed public key of the node.
+
+        :return: The raw compressed public key, or None if the node holds no key.
+        :rtype: Optional[bytes]
+        """
+
+        if self._public_key is None:
+            public_key: Optional[IPublicKey] = self.ecc_public_key()
+            if public_key is None:
+                return None
+            object.__setattr__(self, "_public_key", public_key.raw_compressed())
+        return self._public_key
+
+    def ecc_private_key(self) -> Optional[IPrivateKey]:
+        """
+        Get the private key object of the node, created on first use.
+
+        :return: The private key object, or None for public-only nodes.
+        :rtype: Optional[IPrivateKey]
+        """
+
+        if self._private_key_object is None and self._private_key is not None:
+            object.__setattr__(self, "_private_key_object", self._ecc.PRIVATE_KEY.from_bytes(self._private_key))
+        return self._private_key_object
+
+    def ecc_public_key(self) -> Optional[IPublicKey]:
+        """
+        Get the public key object of the node, created on first use.
+
+        :return: The public key object, or None if the node holds no key.
+        :rtype: Optional[IPublicKey]
+        """
+
+        if self._public_key_object is None:
+            if self._public_key is not None:
+                object.__setattr__(self, "_public_key_object", self._ecc.PUBLIC_KEY.from_bytes(self._public_key))
+            elif self._private_key is not None:
+                object.__setattr__(self, "_public_key_object", self.ecc_private_key().public_key())
+        return self._public_key_object
+
+    def depth(self) -> int:
+        """
+        Get the depth of the node.
+
+        :return: The depth.
+        :rtype: int
+        """
+
+        return self._depth
+
+    def index(self) -> int:
+        """
+        Get the index of the node.
+
+        :return: The index.
+        :rtype: int
+        """
+
+        return self._index
+
+    def parent_fingerprint(self) -> Optional[bytes]:
+        """
+        Get the fingerprint of the parent node.
+
+        :return: The parent fingerprint.
+        :rtype: Optional[bytes]
+        """
+
+        return self._parent_fingerprint
+
+    def public_key_type(self) -> str:
+        """
+        Get the public key type hashed into the fingerprint.
+
+        :return: The public key type.
+        :rtype: str
+        """
+
+        return self._public_key_type
+
+    def hash(self) -> Optional[bytes]:
+        """
+        Get the HASH160 (RIPEMD-160 of SHA-256) of the node public key.
+
+        The hash is computed once per node and reused for its fingerprint, the
+        parent fingerprint of every child and the address encoders.
+
+        :return: The public key hash, or None if the node holds no key.
+        :rtype: Optional[bytes]
+        """
+
+        if self._hash is None:
+            public_key: Optional[IPublicKey] = self.ecc_public_key()
+            if public_key is None:
+                return None
+            object.__setattr__(self, "_hash", hash160(
+                public_key.raw_uncompressed() if self._public_key_type == PUBLIC_KEY_TYPES.UNCOMPRESSED
+                else public_key.raw_compressed()
+            ))
+        return self._hash
+
+    def fingerprint(self) -> Optional[bytes]:
+        """
+        Get the fingerprint of the node, the first 4 bytes of the public key HASH160.
+
+        :return: The fingerprint, or None if the node holds no key.
+        :rtype: Optional[bytes]
+        """
+
+        _hash: Optional[bytes] = self.hash()
+        return _hash[:4] if _hash else None
+
+    def chain_code_hmac(self) -> Optional[HMACSHA512]:
+        """
+        Get the HMAC-SHA512 context keyed with the chain code of the node.
+
+        The key schedule is computed once per node and shared by every child it derives.
+
+        :return: The HMAC-SHA512 context, or None if the node has no chain code.
+        :rtype: Optional[HMACSHA512]
+        """
+
+        if self._hmac is None and self._chain_code:
+            object.__setattr__(self, "_hmac", HMACSHA512(self._chain_code))
+        return self._hmac
+
+    def child_raw(self, index: int) -> Optional[Tuple[Optional[bytes], IPublicKey, bytes]]:
+        """
+        Derive the raw keys of the child at the given index, on SLIP10-Secp256k1 and SLIP10-Nist256p1.
+
+        This is the BIP32 child key derivation shared by :meth:`child` and
+        :meth:`hdwallet.hds.bip32.BIP32HD.derive_children`, which builds no node per child.
+
+        :param index: The index of the child, hardened indexes have the ``0x80000000`` bit set.
+        :type index: int
+
+        :return: The child private key bytes, or None for public derivation, the child public key
+                 and the child chain code, or None if the index yields an invalid key.
+        :rtype: Optional[Tuple[Optional[bytes], IPublicKey, bytes]]
+        """
+
+        if self._ecc.NAME not in [
+            "SLIP10-Nist256p1", "SLIP10-Secp256k1"
+        ]:
+            raise DerivationError(f"Raw child derivation is not supported on {self._ecc.NAME} ECC")
+        if not self._chain_code:
+            raise DerivationError("You can't drive xprivate_key and private_key")
+
+        index_bytes: bytes = struct.pack(">L", index)
+        if index & 0x80000000:
+            if self._private_key is None:
+                raise DerivationError("Hardened derivation path is invalid for xpublic key")
+            data_bytes: bytes = integer_to_bytes(0x00) + self._private_key + index_bytes
+        else:
+            data_bytes: bytes = self.ecc_public_key().raw_compressed() + index_bytes
+
+        _hmac: bytes = self.chain_code_hmac().compute(data_bytes)
+        _hmacl_int: int = bytes_to_integer(_hmac[:32])
+        if _hmacl_int >= self._ecc.ORDER:
+            return None
+
+        if self._private_key is not None:
+            key_int: int = (_hmacl_int + bytes_to_integer(self._private_key)) % self._ecc.ORDER
+            if key_int == 0:
+                return None
+            child_private_key: bytes = integer_to_bytes(key_int, bytes_num=32)
+            return child_private_key, self._ecc.PRIVATE_KEY.from_bytes(child_private_key).public_key(), _hmac[32:]
+
+        public_key: IPublicKey = self.ecc_public_key()
+        if isinstance(public_key, SLIP10Secp256k1PublicKeyCoincurve):
+            try:
+                return None, public_key.tweak_add(_hmac[:32]), _hmac[32:]
+            except ValueError:
+                return None
+        return None, self._ecc.PUBLIC_KEY.from_point(
+            public_key.point() + (self._ecc.GENERATOR * _hmacl_int)
+        ), _hmac[32:]
+
+    def child(self, index: int) -> Optional["BIP32Node"]:
+        """
+        Derive the child node at the given index.
+
+        :param index: The index of the child, hardened indexes have the ``0x80000000`` bit set.
+        :type index: int
+
+        :return: The child node, or None if the index yields an invalid key.
+        :rtype: Optional[BIP32Node]
+        """
+
+        hmac_half_length: int = hashlib.sha512().digest_size // 2
+        private_key: Optional[IPrivateKey] = self.ecc_private_key()
+        public_key: Optional[IPublicKey] = self.ecc_public_key()
+
+        if self._ecc.NAME == "Kholaw-Ed25519":
+            index_bytes: bytes = integer_to_bytes(
+                data=index, bytes_num=4, endianness="little"
+            )
+            if private_key:
+                if index & 0x80000000:
+                    z_hmac: bytes = self.chain_code_hmac().compute((
+                        integer_to_bytes(0x00) + private_key.raw() + index_bytes
+                    ))
+                    _hmac: bytes = self.chain_code_hmac().compute((
+                        integer_to_bytes(0x01) + private_key.raw() + index_bytes
+                    ))
+                else:
+                    z_hmac: bytes = self.chain_code_hmac().compute((
+                        integer_to_bytes(0x02) + public_key.raw_compressed()[1:] + index_bytes
+                    ))
+                    _hmac: bytes = self.chain_code_hmac().compute((
+                        integer_to_bytes(0x03) + public_key.raw_compressed()[1:] + index_bytes
+                    ))
+
+                zl: int = bytes_to_integer(z_hmac[:hmac_half_length][:28], endianness="little")
+                kl: int = bytes_to_integer(private_key.raw()[:hmac_half_length], endianness="little")
+                private_key_left: int = (zl * 8) + kl
+                if private_key_left % self._ecc.ORDER == 0:
+                    raise Error("Computed child key is not valid, very unlucky index")
+
+                zr: int = bytes_to_integer(z_hmac[hmac_half_length:], endianness="little")
+                kr: int = (zr + bytes_to_integer(private_key.raw()[hmac_half_length:], endianness="little")) % (2 ** 256)
+
+                return type(self)(
+                    ecc=self._ecc,
+                    chain_code=_hmac[hmac_half_length:],
+                    private_key=self._ecc.PRIVATE_KEY.from_bytes(
+                        integer_to_bytes(
+                            private_key_left, bytes_num=(KholawEd25519PrivateKey.length() // 2), endianness="little"
+                        ) + integer_to_bytes(
+                            kr, bytes_num=(KholawEd25519PrivateKey.length() // 2), endianness="little"
+                        )
+                    ),
+                    depth=(self._depth + 1),
+                    index=index,
+                    parent_fingerprint=self.fingerprint(),
+                    public_key_type=self._public_key_type
+                )
+
+            if index & 0x80000000:
+                raise DerivationError("Hardened derivation path is invalid for xpublic key")
+            z_hmac: bytes = self.chain_code_hmac().compute((
+                integer_to_bytes(0x02) + public_key.raw_compressed()[1:] + index_bytes
+            ))
+            _hmac: bytes = self.chain_code_hmac().compute((
+                integer_to_bytes(0x03) + public_key.raw_compressed()[1:] + index_bytes
+            ))
+
+            zl: int = bytes_to_integer(z_hmac[:hmac_half_length][:28], endianness="little")
+            new_public_key_point: IPoint = public_key.point() + ((zl * 8) * self._ecc.GENERATOR)
+            if new_public_key_point.x() == 0 and new_public_key_point.y() == 1:
+                raise Error("Computed public child key is not valid, very unlucky index")
+
+            return type(self)(
+                ecc=self._ecc,
+                chain_code=_hmac[hmac_half_length:],
+                public_key=self._ecc.PUBLIC_KEY.from_point(new_public_key_point),
+                depth=(self._depth + 1),
+                index=index,
+                parent_fingerprint=self.fingerprint(),
+                public_key_type=self._public_key_type
+            )
+
+        elif self._ecc.NAME in [
+            "SLIP10-Ed25519", "SLIP10-Ed25519-Blake2b", "SLIP10-Ed25519-Monero"
+        ]:
+            if not private_key:
+                raise DerivationError(
+                    f"On {self._ecc.NAME} ECC, public key derivation is not supported"
+                )
+
+            data_bytes: bytes = (
+                integer_to_bytes(0x00) + private_key.raw() + struct.pack(">L", index)
+            )
+            _hmac: bytes = self.chain_code_hmac().compute(data_bytes)
+
+            return type(self)(
+                ecc=self._ecc,
+                chain_code=_hmac[hmac_half_length:],
+                private_key=self._ecc.PRIVATE_KEY.from_bytes(_hmac[:hmac_half_length]),
+                depth=(self._depth + 1),
+                index=index,
+                parent_fingerprint=self.fingerprint(),
+                public_key_type=self._public_key_type
+            )
+
+        elif self._ecc.NAME in [
+            "SLIP10-Nist256p1", "SLIP10-Secp256k1"
+        ]:
+            child: Optional[Tuple[Optional[bytes], IPublicKey, bytes]] = self.child_raw(index)
+            if child is None:
+                return None
+
+            return type(self)(
+                ecc=self._ecc,
+                chain_code=child[2],
+                private_key=child[0],
+                public_key=child[1],
+                depth=(self._depth + 1),
+                index=index,
+                parent_fingerprint=self.fingerprint(),
+                public_key_type=self._public_key_type
+            )
+
+        raise DerivationError(f"Child derivation is not supported on {self._ecc.NAME} ECC")
@@ -5,9 +5,11 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Optional, Union, Any, Type, Tuple, List
+    Optional, Union, Any, Type, Tuple, List, Iterator, Callable, Sequence
 )
 
+import copy
+
 try:
     from . import environment
 except:
@@ -24,10 +26,11 @@ from .seeds import (
     ISeed, BIP39Seed, CardanoSeed, ElectrumV2Seed, SEEDS
 )
 from .hds import (
-    IHD, HDS
+    IHD, HDS, BIP32HD, BIP32Node
 )
+from .hds.bip32 import BIP32ChildKey
 from .eccs import (
-    IPrivateKey, IPublicKey, IEllipticCurveCryptography
+    IPrivateKey, IPublicKey, IEllipticCurveCryptography, ECCS
 )
 from .consts import (
     PUBLIC_KEY_TYPES, SEMANTICS, MODES
@@ -38,17 +41,22 @@ from .cryptocurrencies.icryptocurrency import (
 from .keys import (
     deserialize, is_valid_key
 )
+from .columns import DerivationColumns
+from .cache import (
+    ICache, RESULT_FIELDS, PRIVATE_FIELDS
+)
+from .crypto import sha256
 from .exceptions import (
-    Error, NetworkError, AddressError, CryptocurrencyError, XPrivateKeyError, PrivateKeyError
+    Error, NetworkError, AddressError, CryptocurrencyError, XPrivateKeyError, PrivateKeyError, HDError
 )
 from .utils import (
-    get_bytes, exclude_keys
+    get_bytes, exclude_keys, select_keys, pack_state, unpack_state
 )
 from .derivations import (
-    IDerivation, DERIVATIONS
+    IDerivation, DerivationPlan
 )
 from .addresses import (
-    IAddress, ADDRESSES
+    IAddress, P2WSHAddress, ADDRESSES
 )
 
 
@@ -57,6 +65,12 @@ class HDWallet:
     The HDWallet class represents a hierarchical deterministic wallet object designed for managing
     various cryptocurrencies. It encapsulates functionality related to cryptocurrency handling,
     including mnemonic generation, seed generation, address generation, and network configuration.
+
+    Thread safety: the ``from_*``, ``update_derivation`` and ``clean_derivation`` methods move the
+    wallet and must not run while other threads use it. Once the wallet is initialized, getters,
+    :meth:`dump`, :meth:`dumps`, :meth:`iter_derivations`, :meth:`columns`, :meth:`derive_children`
+    and :meth:`fork` leave it unchanged and can be called from several threads at once. To use
+    different derivations concurrently, give each thread or request its own :meth:`fork`.
     """
 
     _cryptocurrency: ICryptocurrency
@@ -85,6 +99,7 @@ class HDWallet:
     # Monero entropy
     _checksum: bool = True
     _kwargs: Any
+    _cache: Optional[ICache] = None
 
     _hd: IHD
 
@@ -107,7 +122,8 @@ class HDWallet:
         :type network: Union[str, Type[INetwork]]
         :param address: The address type to be used. Defaults to None.
         :type address: Optional[Union[str, Type[IAddress]]]
-        :param kwargs: Additional keyword arguments.
+        :param kwargs: Additional keyword arguments, e.g. ``cache`` for the :class:`hdwallet.cache.ICache`
+                       backend of :meth:`lookup`, such as ``LRUCache(max_size=100_000, ttl=3600)``.
         """
 
         if not issubclass(cryptocurrency, ICryptocurrency):
@@ -255,6 +271,9 @@ class HDWallet:
             "staking_public_key": kwargs.get("staking_public_key", None),
             "payment_id": kwargs.get("payment_id", None)
         }
+        if kwargs.get("cache") is not None and not isinstance(kwargs.get("cache"), ICache):
+            raise Error("Invalid cache instance", expected=ICache, got=type(kwargs.get("cache")))
+        self._cache = kwargs.get("cache")
 
         if hd.name() == "Algorand":
             self._hd = hd()
@@ -604,6 +623,236 @@ class HDWallet:
         self._derivation.clean()
         return self
 
+    def fork(self) -> "HDWallet":
+        """
+        Create an independent HDWallet sharing the root key material of this one.
+
+        The cryptocurrency, network, entropy, mnemonic, seed and root keys are shared
+        without running the seed derivation again, while the derivation state is copied,
+        so the fork can be moved with :meth:`update_derivation` without affecting this
+        wallet. BIP32 forks also share the derived node cache, which is thread-safe.
+        One wallet must not be used by several threads at once, fork one per thread or request.
+
+        :return: The forked HDWallet instance, at the same derivation as this one.
+        :rtype: HDWallet
+        """
+
+        hdwallet: HDWallet = copy.copy(self)
+        hdwallet._hd = self._hd.fork()
+        if self._derivation is not None:
+            hdwallet._derivation = (
+                hdwallet._hd.derivation() if self._derivation is self._hd.derivation() else copy.deepcopy(self._derivation)
+            )
+        return hdwallet
+
+    def to_state(self) -> bytes:
+        """
+        Serialize the wallet configuration, root key material and current derivation into a compact state.
+
+        The state holds the cryptocurrency symbol, network, HD, address, ECC and options such as
+        the semantic or public key type, and the :meth:`IHD.to_state` of the HD. Entropy, mnemonic
+        and passphrase are not included. It contains private keys and must be protected like them.
+
+        :return: The state bytes, usually a few hundred bytes.
+        :rtype: bytes
+        """
+
+        options: List[Tuple[str, Any]] = [
+            (key, value) for key, value in [
+                ("public_key_type", self._public_key_type),
+                ("cardano_type", self._cardano_type),
+                ("mode", self._mode),
+                ("mnemonic_type", self._mnemonic_type),
+                ("semantic", self._semantic),
+                ("checksum", self._checksum),
+                ("address_type", self._address_type),
+                ("address_prefix", self._address_prefix),
+                ("language", self._language),
+                ("staking_public_key", self._kwargs["staking_public_key"]),
+                ("payment_id", self._kwargs["payment_id"])
+            ] if value is not None
+        ]
+        return pack_state((
+            "HDWallet", self._cryptocurrency.SYMBOL, self._network.NAME, self._hd.name(), self._address.name(),
+            self._ecc.NAME, options, self._derivation is not None, self._hd.to_state()
+        ))
+
+    @classmethod
+    def from_state(cls, state: bytes) -> "HDWallet":
+        """
+        Rebuild a wallet from a state produced by :meth:`to_state`.
+
+        No seed, mnemonic or key derivation is run again, so the wallet is restored in
+        microseconds, e.g. in worker processes or from a cache.
+
+        :param state: The state bytes.
+        :type state: bytes
+
+        :return: The restored HDWallet instance, at the same derivation.
+        :rtype: HDWallet
+        """
+
+        from .cryptocurrencies import get_cryptocurrency
+
+        values: tuple = unpack_state(state)
+        if len(values) != 9 or values[0] != "HDWallet":
+            raise Error("Invalid HDWallet state", expected="HDWallet.to_state() bytes", got=(values[0] if values else None))
+        symbol, network, hd, address, ecc, options, derivation, hd_state = values[1:]
+
+        hdwallet: HDWallet = cls(
+            cryptocurrency=get_cryptocurrency(symbol=symbol),
+            hd=HDS.hd(name=hd),
+            network=network,
+            ecc=ECCS.ecc(name=ecc),
+            **dict(options)
+        )
+        if address not in hdwallet._cryptocurrency.ADDRESSES.get_addresses():
+            raise AddressError(
+                f"Wrong {hdwallet._cryptocurrency.NAME} address",
+                expected=hdwallet._cryptocurrency.ADDRESSES.get_addresses(),
+                got=address
+            )
+        hdwallet._address = ADDRESSES.address(name=address)
+        hdwallet._hd.from_state(hd_state)
+        if derivation:
+            hdwallet._derivation = hdwallet._hd.derivation()
+        return hdwallet
+
+    def derive_children(
+        self, parent_path: Optional[Union[str, IDerivation]] = None, start: int = 0, count: int = 1
+    ) -> List[BIP32ChildKey]:
+        """
+        Derive a batch of consecutive child keys of a single parent node.
+
+        :param parent_path: The derivation path of the parent node, e.g. ``m/44'/0'/0'/0``.
+                            If None, the current node is used as the parent.
+        :type parent_path: Optional[Union[str, IDerivation]]
+        :param start: The first child index. Defaults to 0.
+        :type start: int
+        :param count: The number of children to derive. Defaults to 1.
+        :type count: int
+
+        :return: The list of derived child key records.
+        :rtype: List[BIP32ChildKey]
+        """
+
+        if not isinstance(self._hd, BIP32HD):
+            raise HDError(f"Batch child derivation is not supported on {self._hd.name()} HD")
+        return self._hd.fork().derive_children(
+            parent_path=parent_path, start=start, count=count
+        )
+
+    def node(self, parent_path: Optional[Union[str, IDerivation]] = None) -> Optional[BIP32Node]:
+        """
+        Get the immutable BIP32 node at a derivation path without moving the wallet.
+
+        :param parent_path: The derivation path of the node, e.g. ``m/44'/0'/0'/0``.
+                            If None, the current node is returned.
+        :type parent_path: Optional[Union[str, IDerivation]]
+
+        :return: The node at the given path.
+        :rtype: Optional[BIP32Node]
+        """
+
+        if not isinstance(self._hd, BIP32HD):
+            raise HDError(f"Node access is not supported on {self._hd.name()} HD")
+        return self._hd.node(parent_path=parent_path)
+
+    def address_encoder(
+        self, address: Optional[Union[str, Type[IAddress]]] = None, **kwargs
+    ) -> Tuple[Type[IAddress], dict]:
+        """
+        Get an address encoder class together with the network specific arguments of this wallet.
+
+        :param address: The address name or class, defaults to the wallet address.
+        :type address: Optional[Union[str, Type[IAddress]]]
+        :param kwargs: Additional keyword arguments, ``address_type`` and ``address_prefix`` override the defaults.
+
+        :return: The address class and its keyword arguments, without the public key.
+        :rtype: Tuple[Type[IAddress], dict]
+        """
+
+        if address is None:
+            address = self._address.name()
+        elif not isinstance(address, str) and issubclass(address, IAddress):
+            address = address.name()
+        if address not in self._cryptocurrency.ADDRESSES.get_addresses():
+            raise AddressError(
+                f"Wrong {self._cryptocurrency.NAME} address",
+                expected=self._cryptocurrency.ADDRESSES.get_addresses(),
+                got=address
+            )
+        return ADDRESSES.address(name=address), self._address_options(address=address, **kwargs)
+
+    def cache(self) -> Optional[ICache]:
+        """
+        Get the result cache backend of :meth:`lookup`.
+
+        :return: The cache backend, or None if results are not cached.
+        :rtype: Optional[ICache]
+        """
+
+        return self._cache
+
+    def _cache_root(self) -> Optional[bytes]:
+        if isinstance(self._hd, BIP32HD):
+            root: Optional[BIP32Node] = self._hd._root_node
+            if root is None:
+                return None
+            material: bytes = root.public_key() + (root.chain_code() or b"")
+        elif self._hd.name() == "Monero":
+            material: bytes = get_bytes(self._hd.spend_public_key()) + get_bytes(self._hd.view_public_key())
+        else:
+            master_public_key: Optional[str] = self._hd.master_public_key()
+            if master_public_key is None:
+                return None
+            material: bytes = get_bytes(master_public_key)
+        return sha256(material)
+
+    def lookup(self, derivation: IDerivation, field: str = "address", **kwargs) -> Any:
+        """
+        Get one output of a derivation, served from the result cache when possible.
+
+        Results are cached by the root public key fingerprint, HD, network, semantic,
+        public key, Cardano and Electrum types, address, derivation path, field and
+        arguments, so a repeated lookup skips the derivation entirely. Private fields
+        (``private_key``, ``wif``, ``xprivate_key`` and the Monero private keys) are
+        never cached and are always derived. The wallet itself is left unchanged.
+
+        :param derivation: The derivation, without index ranges.
+        :type derivation: IDerivation
+        :param field: The getter to call on the derived wallet, defaults to ``address``.
+        :type field: str
+        :param kwargs: The getter keyword arguments, e.g. ``address="P2TR"``.
+
+        :return: The output of the getter.
+        :rtype: Any
+        """
+
+        if field not in RESULT_FIELDS and field not in PRIVATE_FIELDS:
+            raise Error("Invalid lookup field", expected=sorted(RESULT_FIELDS | PRIVATE_FIELDS), got=field)
+
+        key: Optional[tuple] = None
+        if self._cache is not None and field in RESULT_FIELDS:
+            root: Optional[bytes] = self._cache_root()
+            if root is not None:
+                key = (
+                    root, self._hd.name(), self._cryptocurrency.SYMBOL,
+                    f"{self._network.__module__}.{self._network.__qualname__}", self._semantic, self._public_key_type,
+                    self._cardano_type, self._mode, self._address.name(), self._address_type,
+                    derivation.name(), derivation.path(), field, tuple(sorted(kwargs.items()))
+                )
+                value: Any = self._cache.get(key, self._cache)
+                if value is not self._cache:
+                    return value
+
+        hdwallet: HDWallet = self.fork()
+        hdwallet.update_derivation(derivation=derivation)
+        value: Any = getattr(hdwallet, field)(**kwargs)
+        if key is not None:
+            self._cache.put(key, value)
+        return value
+
     def from_private_key(self, private_key: str) -> "HDWallet":
         """
         Initialize the HDWallet from a private key.
@@ -1490,40 +1739,112 @@ class HDWallet:
                     minor=kwargs.get("minor", None), major=kwargs.get("major", None)
                 )
         else:
-            if self._cryptocurrency.NAME in ["Bitcoin-Cash", "Bitcoin-Cash-SLP", "eCash"]:
-                return ADDRESSES.address(name=address).encode(
-                    public_key=self.public_key(),
-                    public_key_address_prefix=getattr(
-                        self._network, f"{kwargs.get('address_type', self._address_type).upper()}_PUBLIC_KEY_ADDRESS_PREFIX"
-                    ),
-                    script_address_prefix=getattr(
-                        self._network, f"{kwargs.get('address_type', self._address_type).upper()}_SCRIPT_ADDRESS_PREFIX"
-                    ),
-                    network_type=self._network.NAME,
-                    public_key_type=self.public_key_type(),
-                    hrp=self._network.HRP
+            if isinstance(self._hd, BIP32HD) and ADDRESSES.is_public_key_hash(name=address):
+                return ADDRESSES.encode_public_key_hash(
+                    name=address, public_key_hash=self._hd.hash(), **self._address_options(address=address, **kwargs)
                 )
+            public_key: Union[bytes, str] = (
+                self._hd.public_key_bytes() if isinstance(self._hd, BIP32HD) else self.public_key()
+            )
             return ADDRESSES.address(name=address).encode(
-                public_key=self.public_key(),
-                public_key_address_prefix=self._network.PUBLIC_KEY_ADDRESS_PREFIX,
-                script_address_prefix=self._network.SCRIPT_ADDRESS_PREFIX,
+                public_key=public_key, **self._address_options(address=address, **kwargs)
+            )
+
+    def _address_encoder(self) -> Callable[[str], str]:
+        """
+        Build an encoder of the current node addresses that shares work between address types.
+
+        On SLIP10-Secp256k1 BIP32 based HDs, the parsed public key, its HASH160 and the P2WSH
+        witness script hash are computed at most once and fed to every Bitcoin script encoder.
+        Other addresses are encoded with :meth:`address`.
+
+        :return: A function encoding the given address name of the current node.
+        :rtype: Callable[[str], str]
+        """
+
+        if not isinstance(self._hd, BIP32HD) or self._ecc.NAME != "SLIP10-Secp256k1":
+            return lambda address: self.address(address=address)
+
+        shared: dict = { }
+
+        def encode(address: str) -> str:
+            if address not in [
+                "P2PKH", "P2SH", "P2TR", "P2WPKH", "P2WPKH-In-P2SH", "P2WSH", "P2WSH-In-P2SH"
+            ] or address not in self._cryptocurrency.ADDRESSES.get_addresses():
+                return self.address(address=address)
+            if ADDRESSES.is_public_key_hash(name=address):
+                return ADDRESSES.encode_public_key_hash(
+                    name=address, public_key_hash=self._hd.node().hash(), **self._address_options(address=address)
+                )
+            if not shared:
+                shared.update(public_key=self._hd.node().ecc_public_key())
+            if address in ADDRESSES.witness_script_hash:
+                if "witness_script_hash" not in shared:
+                    shared["witness_script_hash"] = P2WSHAddress.script_hash(
+                        shared["public_key"], public_key_type=self.public_key_type()
+                    )
+                return ADDRESSES.encode_witness_script_hash(
+                    name=address,
+                    witness_script_hash=shared["witness_script_hash"],
+                    **self._address_options(address=address)
+                )
+            return ADDRESSES.address(name=address).encode(
+                public_key=shared["public_key"], **self._address_options(address=address)
+            )
+
+        return encode
+
+    def _address_options(self, address: str, **kwargs) -> dict:
+        """
+        Build the network specific encoder arguments of a public key address.
+
+        :param address: The address name.
+        :type address: str
+        :param kwargs: Additional keyword arguments, ``address_type`` and ``address_prefix`` override the defaults.
+
+        :return: The keyword arguments for the address encoder, without the public key.
+        :rtype: dict
+        """
+
+        if self._cryptocurrency.NAME in ["Bitcoin-Cash", "Bitcoin-Cash-SLP", "eCash"]:
+            return dict(
+                public_key_address_prefix=getattr(
+                    self._network, f"{kwargs.get('address_type', self._address_type).upper()}_PUBLIC_KEY_ADDRESS_PREFIX"
+                ),
+                script_address_prefix=getattr(
+                    self._network, f"{kwargs.get('address_type', self._address_type).upper()}_SCRIPT_ADDRESS_PREFIX"
+                ),
                 network_type=self._network.NAME,
                 public_key_type=self.public_key_type(),
-                hrp=self._network.HRP,
-                address_type=kwargs.get(
-                    "address_type", self._address_type
-                ),
-                address_prefix=kwargs.get(
-                    "address_prefix", self._address_prefix  # Tezos
-                )
+                hrp=self._network.HRP
             )
+        return dict(
+            public_key_address_prefix=self._network.PUBLIC_KEY_ADDRESS_PREFIX,
+            script_address_prefix=self._network.SCRIPT_ADDRESS_PREFIX,
+            network_type=self._network.NAME,
+            public_key_type=self.public_key_type(),
+            hrp=self._network.HRP,
+            address_type=kwargs.get(
+                "address_type", self._address_type
+            ),
+            address_prefix=kwargs.get(
+                "address_prefix", self._address_prefix  # Tezos
+            )
+        )
 
-    def dump(self, exclude: Optional[set] = None) -> dict:
+    def dump(self, exclude: Optional[set] = None, include: Optional[set] = None) -> dict:
         """
         Dump the state of the HD wallet and related information into a dictionary.
 
+        Every field is computed lazily, so fields left out by ``include`` or ``exclude``
+        are never derived, serialized or encoded. ``include`` takes key names, which
+        match at any depth, or ``parent:key`` pairs such as ``at:path`` or ``addresses:p2pkh``;
+        a nested dictionary named in ``include`` is kept whole.
+
         :param exclude: Optional set of keys to exclude from the dump.
         :type exclude: Optional[set]
+        :param include: Optional set of keys to restrict the dump to, defaults to every key.
+        :type include: Optional[set]
 
         :return: The dictionary containing the dumped information.
         :rtype: dict
@@ -1584,17 +1905,17 @@ class HDWallet:
             "Algorand", "BIP32", "BIP44", "BIP49", "BIP84", "BIP86", "BIP141", "Cardano"
         ]:
             derivation.update(
-                xprivate_key=self.xprivate_key(),
-                xpublic_key=self.xpublic_key(),
-                private_key=self.private_key(),
-                wif=self.wif(),
-                chain_code=self.chain_code(),
-                public_key=self.public_key(),
-                uncompressed=self.uncompressed(),
-                compressed=self.compressed(),
-                hash=self.hash(),
-                fingerprint=self.fingerprint(),
-                parent_fingerprint=self.parent_fingerprint()
+                xprivate_key=self.xprivate_key,
+                xpublic_key=self.xpublic_key,
+                private_key=self.private_key,
+                wif=self.wif,
+                chain_code=self.chain_code,
+                public_key=self.public_key,
+                uncompressed=self.uncompressed,
+                compressed=self.compressed,
+                hash=self.hash,
+                fingerprint=self.fingerprint,
+                parent_fingerprint=self.parent_fingerprint
             )
             if self._hd.name() in ["Algorand", "Cardano"]:
                 del derivation["wif"]
@@ -1607,60 +1928,67 @@ class HDWallet:
             ):
                 addresses: dict = { }
                 if self._cryptocurrency.NAME == "Avalanche":
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.C_CHAIN] = self.address(address="Ethereum")
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.P_CHAIN] = self.address(
+                    addresses[self._cryptocurrency.ADDRESS_TYPES.C_CHAIN] = lambda: self.address(address="Ethereum")
+                    addresses[self._cryptocurrency.ADDRESS_TYPES.P_CHAIN] = lambda: self.address(
                         address="Avalanche", address_type=self._cryptocurrency.ADDRESS_TYPES.P_CHAIN
                     )
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.X_CHAIN] = self.address(
+                    addresses[self._cryptocurrency.ADDRESS_TYPES.X_CHAIN] = lambda: self.address(
                         address="Avalanche", address_type=self._cryptocurrency.ADDRESS_TYPES.X_CHAIN
                     )
                 elif self._cryptocurrency.NAME == "Binance":
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.CHAIN] = self.address(address="Cosmos")
-                    addresses[self._cryptocurrency.ADDRESS_TYPES.SMART_CHAIN] = self.address(address="Ethereum")
+                    addresses[self._cryptocurrency.ADDRESS_TYPES.CHAIN] = lambda: self.address(address="Cosmos")
+                    addresses[self._cryptocurrency.ADDRESS_TYPES.SMART_CHAIN] = lambda: self.address(address="Ethereum")
                 elif self._cryptocurrency.NAME in ["Bitcoin-Cash", "Bitcoin-Cash-SLP", "eCash"]:
                     for address_type in self._cryptocurrency.ADDRESS_TYPES.get_address_types():
                         for address in self._cryptocurrency.ADDRESSES.get_addresses():
-                            addresses[f"{address_type}-{address.lower()}"] = ADDRESSES.address(name=address).encode(
-                                public_key=self.public_key(),
-                                public_key_address_prefix=getattr(
-                                    self._network, f"{address_type.upper()}_PUBLIC_KEY_ADDRESS_PREFIX"
-                                ),
-                                script_address_prefix=getattr(
-                                    self._network, f"{address_type.upper()}_SCRIPT_ADDRESS_PREFIX"
-                                ),
-                                public_key_type=self.public_key_type(),
-                                hrp=self._network.HRP
+                            addresses[f"{address_type}-{address.lower()}"] = (
+                                lambda address_type=address_type, address=address: ADDRESSES.address(
+                                    name=address
+                                ).encode(
+                                    public_key=self._hd.public_key_bytes(),
+                                    public_key_address_prefix=getattr(
+                                        self._network, f"{address_type.upper()}_PUBLIC_KEY_ADDRESS_PREFIX"
+                                    ),
+                                    script_address_prefix=getattr(
+                                        self._network, f"{address_type.upper()}_SCRIPT_ADDRESS_PREFIX"
+                                    ),
+                                    public_key_type=self.public_key_type(),
+                                    hrp=self._network.HRP
+                                )
                             )
                 elif self._cryptocurrency.NAME == "Tezos":
-                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ1] = self.address(
+                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ1] = lambda: self.address(
                         address_prefix=self._cryptocurrency.ADDRESS_PREFIXES.TZ1
                     )
-                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ2] = self.address(
+                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ2] = lambda: self.address(
                         address_prefix=self._cryptocurrency.ADDRESS_PREFIXES.TZ2
                     )
-                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ3] = self.address(
+                    addresses[self._cryptocurrency.ADDRESS_PREFIXES.TZ3] = lambda: self.address(
                         address_prefix=self._cryptocurrency.ADDRESS_PREFIXES.TZ3
                     )
                 elif self._hd.name() == "BIP44":
-                    derivation["address"] = self.address(address="P2PKH")
+                    derivation["address"] = lambda: self.address(address="P2PKH")
                 elif self._hd.name() == "BIP49":
-                    derivation["address"] = self.address(address="P2WPKH-In-P2SH")
+                    derivation["address"] = lambda: self.address(address="P2WPKH-In-P2SH")
                 elif self._hd.name() == "BIP84":
-                    derivation["address"] = self.address(address="P2WPKH")
+                    derivation["address"] = lambda: self.address(address="P2WPKH")
                 elif self._hd.name() == "BIP86":
-                    derivation["address"] = self.address(address="P2TR")
+                    derivation["address"] = lambda: self.address(address="P2TR")
                 elif self._hd.name() == "BIP141":
                     if self._semantic == SEMANTICS.P2WPKH:
-                        derivation["address"] = self.address(address="P2WPKH")
+                        derivation["address"] = lambda: self.address(address="P2WPKH")
                     elif self._semantic == SEMANTICS.P2WPKH_IN_P2SH:
-                        derivation["address"] = self.address(address="P2WPKH-In-P2SH")
+                        derivation["address"] = lambda: self.address(address="P2WPKH-In-P2SH")
                     elif self._semantic == SEMANTICS.P2WSH:
-                        derivation["address"] = self.address(address="P2WSH")
+                        derivation["address"] = lambda: self.address(address="P2WSH")
                     elif self._semantic == SEMANTICS.P2WSH_IN_P2SH:
-                        derivation["address"] = self.address(address="P2WSH-In-P2SH")
+                        derivation["address"] = lambda: self.address(address="P2WSH-In-P2SH")
                 else:
+                    encode: Callable[[str], str] = self._address_encoder()
                     for address in self._cryptocurrency.ADDRESSES.get_addresses():
-                        addresses[address.lower().replace("-", "_")] = self.address(address=address)
+                        addresses[address.lower().replace("-", "_")] = (
+                            lambda address=address: encode(address)
+                        )
                 if addresses:
                     derivation["addresses"] = addresses
             else:
@@ -1668,65 +1996,65 @@ class HDWallet:
                     self._cryptocurrency.NAME == "Cardano" and
                     self._cardano_type in ["shelley-icarus", "shelley-ledger"]
                 ):
-                    derivation["address"] = self.address(
+                    derivation["address"] = lambda: self.address(
                         address_type=self._address_type, staking_public_key=self._kwargs.get("staking_public_key")
                     )
                 else:
-                    derivation["address"] = self.address()
+                    derivation["address"] = self.address
 
         elif self._hd.name() in ["Electrum-V1", "Electrum-V2"]:
             derivation.update(
-                private_key=self.private_key(),
-                wif=self.wif(),
-                public_key=self.public_key(),
-                uncompressed=self.uncompressed(),
-                compressed=self.compressed(),
-                address=self.address()
+                private_key=self.private_key,
+                wif=self.wif,
+                public_key=self.public_key,
+                uncompressed=self.uncompressed,
+                compressed=self.compressed,
+                address=self.address
             )
         elif self._hd.name() == "Monero":
             derivation.update(
-                sub_address=self.sub_address()
+                sub_address=self.sub_address
             )
 
         if "at" in exclude:
             del derivation["at"]
 
         if "root" in exclude:
-            return exclude_keys(derivation, exclude)
+            return select_keys(derivation, include, exclude)
 
         _root: dict = dict(
-            cryptocurrency=self.cryptocurrency(),
-            symbol=self.symbol(),
-            network=self.network(),
-            coin_type=self.coin_type(),
-            entropy=self.entropy(),
-            strength=self.strength(),
-            mnemonic=self.mnemonic(),
-            passphrase=self.passphrase(),
-            language=self.language(),
-            seed=self.seed(),
-            ecc=self.ecc(),
-            hd=self.hd()
+            cryptocurrency=self.cryptocurrency,
+            symbol=self.symbol,
+            network=self.network,
+            coin_type=self.coin_type,
+            entropy=self.entropy,
+            strength=self.strength,
+            mnemonic=self.mnemonic,
+            passphrase=self.passphrase,
+            language=self.language,
+            seed=self.seed,
+            ecc=self.ecc,
+            hd=self.hd
         )
         if self._hd.name() in [
             "Algorand", "BIP32", "BIP44", "BIP49", "BIP84", "BIP86", "BIP141", "Cardano"
         ]:
             if self._hd.name() == "Cardano":
                 _root.update(
-                    cardano_type=self.cardano_type()
+                    cardano_type=self.cardano_type
                 )
             _root.update(
-                semantic=self.semantic(),
-                root_xprivate_key=self.root_xprivate_key(),
-                root_xpublic_key=self.root_xpublic_key(),
-                root_private_key=self.root_private_key(),
-                root_wif=self.root_wif(),
-                root_chain_code=self.root_chain_code(),
-                root_public_key=self.root_public_key(),
-                path_key=self.path_key(),
-                strict=self.strict(),
-                public_key_type=self.public_key_type(),
-                wif_type=self.wif_type()
+                semantic=self.semantic,
+                root_xprivate_key=self.root_xprivate_key,
+                root_xpublic_key=self.root_xpublic_key,
+                root_private_key=self.root_private_key,
+                root_wif=self.root_wif,
+                root_chain_code=self.root_chain_code,
+                root_public_key=self.root_public_key,
+                path_key=self.path_key,
+                strict=self.strict,
+                public_key_type=self.public_key_type,
+                wif_type=self.wif_type
             )
             if self._hd.name() in ["Algorand", "Cardano"]:
                 del _root["root_wif"]
@@ -1740,28 +2068,28 @@ class HDWallet:
         elif self._hd.name() in ["Electrum-V1", "Electrum-V2"]:
             if self._hd.name() == "Electrum-V2":
                 _root.update(
-                    mode=self.mode(),
-                    mnemonic_type=self.mnemonic_type()
+                    mode=self.mode,
+                    mnemonic_type=self.mnemonic_type
                 )
             _root.update(
-                master_private_key=self.master_private_key(),
-                master_wif=self.master_wif(),
-                master_public_key=self.master_public_key(),
-                public_key_type=self.public_key_type(),
-                wif_type=self.wif_type()
+                master_private_key=self.master_private_key,
+                master_wif=self.master_wif,
+                master_public_key=self.master_public_key,
+                public_key_type=self.public_key_type,
+                wif_type=self.wif_type
             )
         elif self._hd.name() == "Monero":
             _root.update(
-                private_key=self.private_key(),
-                spend_private_key=self.spend_private_key(),
-                view_private_key=self.view_private_key(),
-                spend_public_key=self.spend_public_key(),
-                view_public_key=self.view_public_key(),
-                primary_address=self.primary_address(),
+                private_key=self.private_key,
+                spend_private_key=self.spend_private_key,
+                view_private_key=self.view_private_key,
+                spend_public_key=self.spend_public_key,
+                view_public_key=self.view_public_key,
+                primary_address=self.primary_address,
             )
             if self._kwargs.get("payment_id"):
                 _root.update(
-                    integrated_address=self.integrated_address(
+                    integrated_address=lambda: self.integrated_address(
                         payment_id=self._kwargs.get("payment_id")
                     )
                 )
@@ -1769,14 +2097,87 @@ class HDWallet:
         if "derivation" not in exclude:
             _root["derivation"] = derivation
 
-        return exclude_keys(_root, exclude)
+        return select_keys(_root, include, exclude)
 
-    def dumps(self, exclude: Optional[set] = None) -> Optional[Union[dict, List[dict]]]:
+    def derivation_plan(self) -> Optional[DerivationPlan]:
+        """
+        Compile the expansion plan of the current derivation and its index ranges.
+
+        :return: The derivation plan, or None if no derivation is set.
+        :rtype: Optional[DerivationPlan]
+        """
+
+        if self._derivation is None:
+            return None
+        return DerivationPlan(derivation=self._derivation)
+
+    def iter_derivations(self, exclude: Optional[set] = None, include: Optional[set] = None) -> Iterator[dict]:
+        """
+        Lazily dump every path of the current derivation, one dictionary at a time.
+
+        Derivation ranges are expanded depth-first following the :meth:`derivation_plan`, and
+        each path is derived and dumped only when the next item is requested, so memory stays
+        constant regardless of the range size and iteration can be stopped early. The paths are walked on a
+        :meth:`fork` of the wallet, so the wallet itself is left at its current derivation.
+
+        On BIP32 based HDs the range is walked as a tree: the nodes along the previous
+        path are kept, and each path only derives the indexes past the prefix it shares
+        with the previous one, so every internal node is derived once.
+
+        :param exclude: Optional set of keys to exclude from each dump.
+        :type exclude: Optional[set]
+        :param include: Optional set of keys to restrict each dump to, as with :meth:`dump`.
+        :type include: Optional[set]
+
+        :return: An iterator of dictionaries, one per derived path.
+        :rtype: Iterator[dict]
+        """
+
+        if exclude is None:
+            exclude = { }
+
+        plan: Optional[DerivationPlan] = self.derivation_plan()
+        if plan is None:
+            return
+
+        hdwallet: HDWallet = self.fork()
+
+        root: Optional[BIP32Node] = None
+        if isinstance(hdwallet._hd, BIP32HD):
+            hdwallet._hd.clean_derivation()
+            root = hdwallet._hd.node()
+        stack: List[Tuple[int, BIP32Node]] = []
+
+        def walk(indexes: Tuple[int, ...]) -> BIP32Node:
+            position: int = 0
+            while position < min(len(stack), len(indexes)) and stack[position][0] == indexes[position]:
+                position += 1
+            del stack[position:]
+            node: BIP32Node = stack[-1][1] if stack else root
+            for index in indexes[position:]:
+                hdwallet._hd.update_node(node=node)
+                hdwallet._hd.drive(index)
+                node = hdwallet._hd.node()
+                stack.append((index, node))
+            return node
+
+        for components, indexes in plan:
+            _derivation: IDerivation = plan.derivation(components=components)
+            if root is None:
+                hdwallet.update_derivation(derivation=_derivation)
+            else:
+                hdwallet._hd.update_node(node=walk(indexes), derivation=_derivation)
+                hdwallet._derivation = _derivation
+            yield hdwallet.dump(exclude={"root", *exclude}, include=include)
+
+    def dumps(self, exclude: Optional[set] = None, include: Optional[set] = None) -> Optional[Union[dict, List[dict]]]:
         """
         Dump the state of multiple derivations of the HD wallet and related information into dictionaries.
 
         :param exclude: Optional set of keys to exclude from the dump.
         :type exclude: Optional[set]
+        :param include: Optional set of keys to restrict the root and every derivation dump to, as with :meth:`dump`.
+        :type include: Optional[set]
 
         :return: Either a single dictionary or a list of dictionaries containing the dumped information,
                  depending on the number of derivations.
@@ -1786,92 +2187,44 @@ class HDWallet:
         if exclude is None:
             exclude = { }
 
-        _derivations: List[dict] = []
-
-        def drive(*args) -> List[str]:
-            def drive_helper(derivations, current_derivation: Optional[List[Tuple[int, bool]]] = None) -> List[str]:
-                if current_derivation is None:
-                    current_derivation = []
-                if not derivations:
-
-                    if self._derivation.name() in [
-                        "BIP44", "BIP49", "BIP84", "BIP86"
-                    ]:
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            coin_type=current_derivation[1][0],
-                            account=current_derivation[2][0],
-                            change=current_derivation[3][0],
-                            address=current_derivation[4][0]
-                        )
-                    elif self._derivation.name() == "CIP1852":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            coin_type=current_derivation[1][0],
-                            account=current_derivation[2][0],
-                            role=current_derivation[3][0],
-                            address=current_derivation[4][0]
-                        )
-                    elif self._derivation.name() == "Electrum":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            change=current_derivation[0][0],
-                            address=current_derivation[1][0]
-                        )
-                    elif self._derivation.name() == "Monero":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            minor=current_derivation[0][0],
-                            major=current_derivation[1][0]
-                        )
-                    elif self._derivation.name() == "HDW":
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            account=current_derivation[0][0],
-                            ecc=current_derivation[1][0],
-                            address=current_derivation[2][0]
-                        )
-                    else:
-                        _derivation: IDerivation = DERIVATIONS.derivation(
-                            name=self._derivation.name()
-                        ).__call__(
-                            path="m/" + "/".join(
-                                [str(item[0]) + "'" if item[1] else str(item[0]) for item in current_derivation]
-                            )
-                        )
-                    self.update_derivation(derivation=_derivation)
-                    _derivations.append(self.dump(exclude={"root", *exclude}))
-                    return [_derivation.path()]
-
-                path: List[str] = []
-                if len(derivations[0]) == 3:
-                    for value in range(derivations[0][0], derivations[0][1] + 1):
-                        path += drive_helper(
-                            derivations[1:], current_derivation + [(value, derivations[0][2])]
-                        )
-                else:
-                    path += drive_helper(
-                        derivations[1:], current_derivation + [derivations[0]]
-                    )
-                return path
-            return drive_helper(args)
-
         if self._derivation is None:
             return None
 
-        drive(*self._derivation.derivations())
+        _derivations: List[dict] = list(self.iter_derivations(exclude=exclude, include=include))
 
         if "root" in exclude:
             return _derivations
 
-        _root: dict = self.dump(exclude={"derivation"})
+        _root: dict = self.dump(exclude={"derivation"}, include=include)
 
         if "derivations" not in exclude:
             _root["derivations"] = _derivations
 
         return exclude_keys(_root, exclude)
+
+    def columns(self, fields: Sequence[str]) -> DerivationColumns:
+        """
+        Dump selected fields of every path of the current derivation into a columnar result set.
+
+        Fields take the ``include`` form of :meth:`dump`, e.g. ``at:path``, ``address`` or
+        ``addresses:p2wpkh``. Only the requested fields are computed, and hexadecimal key
+        fields are stored as raw bytes, so memory stays at tens of bytes per path.
+
+        :param fields: The fields to keep, one column each.
+        :type fields: Sequence[str]
+
+        :return: The columnar result set, empty if there is no derivation.
+        :rtype: DerivationColumns
+        """
+
+        columns: DerivationColumns = DerivationColumns(
+            fields=fields, hex_fields=[
+                field for field in fields if field.split(":")[-1] in [
+                    "private_key", "chain_code", "public_key", "uncompressed", "compressed",
+                    "hash", "fingerprint", "parent_fingerprint"
+                ]
+            ]
+        )
+        if self._derivation is None:
+            return columns
+        return columns.extend(self.iter_derivations(include=set(fields)))
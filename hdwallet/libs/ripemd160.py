@@ -4,138 +4,535 @@
 
 # source: https://github.com/richardkiss/pycoin/blob/main/pycoin/contrib/ripemd160.py
 # Grudgingly ported to python2 compatibility by Richard Kiss
+# Rounds unrolled with the boolean functions, rotations and constants inlined.
 
-import binascii
 import struct
-import unittest
 
 
 if struct.calcsize("<L") != 4 or struct.calcsize("<Q") != 8:
     raise RuntimeError("unexpected struct sizes")
 
 
-# Message schedule indexes for the left path.
-ML = [
-    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
-    7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8,
-    3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12,
-    1, 9, 11, 10, 0, 8, 12, 4, 13, 3, 7, 15, 14, 5, 6, 2,
-    4, 0, 5, 9, 7, 12, 2, 10, 14, 1, 3, 8, 11, 6, 15, 13
-]
+IV = (0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476, 0xc3d2e1f0)
 
-# Message schedule indexes for the right path.
-MR = [
-    5, 14, 7, 0, 9, 2, 11, 4, 13, 6, 15, 8, 1, 10, 3, 12,
-    6, 11, 3, 7, 0, 13, 5, 10, 14, 15, 8, 12, 4, 9, 1, 2,
-    15, 5, 1, 3, 7, 14, 6, 9, 11, 8, 12, 2, 10, 0, 4, 13,
-    8, 6, 4, 1, 3, 11, 15, 0, 5, 12, 2, 13, 9, 7, 10, 14,
-    12, 15, 10, 4, 1, 5, 8, 7, 6, 2, 13, 14, 0, 3, 9, 11
-]
+# Message words 8 to 15 of the padded single block of a 32-byte message.
+PAD32 = (0x80, 0, 0, 0, 0, 0, 256, 0)
 
-# Rotation counts for the left path.
-RL = [
-    11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8,
-    7, 6, 8, 13, 11, 9, 7, 15, 7, 12, 15, 9, 11, 7, 13, 12,
-    11, 13, 6, 7, 14, 9, 13, 15, 14, 8, 13, 6, 5, 12, 7, 5,
-    11, 12, 14, 15, 14, 15, 9, 8, 9, 14, 5, 6, 8, 6, 5, 12,
-    9, 15, 5, 11, 6, 8, 13, 12, 5, 12, 13, 14, 11, 8, 5, 6
-]
+_unpack_block = struct.Struct("<16L").unpack
+_unpack_32 = struct.Struct("<8L").unpack
+_pack_state = struct.Struct("<5L").pack
 
-# Rotation counts for the right path.
-RR = [
-    8, 9, 9, 11, 13, 15, 15, 5, 7, 7, 8, 11, 14, 14, 12, 6,
-    9, 13, 15, 7, 12, 8, 9, 11, 7, 7, 12, 7, 6, 15, 13, 11,
-    9, 7, 15, 11, 8, 6, 6, 14, 12, 13, 5, 14, 13, 13, 7, 5,
-    15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8,
-    8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11
-]
 
-# K constants for the left path.
-KL = [0, 0x5a827999, 0x6ed9eba1, 0x8f1bbcdc, 0xa953fd4e]
-
-# K constants for the right path.
-KR = [0x50a28be6, 0x5c4dd124, 0x6d703ef3, 0x7a6d76e9, 0]
-
-
-def fi(x, y, z, i):
-    """The f1, f2, f3, f4, and f5 functions from the specification."""
-    if i == 0:
-        return x ^ y ^ z
-    elif i == 1:
-        return (x & y) | (~x & z)
-    elif i == 2:
-        return (x | ~y) ^ z
-    elif i == 3:
-        return (x & z) | (y & ~z)
-    elif i == 4:
-        return x ^ (y | ~z)
-    else:
-        assert False
-
-
-def rol(x, i):
-    """Rotate the bottom 32 bits of x left by i bits."""
-    return ((x << i) | ((x & 0xffffffff) >> (32 - i))) & 0xffffffff
-
-
-def compress(h0, h1, h2, h3, h4, block):
-    """Compress state (h0, h1, h2, h3, h4) with block."""
-    # Left path variables.
-    al, bl, cl, dl, el = h0, h1, h2, h3, h4
-    # Right path variables.
-    ar, br, cr, dr, er = h0, h1, h2, h3, h4
-    # Message variables.
-    x = [struct.unpack("<L", block[4*i:4*(i+1)])[0] for i in range(16)]
-
-    # Iterate over the 80 rounds of the compression.
-    for j in range(80):
-        rnd = j >> 4
-        # Perform left side of the transformation.
-        al = rol(al + fi(bl, cl, dl, rnd) + x[ML[j]] + KL[rnd], RL[j]) + el
-        al, bl, cl, dl, el = el, al, bl, rol(cl, 10), dl
-        # Perform right side of the transformation.
-        ar = rol(ar + fi(br, cr, dr, 4 - rnd) + x[MR[j]] + KR[rnd], RR[j]) + er
-        ar, br, cr, dr, er = er, ar, br, rol(cr, 10), dr
-
-    # Compose old state, left transform, and right transform into new state.
-    return h1 + cl + dr, h2 + dl + er, h3 + el + ar, h4 + al + br, h0 + bl + cr
+def _compress(h0, h1, h2, h3, h4, x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15):
+    M = 0xFFFFFFFF
+    a, b, c, d, e = h0, h1, h2, h3, h4
+    t = (a + (b ^ c ^ d) + x0) & M
+    a = ((((t << 11) | (t >> 21)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (a ^ b ^ c) + x1) & M
+    e = ((((t << 14) | (t >> 18)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + (e ^ a ^ b) + x2) & M
+    d = ((((t << 15) | (t >> 17)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (d ^ e ^ a) + x3) & M
+    c = ((((t << 12) | (t >> 20)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (c ^ d ^ e) + x4) & M
+    b = ((((t << 5) | (t >> 27)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + (b ^ c ^ d) + x5) & M
+    a = ((((t << 8) | (t >> 24)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (a ^ b ^ c) + x6) & M
+    e = ((((t << 7) | (t >> 25)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + (e ^ a ^ b) + x7) & M
+    d = ((((t << 9) | (t >> 23)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (d ^ e ^ a) + x8) & M
+    c = ((((t << 11) | (t >> 21)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (c ^ d ^ e) + x9) & M
+    b = ((((t << 13) | (t >> 19)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + (b ^ c ^ d) + x10) & M
+    a = ((((t << 14) | (t >> 18)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (a ^ b ^ c) + x11) & M
+    e = ((((t << 15) | (t >> 17)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + (e ^ a ^ b) + x12) & M
+    d = ((((t << 6) | (t >> 26)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (d ^ e ^ a) + x13) & M
+    c = ((((t << 7) | (t >> 25)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (c ^ d ^ e) + x14) & M
+    b = ((((t << 9) | (t >> 23)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + (b ^ c ^ d) + x15) & M
+    a = ((((t << 8) | (t >> 24)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (c ^ (a & (b ^ c))) + x7 + 0x5a827999) & M
+    e = ((((t << 7) | (t >> 25)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + (b ^ (e & (a ^ b))) + x4 + 0x5a827999) & M
+    d = ((((t << 6) | (t >> 26)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (a ^ (d & (e ^ a))) + x13 + 0x5a827999) & M
+    c = ((((t << 8) | (t >> 24)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (e ^ (c & (d ^ e))) + x1 + 0x5a827999) & M
+    b = ((((t << 13) | (t >> 19)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + (d ^ (b & (c ^ d))) + x10 + 0x5a827999) & M
+    a = ((((t << 11) | (t >> 21)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (c ^ (a & (b ^ c))) + x6 + 0x5a827999) & M
+    e = ((((t << 9) | (t >> 23)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + (b ^ (e & (a ^ b))) + x15 + 0x5a827999) & M
+    d = ((((t << 7) | (t >> 25)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (a ^ (d & (e ^ a))) + x3 + 0x5a827999) & M
+    c = ((((t << 15) | (t >> 17)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (e ^ (c & (d ^ e))) + x12 + 0x5a827999) & M
+    b = ((((t << 7) | (t >> 25)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + (d ^ (b & (c ^ d))) + x0 + 0x5a827999) & M
+    a = ((((t << 12) | (t >> 20)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (c ^ (a & (b ^ c))) + x9 + 0x5a827999) & M
+    e = ((((t << 15) | (t >> 17)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + (b ^ (e & (a ^ b))) + x5 + 0x5a827999) & M
+    d = ((((t << 9) | (t >> 23)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (a ^ (d & (e ^ a))) + x2 + 0x5a827999) & M
+    c = ((((t << 11) | (t >> 21)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (e ^ (c & (d ^ e))) + x14 + 0x5a827999) & M
+    b = ((((t << 7) | (t >> 25)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + (d ^ (b & (c ^ d))) + x11 + 0x5a827999) & M
+    a = ((((t << 13) | (t >> 19)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (c ^ (a & (b ^ c))) + x8 + 0x5a827999) & M
+    e = ((((t << 12) | (t >> 20)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + ((e | (a ^ M)) ^ b) + x3 + 0x6ed9eba1) & M
+    d = ((((t << 11) | (t >> 21)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + ((d | (e ^ M)) ^ a) + x10 + 0x6ed9eba1) & M
+    c = ((((t << 13) | (t >> 19)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + ((c | (d ^ M)) ^ e) + x14 + 0x6ed9eba1) & M
+    b = ((((t << 6) | (t >> 26)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + ((b | (c ^ M)) ^ d) + x4 + 0x6ed9eba1) & M
+    a = ((((t << 7) | (t >> 25)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + ((a | (b ^ M)) ^ c) + x9 + 0x6ed9eba1) & M
+    e = ((((t << 14) | (t >> 18)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + ((e | (a ^ M)) ^ b) + x15 + 0x6ed9eba1) & M
+    d = ((((t << 9) | (t >> 23)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + ((d | (e ^ M)) ^ a) + x8 + 0x6ed9eba1) & M
+    c = ((((t << 13) | (t >> 19)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + ((c | (d ^ M)) ^ e) + x1 + 0x6ed9eba1) & M
+    b = ((((t << 15) | (t >> 17)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + ((b | (c ^ M)) ^ d) + x2 + 0x6ed9eba1) & M
+    a = ((((t << 14) | (t >> 18)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + ((a | (b ^ M)) ^ c) + x7 + 0x6ed9eba1) & M
+    e = ((((t << 8) | (t >> 24)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + ((e | (a ^ M)) ^ b) + x0 + 0x6ed9eba1) & M
+    d = ((((t << 13) | (t >> 19)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + ((d | (e ^ M)) ^ a) + x6 + 0x6ed9eba1) & M
+    c = ((((t << 6) | (t >> 26)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + ((c | (d ^ M)) ^ e) + x13 + 0x6ed9eba1) & M
+    b = ((((t << 5) | (t >> 27)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + ((b | (c ^ M)) ^ d) + x11 + 0x6ed9eba1) & M
+    a = ((((t << 12) | (t >> 20)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + ((a | (b ^ M)) ^ c) + x5 + 0x6ed9eba1) & M
+    e = ((((t << 7) | (t >> 25)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + ((e | (a ^ M)) ^ b) + x12 + 0x6ed9eba1) & M
+    d = ((((t << 5) | (t >> 27)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (e ^ (a & (d ^ e))) + x1 + 0x8f1bbcdc) & M
+    c = ((((t << 11) | (t >> 21)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (d ^ (e & (c ^ d))) + x9 + 0x8f1bbcdc) & M
+    b = ((((t << 12) | (t >> 20)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + (c ^ (d & (b ^ c))) + x11 + 0x8f1bbcdc) & M
+    a = ((((t << 14) | (t >> 18)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (b ^ (c & (a ^ b))) + x10 + 0x8f1bbcdc) & M
+    e = ((((t << 15) | (t >> 17)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + (a ^ (b & (e ^ a))) + x0 + 0x8f1bbcdc) & M
+    d = ((((t << 14) | (t >> 18)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (e ^ (a & (d ^ e))) + x8 + 0x8f1bbcdc) & M
+    c = ((((t << 15) | (t >> 17)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (d ^ (e & (c ^ d))) + x12 + 0x8f1bbcdc) & M
+    b = ((((t << 9) | (t >> 23)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + (c ^ (d & (b ^ c))) + x4 + 0x8f1bbcdc) & M
+    a = ((((t << 8) | (t >> 24)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (b ^ (c & (a ^ b))) + x13 + 0x8f1bbcdc) & M
+    e = ((((t << 9) | (t >> 23)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + (a ^ (b & (e ^ a))) + x3 + 0x8f1bbcdc) & M
+    d = ((((t << 14) | (t >> 18)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (e ^ (a & (d ^ e))) + x7 + 0x8f1bbcdc) & M
+    c = ((((t << 5) | (t >> 27)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (d ^ (e & (c ^ d))) + x15 + 0x8f1bbcdc) & M
+    b = ((((t << 6) | (t >> 26)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + (c ^ (d & (b ^ c))) + x14 + 0x8f1bbcdc) & M
+    a = ((((t << 8) | (t >> 24)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (b ^ (c & (a ^ b))) + x5 + 0x8f1bbcdc) & M
+    e = ((((t << 6) | (t >> 26)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + (a ^ (b & (e ^ a))) + x6 + 0x8f1bbcdc) & M
+    d = ((((t << 5) | (t >> 27)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (e ^ (a & (d ^ e))) + x2 + 0x8f1bbcdc) & M
+    c = ((((t << 12) | (t >> 20)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (c ^ (d | (e ^ M))) + x4 + 0xa953fd4e) & M
+    b = ((((t << 9) | (t >> 23)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + (b ^ (c | (d ^ M))) + x0 + 0xa953fd4e) & M
+    a = ((((t << 15) | (t >> 17)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (a ^ (b | (c ^ M))) + x5 + 0xa953fd4e) & M
+    e = ((((t << 5) | (t >> 27)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + (e ^ (a | (b ^ M))) + x9 + 0xa953fd4e) & M
+    d = ((((t << 11) | (t >> 21)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (d ^ (e | (a ^ M))) + x7 + 0xa953fd4e) & M
+    c = ((((t << 6) | (t >> 26)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (c ^ (d | (e ^ M))) + x12 + 0xa953fd4e) & M
+    b = ((((t << 8) | (t >> 24)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + (b ^ (c | (d ^ M))) + x2 + 0xa953fd4e) & M
+    a = ((((t << 13) | (t >> 19)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (a ^ (b | (c ^ M))) + x10 + 0xa953fd4e) & M
+    e = ((((t << 12) | (t >> 20)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + (e ^ (a | (b ^ M))) + x14 + 0xa953fd4e) & M
+    d = ((((t << 5) | (t >> 27)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (d ^ (e | (a ^ M))) + x1 + 0xa953fd4e) & M
+    c = ((((t << 12) | (t >> 20)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (c ^ (d | (e ^ M))) + x3 + 0xa953fd4e) & M
+    b = ((((t << 13) | (t >> 19)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    t = (a + (b ^ (c | (d ^ M))) + x8 + 0xa953fd4e) & M
+    a = ((((t << 14) | (t >> 18)) & M) + e) & M
+    c = ((c << 10) | (c >> 22)) & M
+    t = (e + (a ^ (b | (c ^ M))) + x11 + 0xa953fd4e) & M
+    e = ((((t << 11) | (t >> 21)) & M) + d) & M
+    b = ((b << 10) | (b >> 22)) & M
+    t = (d + (e ^ (a | (b ^ M))) + x6 + 0xa953fd4e) & M
+    d = ((((t << 8) | (t >> 24)) & M) + c) & M
+    a = ((a << 10) | (a >> 22)) & M
+    t = (c + (d ^ (e | (a ^ M))) + x15 + 0xa953fd4e) & M
+    c = ((((t << 5) | (t >> 27)) & M) + b) & M
+    e = ((e << 10) | (e >> 22)) & M
+    t = (b + (c ^ (d | (e ^ M))) + x13 + 0xa953fd4e) & M
+    b = ((((t << 6) | (t >> 26)) & M) + a) & M
+    d = ((d << 10) | (d >> 22)) & M
+    ra, rb, rc, rd, re = h0, h1, h2, h3, h4
+    t = (ra + (rb ^ (rc | (rd ^ M))) + x5 + 0x50a28be6) & M
+    ra = ((((t << 8) | (t >> 24)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (ra ^ (rb | (rc ^ M))) + x14 + 0x50a28be6) & M
+    re = ((((t << 9) | (t >> 23)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + (re ^ (ra | (rb ^ M))) + x7 + 0x50a28be6) & M
+    rd = ((((t << 9) | (t >> 23)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (rd ^ (re | (ra ^ M))) + x0 + 0x50a28be6) & M
+    rc = ((((t << 11) | (t >> 21)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (rc ^ (rd | (re ^ M))) + x9 + 0x50a28be6) & M
+    rb = ((((t << 13) | (t >> 19)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + (rb ^ (rc | (rd ^ M))) + x2 + 0x50a28be6) & M
+    ra = ((((t << 15) | (t >> 17)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (ra ^ (rb | (rc ^ M))) + x11 + 0x50a28be6) & M
+    re = ((((t << 15) | (t >> 17)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + (re ^ (ra | (rb ^ M))) + x4 + 0x50a28be6) & M
+    rd = ((((t << 5) | (t >> 27)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (rd ^ (re | (ra ^ M))) + x13 + 0x50a28be6) & M
+    rc = ((((t << 7) | (t >> 25)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (rc ^ (rd | (re ^ M))) + x6 + 0x50a28be6) & M
+    rb = ((((t << 7) | (t >> 25)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + (rb ^ (rc | (rd ^ M))) + x15 + 0x50a28be6) & M
+    ra = ((((t << 8) | (t >> 24)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (ra ^ (rb | (rc ^ M))) + x8 + 0x50a28be6) & M
+    re = ((((t << 11) | (t >> 21)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + (re ^ (ra | (rb ^ M))) + x1 + 0x50a28be6) & M
+    rd = ((((t << 14) | (t >> 18)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (rd ^ (re | (ra ^ M))) + x10 + 0x50a28be6) & M
+    rc = ((((t << 14) | (t >> 18)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (rc ^ (rd | (re ^ M))) + x3 + 0x50a28be6) & M
+    rb = ((((t << 12) | (t >> 20)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + (rb ^ (rc | (rd ^ M))) + x12 + 0x50a28be6) & M
+    ra = ((((t << 6) | (t >> 26)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (rb ^ (rc & (ra ^ rb))) + x6 + 0x5c4dd124) & M
+    re = ((((t << 9) | (t >> 23)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + (ra ^ (rb & (re ^ ra))) + x11 + 0x5c4dd124) & M
+    rd = ((((t << 13) | (t >> 19)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (re ^ (ra & (rd ^ re))) + x3 + 0x5c4dd124) & M
+    rc = ((((t << 15) | (t >> 17)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (rd ^ (re & (rc ^ rd))) + x7 + 0x5c4dd124) & M
+    rb = ((((t << 7) | (t >> 25)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + (rc ^ (rd & (rb ^ rc))) + x0 + 0x5c4dd124) & M
+    ra = ((((t << 12) | (t >> 20)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (rb ^ (rc & (ra ^ rb))) + x13 + 0x5c4dd124) & M
+    re = ((((t << 8) | (t >> 24)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + (ra ^ (rb & (re ^ ra))) + x5 + 0x5c4dd124) & M
+    rd = ((((t << 9) | (t >> 23)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (re ^ (ra & (rd ^ re))) + x10 + 0x5c4dd124) & M
+    rc = ((((t << 11) | (t >> 21)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (rd ^ (re & (rc ^ rd))) + x14 + 0x5c4dd124) & M
+    rb = ((((t << 7) | (t >> 25)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + (rc ^ (rd & (rb ^ rc))) + x15 + 0x5c4dd124) & M
+    ra = ((((t << 7) | (t >> 25)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (rb ^ (rc & (ra ^ rb))) + x8 + 0x5c4dd124) & M
+    re = ((((t << 12) | (t >> 20)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + (ra ^ (rb & (re ^ ra))) + x12 + 0x5c4dd124) & M
+    rd = ((((t << 7) | (t >> 25)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (re ^ (ra & (rd ^ re))) + x4 + 0x5c4dd124) & M
+    rc = ((((t << 6) | (t >> 26)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (rd ^ (re & (rc ^ rd))) + x9 + 0x5c4dd124) & M
+    rb = ((((t << 15) | (t >> 17)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + (rc ^ (rd & (rb ^ rc))) + x1 + 0x5c4dd124) & M
+    ra = ((((t << 13) | (t >> 19)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (rb ^ (rc & (ra ^ rb))) + x2 + 0x5c4dd124) & M
+    re = ((((t << 11) | (t >> 21)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + ((re | (ra ^ M)) ^ rb) + x15 + 0x6d703ef3) & M
+    rd = ((((t << 9) | (t >> 23)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + ((rd | (re ^ M)) ^ ra) + x5 + 0x6d703ef3) & M
+    rc = ((((t << 7) | (t >> 25)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + ((rc | (rd ^ M)) ^ re) + x1 + 0x6d703ef3) & M
+    rb = ((((t << 15) | (t >> 17)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + ((rb | (rc ^ M)) ^ rd) + x3 + 0x6d703ef3) & M
+    ra = ((((t << 11) | (t >> 21)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + ((ra | (rb ^ M)) ^ rc) + x7 + 0x6d703ef3) & M
+    re = ((((t << 8) | (t >> 24)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + ((re | (ra ^ M)) ^ rb) + x14 + 0x6d703ef3) & M
+    rd = ((((t << 6) | (t >> 26)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + ((rd | (re ^ M)) ^ ra) + x6 + 0x6d703ef3) & M
+    rc = ((((t << 6) | (t >> 26)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + ((rc | (rd ^ M)) ^ re) + x9 + 0x6d703ef3) & M
+    rb = ((((t << 14) | (t >> 18)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + ((rb | (rc ^ M)) ^ rd) + x11 + 0x6d703ef3) & M
+    ra = ((((t << 12) | (t >> 20)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + ((ra | (rb ^ M)) ^ rc) + x8 + 0x6d703ef3) & M
+    re = ((((t << 13) | (t >> 19)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + ((re | (ra ^ M)) ^ rb) + x12 + 0x6d703ef3) & M
+    rd = ((((t << 5) | (t >> 27)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + ((rd | (re ^ M)) ^ ra) + x2 + 0x6d703ef3) & M
+    rc = ((((t << 14) | (t >> 18)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + ((rc | (rd ^ M)) ^ re) + x10 + 0x6d703ef3) & M
+    rb = ((((t << 13) | (t >> 19)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + ((rb | (rc ^ M)) ^ rd) + x0 + 0x6d703ef3) & M
+    ra = ((((t << 13) | (t >> 19)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + ((ra | (rb ^ M)) ^ rc) + x4 + 0x6d703ef3) & M
+    re = ((((t << 7) | (t >> 25)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + ((re | (ra ^ M)) ^ rb) + x13 + 0x6d703ef3) & M
+    rd = ((((t << 5) | (t >> 27)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (ra ^ (rd & (re ^ ra))) + x8 + 0x7a6d76e9) & M
+    rc = ((((t << 15) | (t >> 17)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (re ^ (rc & (rd ^ re))) + x6 + 0x7a6d76e9) & M
+    rb = ((((t << 5) | (t >> 27)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + (rd ^ (rb & (rc ^ rd))) + x4 + 0x7a6d76e9) & M
+    ra = ((((t << 8) | (t >> 24)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (rc ^ (ra & (rb ^ rc))) + x1 + 0x7a6d76e9) & M
+    re = ((((t << 11) | (t >> 21)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + (rb ^ (re & (ra ^ rb))) + x3 + 0x7a6d76e9) & M
+    rd = ((((t << 14) | (t >> 18)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (ra ^ (rd & (re ^ ra))) + x11 + 0x7a6d76e9) & M
+    rc = ((((t << 14) | (t >> 18)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (re ^ (rc & (rd ^ re))) + x15 + 0x7a6d76e9) & M
+    rb = ((((t << 6) | (t >> 26)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + (rd ^ (rb & (rc ^ rd))) + x0 + 0x7a6d76e9) & M
+    ra = ((((t << 14) | (t >> 18)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (rc ^ (ra & (rb ^ rc))) + x5 + 0x7a6d76e9) & M
+    re = ((((t << 6) | (t >> 26)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + (rb ^ (re & (ra ^ rb))) + x12 + 0x7a6d76e9) & M
+    rd = ((((t << 9) | (t >> 23)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (ra ^ (rd & (re ^ ra))) + x2 + 0x7a6d76e9) & M
+    rc = ((((t << 12) | (t >> 20)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (re ^ (rc & (rd ^ re))) + x13 + 0x7a6d76e9) & M
+    rb = ((((t << 9) | (t >> 23)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + (rd ^ (rb & (rc ^ rd))) + x9 + 0x7a6d76e9) & M
+    ra = ((((t << 12) | (t >> 20)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (rc ^ (ra & (rb ^ rc))) + x7 + 0x7a6d76e9) & M
+    re = ((((t << 5) | (t >> 27)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + (rb ^ (re & (ra ^ rb))) + x10 + 0x7a6d76e9) & M
+    rd = ((((t << 15) | (t >> 17)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (ra ^ (rd & (re ^ ra))) + x14 + 0x7a6d76e9) & M
+    rc = ((((t << 8) | (t >> 24)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (rc ^ rd ^ re) + x12) & M
+    rb = ((((t << 8) | (t >> 24)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + (rb ^ rc ^ rd) + x15) & M
+    ra = ((((t << 5) | (t >> 27)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (ra ^ rb ^ rc) + x10) & M
+    re = ((((t << 12) | (t >> 20)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + (re ^ ra ^ rb) + x4) & M
+    rd = ((((t << 9) | (t >> 23)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (rd ^ re ^ ra) + x1) & M
+    rc = ((((t << 12) | (t >> 20)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (rc ^ rd ^ re) + x5) & M
+    rb = ((((t << 5) | (t >> 27)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + (rb ^ rc ^ rd) + x8) & M
+    ra = ((((t << 14) | (t >> 18)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (ra ^ rb ^ rc) + x7) & M
+    re = ((((t << 6) | (t >> 26)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + (re ^ ra ^ rb) + x6) & M
+    rd = ((((t << 8) | (t >> 24)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (rd ^ re ^ ra) + x2) & M
+    rc = ((((t << 13) | (t >> 19)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (rc ^ rd ^ re) + x13) & M
+    rb = ((((t << 6) | (t >> 26)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    t = (ra + (rb ^ rc ^ rd) + x14) & M
+    ra = ((((t << 5) | (t >> 27)) & M) + re) & M
+    rc = ((rc << 10) | (rc >> 22)) & M
+    t = (re + (ra ^ rb ^ rc) + x0) & M
+    re = ((((t << 15) | (t >> 17)) & M) + rd) & M
+    rb = ((rb << 10) | (rb >> 22)) & M
+    t = (rd + (re ^ ra ^ rb) + x3) & M
+    rd = ((((t << 13) | (t >> 19)) & M) + rc) & M
+    ra = ((ra << 10) | (ra >> 22)) & M
+    t = (rc + (rd ^ re ^ ra) + x9) & M
+    rc = ((((t << 11) | (t >> 21)) & M) + rb) & M
+    re = ((re << 10) | (re >> 22)) & M
+    t = (rb + (rc ^ rd ^ re) + x11) & M
+    rb = ((((t << 11) | (t >> 21)) & M) + ra) & M
+    rd = ((rd << 10) | (rd >> 22)) & M
+    return (
+        (h1 + c + rd) & M, (h2 + d + re) & M, (h3 + e + ra) & M, (h4 + a + rb) & M, (h0 + b + rc) & M
+    )
 
 
 def ripemd160(data):
     """Compute the RIPEMD-160 hash of data."""
-    # Initialize state.
-    state = (0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476, 0xc3d2e1f0)
+    if len(data) == 32:
+        return _pack_state(*_compress(*IV, *_unpack_32(data), *PAD32))
+    state = IV
     # Process full 64-byte blocks in the input.
     for b in range(len(data) >> 6):
-        args = list(state) + [data[64*b:64*(b+1)]]
-        state = compress(*args)
+        state = _compress(*state, *_unpack_block(data[64*b:64*(b+1)]))
     # Construct final blocks (with padding and size).
     pad = b"\x80" + b"\x00" * ((119 - len(data)) & 63)
-    fin = data[len(data) & ~63:] + pad + struct.pack("<Q", 8 * len(data))
+    fin = bytes(data[len(data) & ~63:]) + pad + struct.pack("<Q", 8 * len(data))
     # Process final blocks.
     for b in range(len(fin) >> 6):
-        args = list(state) + [fin[64*b:64*(b+1)]]
-        state = compress(*args)
-    # Produce output.
-    return b"".join(struct.pack("<L", h & 0xffffffff) for h in state)
+        state = _compress(*state, *_unpack_block(fin[64*b:64*(b+1)]))
+    return _pack_state(*state)
 
 
-class TestFrameworkKey(unittest.TestCase):
-    def test_ripemd160(self):
-        """RIPEMD-160 test vectors."""
-        # See https://homes.esat.kuleuven.be/~bosselae/ripemd160.html
-        for msg, hexout in [
-            (b"", "9c1185a5c5e9fc54612808977ee8f548b2258d31"),
-            (b"a", "0bdc9d2d256b3ee9daae347be6f4dc835a467ffe"),
-            (b"abc", "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"),
-            (b"message digest", "5d0689ef49d2fae572b881b123a85ffa21595f36"),
-            (b"abcdefghijklmnopqrstuvwxyz",
-                "f71c27109c692c1b56bbdceb5b9d2865b3708dbc"),
-            (b"abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq",
-                "12a053384a9c0c88e405a06c27dcf49ada62eb2b"),
-            (b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789",
-                "b0e20b6e3116640286ed3a87a5713079b21f5189"),
-            (b"1234567890" * 8, "9b752e45573d4b39f4dbd3323cab82bf63326bfb"),
-            (b"a" * 1000000, "52783243c1697bdbe16d37f97f68f08325dc1528")
-        ]:
-            self.assertEqual(binascii.hexlify(ripemd160(msg)).decode(), hexout)
+def ripemd160_many(messages):
+    """Compute the RIPEMD-160 hashes of several messages, in order."""
+    compress, unpack_32, pack_state, iv, pad32 = _compress, _unpack_32, _pack_state, IV, PAD32
+    return [
+        pack_state(*compress(*iv, *unpack_32(data), *pad32)) if len(data) == 32 else ripemd160(data)
+        for data in messages
+    ]
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Deque, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+)
+from concurrent.futures import (
+    Future, ProcessPoolExecutor
+)
+from collections import deque
+
+import os
+
+from .hdwallet import HDWallet
+from .hds import (
+    IHD, HDS, BIP32HD, BIP32Node
+)
+from .derivations import IDerivation
+from .addresses import (
+    IAddress, ADDRESSES
+)
+from .consts import PUBLIC_KEY_TYPES
+from .crypto import hash160_many
+from .exceptions import (
+    Error, HDError
+)
+from .utils import normalize_index
+
+
+class DerivedAddress(NamedTuple):
+    """
+    A child public key and its address, as streamed by :class:`ParallelDeriver`.
+    """
+
+    index: int
+    public_key: bytes
+    address: str
+
+
+def _derive_chunk(
+    parent: BIP32Node,
+    start: int,
+    stop: int,
+    hardened: bool,
+    address: Type[IAddress],
+    options: dict
+) -> List[DerivedAddress]:
+    """
+    Derive the children ``start`` to ``stop - 1`` of a parent node, run inside a worker process.
+
+    :param parent: The parent node.
+    :type parent: BIP32Node
+    :param start: The first child index, without the hardened bit.
+    :type start: int
+    :param stop: The child index to stop at, exclusive.
+    :type stop: int
+    :param hardened: Whether to derive hardened children.
+    :type hardened: bool
+    :param address: The address encoder class.
+    :type address: Type[IAddress]
+    :param options: The address encoder keyword arguments.
+    :type options: dict
+
+    :return: The derived addresses, invalid child indexes are skipped.
+    :rtype: List[DerivedAddress]
+    """
+
+    uncompressed: bool = parent.public_key_type() == PUBLIC_KEY_TYPES.UNCOMPRESSED
+    public_key_hash: bool = ADDRESSES.is_public_key_hash(name=address.name())
+    children: List[Tuple[int, bytes]] = []
+    for index in range(start, stop):
+        if hardened:
+            index |= 0x80000000
+        node: Optional[BIP32Node] = parent.child(index)
+        if node is None:
+            continue
+        children.append((
+            index, node.ecc_public_key().raw_uncompressed() if uncompressed else node.public_key()
+        ))
+
+    if not public_key_hash:
+        return [
+            DerivedAddress(
+                index=index, public_key=public_key, address=address.encode(public_key=public_key, **options)
+            ) for index, public_key in children
+        ]
+    hashes: bytes = hash160_many([child[1] for child in children])
+    return [
+        DerivedAddress(
+            index=index,
+            public_key=public_key,
+            address=ADDRESSES.encode_public_key_hash(
+                name=address.name(), public_key_hash=hashes[position * 20:(position + 1) * 20], **options
+            )
+        ) for position, (index, public_key) in enumerate(children)
+    ]
+
+
+class ParallelDeriver:
+    """
+    Derives large ranges of child addresses of one parent node across worker processes.
+
+    Only the parent :class:`hdwallet.hds.node.BIP32Node` and the address encoder
+    arguments are sent to the workers. The index range is split into chunks of
+    ``chunk_size`` children, and the results are streamed back in index order
+    while at most ``2 * workers`` chunks are in flight.
+
+    .. code-block:: python
+
+        >>> from hdwallet.parallel import ParallelDeriver
+        >>> deriver = ParallelDeriver(hdwallet=hdwallet, parent_path="m/44'/0'/0'/0", workers=4)
+        >>> for derived in deriver.derive(index=(0, 999_999)):
+        ...     print(derived.index, derived.address)
+    """
+
+    _parent: BIP32Node
+    _address: Type[IAddress]
+    _options: dict
+    _workers: int
+    _chunk_size: int
+
+    def __init__(
+        self,
+        hdwallet: HDWallet,
+        parent_path: Optional[Union[str, IDerivation]] = None,
+        address: Optional[Union[str, Type[IAddress]]] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 1000
+    ) -> None:
+        """
+        Initialize a ParallelDeriver instance.
+
+        :param hdwallet: The HD wallet holding the parent node, from a seed or an extended key.
+        :type hdwallet: HDWallet
+        :param parent_path: The derivation path of the parent node, e.g. ``m/44'/0'/0'/0``.
+                            If None, the current node of the wallet is used.
+        :type parent_path: Optional[Union[str, IDerivation]]
+        :param address: The address name or class, defaults to the wallet address.
+        :type address: Optional[Union[str, Type[IAddress]]]
+        :param workers: The number of worker processes, defaults to the CPU count. ``1`` derives in-process.
+        :type workers: Optional[int]
+        :param chunk_size: The number of children derived per task, defaults to 1000.
+        :type chunk_size: int
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        hd: Type[IHD] = HDS.hd(name=hdwallet.hd())
+        if not issubclass(hd, BIP32HD) or hd.drive is not BIP32HD.drive:
+            raise HDError(f"Parallel derivation is not supported on {hdwallet.hd()} HD")
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise Error("Invalid workers count", expected="positive integer", got=workers)
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise Error("Invalid chunk size", expected="positive integer", got=chunk_size)
+
+        encoder: Type[IAddress]
+        options: dict
+        encoder, options = hdwallet.address_encoder(address=address)
+        parent: Optional[BIP32Node] = hdwallet.node(parent_path=parent_path)
+        if parent is None or not parent.chain_code():
+            raise HDError("You can't drive this master key")
+
+        self._parent = parent
+        self._address = encoder
+        self._options = options
+        self._workers = workers if workers else (os.cpu_count() or 1)
+        self._chunk_size = chunk_size
+
+    def workers(self) -> int:
+        """
+        Get the number of worker processes.
+
+        :return: The number of worker processes.
+        :rtype: int
+        """
+
+        return self._workers
+
+    def chunk_size(self) -> int:
+        """
+        Get the number of children derived per task.
+
+        :return: The chunk size.
+        :rtype: int
+        """
+
+        return self._chunk_size
+
+    def chunks(
+        self, index: Union[str, int, Tuple[int, int], Tuple[int, int, bool]], hardened: bool = False
+    ) -> List[Tuple[int, int, bool]]:
+        """
+        Split an index range into derivation chunks.
+
+        :param index: The index or inclusive index range, in any form accepted by ``normalize_index``
+                      or a ``(from, to, hardened)`` tuple it produced.
+        :type index: Union[str, int, Tuple[int, int], Tuple[int, int, bool]]
+        :param hardened: Whether the indexes are hardened, ignored for ``(from, to, hardened)`` tuples.
+        :type hardened: bool
+
+        :return: The ``(start, stop, hardened)`` chunks, ``stop`` is exclusive.
+        :rtype: List[Tuple[int, int, bool]]
+        """
+
+        if isinstance(index, tuple) and len(index) == 3:
+            index, hardened = index[:2], index[2]
+        normalized: tuple = normalize_index(index=index, hardened=hardened)
+        if len(normalized) == 2:
+            normalized = (normalized[0], normalized[0], normalized[1])
+        _from, _to, _hardened = normalized
+        if _to > 0x7FFFFFFF:
+            raise Error("Child index out of range", expected=f"<= {0x7FFFFFFF}", got=_to)
+
+        return [
+            (start, min(start + self._chunk_size, _to + 1), _hardened)
+            for start in range(_from, _to + 1, self._chunk_size)
+        ]
+
+    def derive_chunk(self, start: int, stop: int, hardened: bool = False) -> List[DerivedAddress]:
+        """
+        Derive the addresses of one chunk in the calling process.
+
+        The deriver is picklable, so this bound method can also be submitted to any
+        executor, e.g. for the chunks returned by :meth:`chunks`.
+
+        :param start: The first child index, without the hardened bit.
+        :type start: int
+        :param stop: The child index to stop at, exclusive.
+        :type stop: int
+        :param hardened: Whether to derive hardened children.
+        :type hardened: bool
+
+        :return: The derived addresses, invalid child indexes are skipped.
+        :rtype: List[DerivedAddress]
+        """
+
+        return _derive_chunk(
+            self._parent, start, stop, hardened, self._address, self._options
+        )
+
+    def derive(
+        self, index: Union[str, int, Tuple[int, int], Tuple[int, int, bool]], hardened: bool = False
+    ) -> Iterator[DerivedAddress]:
+        """
+        Derive the addresses of an index range, streamed in index order.
+
+        :param index: The index or inclusive index range, in any form accepted by ``normalize_index``
+                      or a ``(from, to, hardened)`` tuple it produced.
+        :type index: Union[str, int, Tuple[int, int], Tuple[int, int, bool]]
+        :param hardened: Whether the indexes are hardened, ignored for ``(from, to, hardened)`` tuples.
+        :type hardened: bool
+
+        :return: An iterator of derived addresses, invalid child indexes are skipped.
+        :rtype: Iterator[DerivedAddress]
+        """
+
+        chunks: List[Tuple[int, int, bool]] = self.chunks(index=index, hardened=hardened)
+
+        if self._workers == 1 or len(chunks) == 1:
+            for start, stop, _hardened in chunks:
+                yield from _derive_chunk(
+                    self._parent, start, stop, _hardened, self._address, self._options
+                )
+            return
+
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            pending: Deque[Future] = deque()
+            try:
+                for start, stop, _hardened in chunks:
+                    if len(pending) >= (self._workers * 2):
+                        yield from pending.popleft().result()
+                    pending.append(executor.submit(
+                        _derive_chunk, self._parent, start, stop, _hardened, self._address, self._options
+                    ))
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Container, Dict, List, NamedTuple, Optional, Type
+)
+
+from .hdwallet import HDWallet
+from .hds import (
+    HDS, BIP32HD
+)
+from .hds.bip32 import BIP32ChildKey
+from .addresses import (
+    IAddress, ADDRESSES
+)
+from .exceptions import (
+    Error, AddressError, HDError
+)
+
+
+class ScannedAddress(NamedTuple):
+    """
+    A used address found by :class:`GapLimitScanner`.
+    """
+
+    path: str
+    index: int
+    address: str
+
+
+class ScannedChain(NamedTuple):
+    """
+    The scan result of one receive or change chain.
+    """
+
+    semantic: str
+    account: int
+    change: int
+    used: List[ScannedAddress]
+    last_index: Optional[int]
+
+
+class GapLimitScanner:
+    """
+    Walks BIP44/BIP49/BIP84/BIP86 account chains until ``gap_limit`` consecutive
+    unused addresses are found, checking each address against a caller supplied set.
+
+    The used set only needs to support ``in``, it can be a ``set``, a Bloom filter or
+    any index backed container. Addresses are derived lazily, ``batch_size`` children
+    at a time from each chain node, and the wallet must be at its root (from entropy,
+    mnemonic, seed or a root extended private key).
+
+    .. code-block:: python
+
+        >>> from hdwallet.scanner import GapLimitScanner
+        >>> scanner = GapLimitScanner(hdwallet=hdwallet, used=used_addresses, gap_limit=20)
+        >>> for chain in scanner.scan():
+        ...     print(chain.semantic, chain.account, chain.change, chain.last_index)
+    """
+
+    SEMANTICS: Dict[str, tuple] = {
+        "BIP44": (44, "P2PKH"),
+        "BIP49": (49, "P2WPKH-In-P2SH"),
+        "BIP84": (84, "P2WPKH"),
+        "BIP86": (86, "P2TR")
+    }
+
+    _hdwallet: HDWallet
+    _used: Container[str]
+    _gap_limit: int
+    _batch_size: int
+
+    def __init__(
+        self, hdwallet: HDWallet, used: Container[str], gap_limit: int = 20, batch_size: Optional[int] = None
+    ) -> None:
+        """
+        Initialize a GapLimitScanner instance.
+
+        :param hdwallet: The HD wallet at its root node.
+        :type hdwallet: HDWallet
+        :param used: The set of used addresses, any container supporting ``in``.
+        :type used: Container[str]
+        :param gap_limit: The number of consecutive unused addresses ending a chain, defaults to 20.
+        :type gap_limit: int
+        :param batch_size: The number of addresses derived at a time, defaults to the gap limit.
+        :type batch_size: Optional[int]
+
+        :return: No return
+        :rtype: NoneType
+        """
+
+        if not issubclass(HDS.hd(name=hdwallet.hd()), BIP32HD):
+            raise HDError(f"Gap limit scanning is not supported on {hdwallet.hd()} HD")
+        if not isinstance(gap_limit, int) or gap_limit < 1:
+            raise Error("Invalid gap limit", expected="positive integer", got=gap_limit)
+        if batch_size is not None and (not isinstance(batch_size, int) or batch_size < 1):
+            raise Error("Invalid batch size", expected="positive integer", got=batch_size)
+
+        self._hdwallet = hdwallet
+        self._used = used
+        self._gap_limit = gap_limit
+        self._batch_size = batch_size if batch_size else gap_limit
+
+    def semantics(self) -> List[str]:
+        """
+        Get the semantics whose address type is supported by the wallet cryptocurrency.
+
+        :return: The supported semantic names.
+        :rtype: List[str]
+        """
+
+        semantics: List[str] = []
+        for semantic, (_, address) in self.SEMANTICS.items():
+            try:
+                self._hdwallet.address_encoder(address=address)
+            except AddressError:
+                continue
+            semantics.append(semantic)
+        return semantics
+
+    def scan_chain(self, semantic: str, account: int = 0, change: int = 0) -> ScannedChain:
+        """
+        Scan a single chain ``m/purpose'/coin_type'/account'/change`` up to the gap limit.
+
+        :param semantic: The semantic name, one of ``BIP44``, ``BIP49``, ``BIP84`` or ``BIP86``.
+        :type semantic: str
+        :param account: The account index, defaults to 0.
+        :type account: int
+        :param change: The change index, ``0`` for the external and ``1`` for the internal chain, defaults to 0.
+        :type change: int
+
+        :return: The used addresses and the last used index of the chain.
+        :rtype: ScannedChain
+        """
+
+        if semantic not in self.SEMANTICS:
+            raise Error("Invalid semantic", expected=list(self.SEMANTICS.keys()), got=semantic)
+        purpose, address = self.SEMANTICS[semantic]
+        encoder: Type[IAddress]
+        options: dict
+        encoder, options = self._hdwallet.address_encoder(address=address)
+        public_key_hash: bool = ADDRESSES.is_public_key_hash(name=address)
+        parent_path: str = f"m/{purpose}'/{self._hdwallet.coin_type()}'/{account}'/{change}"
+
+        used: List[ScannedAddress] = []
+        gap: int = 0
+        start: int = 0
+        while gap < self._gap_limit and start < 0x80000000:
+            children: List[BIP32ChildKey] = self._hdwallet.derive_children(
+                parent_path=parent_path, start=start, count=min(self._batch_size, 0x80000000 - start)
+            )
+            for child in children:
+                _address: str = ADDRESSES.encode_public_key_hash(
+                    name=address, public_key_hash=child.hash, **options
+                ) if public_key_hash else encoder.encode(
+                    public_key=child.public_key, **options
+                )
+                if _address in self._used:
+                    used.append(ScannedAddress(
+                        path=f"{parent_path}/{child.index}", index=child.index, address=_address
+                    ))
+                    gap = 0
+                else:
+                    gap += 1
+                    if gap >= self._gap_limit:
+                        break
+            start += self._batch_size
+
+        return ScannedChain(
+            semantic=semantic,
+            account=account,
+            change=change,
+            used=used,
+            last_index=(used[-1].index if used else None)
+        )
+
+    def scan(self, semantics: Optional[List[str]] = None, accounts: Optional[List[int]] = None) -> List[ScannedChain]:
+        """
+        Scan the external and internal chains of every account of the given semantics.
+
+        Without explicit ``accounts``, accounts are discovered in order and discovery
+        stops at the first account without any used address on its external chain.
+
+        :param semantics: The semantic names to scan, defaults to every semantic supported by the cryptocurrency.
+        :type semantics: Optional[List[str]]
+        :param accounts: The account indexes to scan, defaults to account discovery.
+        :type accounts: Optional[List[int]]
+
+        :return: The scanned chains, external before internal for each account.
+        :rtype: List[ScannedChain]
+        """
+
+        chains: List[ScannedChain] = []
+        for semantic in (semantics if semantics is not None else self.semantics()):
+            account: int = 0
+            while accounts is None or account < len(accounts):
+                _account: int = account if accounts is None else accounts[account]
+                external: ScannedChain = self.scan_chain(
+                    semantic=semantic, account=_account, change=0
+                )
+                if accounts is None and not external.used:
+                    break
+                chains.append(external)
+                chains.append(self.scan_chain(
+                    semantic=semantic, account=_account, change=1
+                ))
+                account += 1
+        return chains
@@ -7,11 +7,24 @@
 from abc import (
     ABC, abstractmethod
 )
-from typing import Union
+from typing import (
+    Deque, Iterable, Iterator, Optional, Union
+)
+from concurrent.futures import (
+    Executor, Future, ThreadPoolExecutor
+)
+from collections import deque
+from itertools import (
+    repeat, zip_longest
+)
 
+import os
 import re
 
 from ..mnemonics import IMnemonic
+from ..exceptions import (
+    Error, SeedError
+)
 
 
 class ISeed(ABC):
@@ -68,3 +81,93 @@ class ISeed(ABC):
     @abstractmethod
     def from_mnemonic(cls, mnemonic: Union[str, IMnemonic], **kwargs) -> str:
         pass
+
+    @classmethod
+    def from_mnemonics(
+        cls,
+        mnemonics: Iterable[Union[str, IMnemonic]],
+        passphrases: Optional[Union[str, Iterable[Optional[str]]]] = None,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Converts many mnemonic phrases to their seeds, streamed in input order.
+
+        Every :meth:`from_mnemonic` call is run on a thread pool, ``hashlib`` releases the GIL
+        during PBKDF2, or on the given executor, e.g. a ``ProcessPoolExecutor``. The mnemonics
+        are consumed lazily while at most ``2 * workers`` seeds are in flight.
+
+        :param mnemonics: The mnemonic phrases, as strings or instances of `IMnemonic`.
+        :type mnemonics: Iterable[Union[str, IMnemonic]]
+        :param passphrases: One passphrase for every mnemonic, in the same order, or a single passphrase for all of them.
+        :type passphrases: Optional[Union[str, Iterable[Optional[str]]]]
+        :param workers: The number of worker threads and half the seeds kept in flight, defaults to the CPU count.
+                        ``1`` without an executor converts in-process.
+        :type workers: Optional[int]
+        :param executor: The executor to submit to instead of a thread pool, it is not shut down.
+        :type executor: Optional[Executor]
+        :param kwargs: Additional keyword arguments of :meth:`from_mnemonic`, e.g. ``cardano_type``.
+        :type kwargs: dict
+
+        :return: An iterator of the seeds as strings.
+        :rtype: Iterator[str]
+        """
+
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise Error("Invalid workers count", expected="positive integer", got=workers)
+        if executor is not None and not isinstance(executor, Executor):
+            raise Error("Invalid executor instance", expected=Executor, got=type(executor))
+
+        return cls._from_mnemonics(
+            mnemonics=mnemonics,
+            passphrases=passphrases,
+            workers=(workers if workers else (os.cpu_count() or 1)),
+            executor=executor,
+            **kwargs
+        )
+
+    @classmethod
+    def _from_mnemonics(
+        cls,
+        mnemonics: Iterable[Union[str, IMnemonic]],
+        passphrases: Optional[Union[str, Iterable[Optional[str]]]],
+        workers: int,
+        executor: Optional[Executor],
+        **kwargs
+    ) -> Iterator[str]:
+        missing: object = object()
+
+        def arguments() -> Iterator[dict]:
+            if passphrases is None:
+                for mnemonic in mnemonics:
+                    yield dict(mnemonic=mnemonic, **kwargs)
+                return
+            pairs: Iterator[tuple] = (
+                zip(mnemonics, repeat(passphrases)) if isinstance(passphrases, str) else
+                zip_longest(mnemonics, passphrases, fillvalue=missing)
+            )
+            for mnemonic, passphrase in pairs:
+                if mnemonic is missing or passphrase is missing:
+                    raise SeedError("Mnemonics and passphrases count mismatch")
+                yield dict(mnemonic=mnemonic, passphrase=passphrase, **kwargs)
+
+        if workers == 1 and executor is None:
+            for _kwargs in arguments():
+                yield cls.from_mnemonic(**_kwargs)
+            return
+
+        pool: Executor = executor if executor is not None else ThreadPoolExecutor(max_workers=workers)
+        pending: Deque[Future] = deque()
+        try:
+            for _kwargs in arguments():
+                if len(pending) >= (workers * 2):
+                    yield pending.popleft().result()
+                pending.append(pool.submit(cls.from_mnemonic, **_kwargs))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            if executor is None:
+                pool.shutdown(wait=True)
@@ -6,14 +6,17 @@
 
 from random import choice
 from typing import (
-    List, Tuple, AnyStr, Optional, Union, Literal
+    Any, List, Tuple, AnyStr, Optional, Sequence, Union, Literal
 )
 
 import binascii
 import string
+import struct
 import re
 
-from .exceptions import DerivationError
+from .exceptions import (
+    Error, DerivationError
+)
 
 
 def generate_passphrase(length: int = 32) -> str:
@@ -73,6 +76,138 @@ def exclude_keys(nested: dict, keys: set) -> dict:
     return new
 
 
+def select_keys(
+    nested: dict, include: Optional[set] = None, exclude: Optional[set] = None, parent: Optional[str] = None
+) -> dict:
+    """
+    Recursively select keys from a nested dictionary of lazy values, calling only the selected ones.
+
+    Callable values are lazy and are called only when their key is selected, other values are
+    kept as they are. A key is selected when ``include`` is None or holds its name, or, inside a
+    nested dictionary for which ``include`` holds ``parent:key`` pairs, only when it holds
+    ``parent:name``. A nested dictionary whose name is in ``include`` is selected as a whole,
+    otherwise it is kept only if some of its keys are selected. Keys in ``exclude`` are left
+    out as with :func:`exclude_keys`. Keys are checked after converting '-' to '_'.
+
+    :param nested: The nested dictionary of lazy values.
+    :type nested: dict
+    :param include: Optional set of keys, or ``parent:key`` pairs, to select.
+    :type include: Optional[set]
+    :param exclude: Optional set of keys to exclude from the dictionary.
+    :type exclude: Optional[set]
+    :param parent: The key of the nested dictionary within its parent, used to match ``parent:key`` pairs.
+    :type parent: Optional[str]
+
+    :return: A new dictionary with the selected values computed.
+    :rtype: dict
+    """
+
+    excludes: List[str] = [key.replace("-", "_") if isinstance(key, str) else key for key in (exclude or [])]
+    includes: Optional[List[str]] = (
+        None if include is None else [key.replace("-", "_") if isinstance(key, str) else key for key in include]
+    )
+
+    qualified: bool = includes is not None and parent is not None and any(
+        isinstance(key, str) and key.startswith(f"{parent}:") for key in includes
+    )
+    new: dict = { }
+    for _key, _value in nested.items():
+        name: str = _key.replace("-", "_") if isinstance(_key, str) else _key
+        selected: bool = includes is None or (
+            f"{parent}:{name}" in includes if qualified else name in includes
+        )
+        if isinstance(_value, dict):
+            _nested: dict = select_keys(
+                _value, (None if selected else include), exclude, name
+            )
+            if selected or _nested:
+                new[_key] = _nested
+        elif selected and _key not in excludes:
+            new[_key] = _value() if callable(_value) else _value
+    return new
+
+
+def pack_state(values: Sequence[Any]) -> bytes:
+    """
+    Pack a sequence of values into a compact, self-describing bytes blob.
+
+    Each value is a one byte tag followed by its payload: ``None``, booleans, non-negative
+    integers, bytes and strings up to 65535 bytes, and tuples or lists of these, which are
+    unpacked as tuples.
+
+    :param values: The values to pack.
+    :type values: Sequence[Any]
+
+    :return: The packed values.
+    :rtype: bytes
+    """
+
+    packed: bytearray = bytearray()
+    for value in values:
+        if value is None:
+            packed += b"N"
+        elif isinstance(value, bool):
+            packed += b"1" if value else b"0"
+        elif isinstance(value, int) and value >= 0:
+            data: bytes = value.to_bytes((value.bit_length() + 7) // 8, "big")
+            packed += b"I" + struct.pack(">B", len(data)) + data
+        elif isinstance(value, (bytes, bytearray, str)) and len(value) <= 0xFFFF:
+            data: bytes = value.encode("utf-8") if isinstance(value, str) else bytes(value)
+            packed += (b"S" if isinstance(value, str) else b"B") + struct.pack(">H", len(data)) + data
+        elif isinstance(value, (tuple, list)) and len(value) <= 0xFFFF:
+            packed += b"T" + struct.pack(">H", len(value)) + pack_state(value)
+        else:
+            raise Error("Invalid state value", expected="None, bool, int, bytes, str or tuple", got=value)
+    return bytes(packed)
+
+
+def unpack_state(data: bytes) -> Tuple[Any, ...]:
+    """
+    Unpack a bytes blob produced by :func:`pack_state`.
+
+    :param data: The packed values.
+    :type data: bytes
+
+    :return: The unpacked values.
+    :rtype: Tuple[Any, ...]
+    """
+
+    def unpack(position: int, count: Optional[int]) -> Tuple[Tuple[Any, ...], int]:
+        values: List[Any] = []
+        while (position < len(data)) if count is None else (len(values) < count):
+            tag: bytes = data[position:position + 1]
+            position += 1
+            if tag == b"N":
+                values.append(None)
+            elif tag in (b"0", b"1"):
+                values.append(tag == b"1")
+            elif tag == b"I":
+                length: int = data[position]
+                value: bytes = data[position + 1:position + 1 + length]
+                if len(value) != length:
+                    raise Error("Invalid state data", detail="truncated value")
+                values.append(int.from_bytes(value, "big"))
+                position += 1 + length
+            elif tag in (b"B", b"S"):
+                length: int = struct.unpack_from(">H", data, position)[0]
+                value: bytes = data[position + 2:position + 2 + length]
+                if len(value) != length:
+                    raise Error("Invalid state data", detail="truncated value")
+                values.append(value.decode("utf-8") if tag == b"S" else value)
+                position += 2 + length
+            elif tag == b"T":
+                value, position = unpack(position + 2, struct.unpack_from(">H", data, position)[0])
+                values.append(value)
+            else:
+                raise Error("Invalid state data", detail=f"unknown tag {tag!r} at position {position - 1}")
+        return tuple(values), position
+
+    try:
+        return unpack(0, None)[0]
+    except (IndexError, struct.error, UnicodeDecodeError) as error:
+        raise Error("Invalid state data", detail="truncated or malformed blob") from error
+
+
 def path_to_indexes(path: str) -> List[int]:
     """
     Convert a derivation path string into a list of indexes.
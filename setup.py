@@ -77,6 +77,7 @@ if __name__ == "__main__":
         extras_require=dict(
             cli=get_requirements(name="requirements/cli"),
             docs=get_requirements(name="requirements/docs"),
+            numpy=get_requirements(name="requirements/numpy"),
             tests=get_requirements(name="requirements/tests")
         ),
         classifiers=[
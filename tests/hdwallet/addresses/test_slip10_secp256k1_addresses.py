@@ -9,6 +9,7 @@ import json
 import os
 import pytest
 
+from hdwallet.addresses import ADDRESSES
 from hdwallet.addresses.p2pkh import P2PKHAddress
 from hdwallet.addresses.p2sh import P2SHAddress
 from hdwallet.addresses.p2wpkh import P2WPKHAddress
@@ -30,6 +31,9 @@ from hdwallet.addresses.okt_chain import OKTChainAddress
 from hdwallet.addresses.harmony import HarmonyAddress
 from hdwallet.addresses.zilliqa import ZilliqaAddress
 from hdwallet.addresses.injective import InjectiveAddress
+from hdwallet.crypto import hash160
+from hdwallet.exceptions import AddressError
+from hdwallet.utils import get_bytes
 
 
 def test_p2pkh_address(data):
@@ -61,6 +65,12 @@ def test_p2pkh_address(data):
         public_key_type=data["addresses"]["SLIP10-Secp256k1"]["addresses"]["P2PKH"]["uncompressed"]["args"]["public_key_type"]
     ) ==  data["addresses"]["SLIP10-Secp256k1"]["addresses"]["P2PKH"]["uncompressed"]["decode"]
 
+    assert ADDRESSES.encode_public_key_hash(
+        name=P2PKHAddress.name(),
+        public_key_hash=data["addresses"]["SLIP10-Secp256k1"]["addresses"]["P2PKH"]["compressed"]["decode"],
+        public_key_address_prefix=int(data["addresses"]["SLIP10-Secp256k1"]["addresses"]["P2PKH"]["compressed"]["args"]["public_key_address_prefix"], base=16)
+    ) == data["addresses"]["SLIP10-Secp256k1"]["addresses"]["P2PKH"]["compressed"]["encode"]
+
 
 def test_p2sh_address(data):
 
@@ -121,6 +131,12 @@ def test_p2wpkh_address(data):
         public_key_type=data["addresses"]["SLIP10-Secp256k1"]["addresses"]["P2WPKH"]["uncompressed"]["args"]["public_key_type"]
     ) ==  data["addresses"]["SLIP10-Secp256k1"]["addresses"]["P2WPKH"]["uncompressed"]["decode"]
 
+    assert ADDRESSES.encode_public_key_hash(
+        name=P2WPKHAddress.name(),
+        public_key_hash=data["addresses"]["SLIP10-Secp256k1"]["addresses"]["P2WPKH"]["compressed"]["decode"],
+        hrp=data["addresses"]["SLIP10-Secp256k1"]["addresses"]["P2WPKH"]["compressed"]["args"]["hrp"]
+    ) == data["addresses"]["SLIP10-Secp256k1"]["addresses"]["P2WPKH"]["compressed"]["encode"]
+
 
 def test_p2pkh_in_p2sh_address(data):
 
@@ -178,6 +194,45 @@ def test_p2tr_address(data):
     ) ==  data["addresses"]["SLIP10-Secp256k1"]["addresses"]["P2TR"]["uncompressed"]["decode"]
 
 
+def test_public_key_hash_encoding():
+
+    public_key: str = "0339a36013301597daef41fbe593a02cc513d0b55527ec2df1050e2e8ff49c85c2"
+    for encoder in [P2PKHAddress, P2SHAddress, P2WPKHAddress, P2WPKHInP2SHAddress]:
+        assert ADDRESSES.encode_public_key_hash(
+            name=encoder.name(), public_key_hash=hash160(get_bytes(public_key))
+        ) == encoder.encode(
+            public_key=public_key
+        )
+        with pytest.raises(TypeError):
+            encoder.encode(public_key=public_key, public_key_hash=bytes(20))
+        for public_key_hash in [None, bytes(19), bytes(21), bytes(32).hex()]:
+            with pytest.raises(AddressError, match="Invalid public key hash length"):
+                ADDRESSES.encode_public_key_hash(name=encoder.name(), public_key_hash=public_key_hash)
+    with pytest.raises(AddressError, match="Invalid public key hash address name"):
+        ADDRESSES.encode_public_key_hash(name=P2TRAddress.name(), public_key_hash=bytes(20))
+
+
+def test_p2wsh_address(data):
+
+    for public_key_type in ["compressed", "uncompressed"]:
+        public_key = data["addresses"]["SLIP10-Secp256k1"][f"{public_key_type}-public-key"]
+        witness_script_hash = P2WSHAddress.script_hash(public_key, public_key_type=public_key_type)
+        assert len(witness_script_hash) == 32
+
+        for encoder in [P2WSHAddress, P2WSHInP2SHAddress]:
+            assert ADDRESSES.encode_witness_script_hash(
+                name=encoder.name(), witness_script_hash=witness_script_hash
+            ) == encoder.encode(
+                public_key=public_key, public_key_type=public_key_type
+            )
+            with pytest.raises(TypeError):
+                encoder.encode(public_key=public_key, public_key_type=public_key_type, witness_script_hash=bytes(32))
+            with pytest.raises(AddressError, match="Invalid witness script hash length"):
+                ADDRESSES.encode_witness_script_hash(name=encoder.name(), witness_script_hash=witness_script_hash[:20])
+    with pytest.raises(AddressError, match="Invalid witness script hash address name"):
+        ADDRESSES.encode_witness_script_hash(name=P2WPKHAddress.name(), witness_script_hash=bytes(32))
+
+
 def test_ethereum_address(data):
 
     assert EthereumAddress.name() == data["addresses"]["SLIP10-Secp256k1"]["addresses"]["Ethereum"]["name"]
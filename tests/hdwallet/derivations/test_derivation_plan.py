@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from hdwallet.derivations import (
+    BIP44Derivation, CIP1852Derivation, CustomDerivation, ElectrumDerivation,
+    HDWDerivation, MoneroDerivation, DerivationPlan
+)
+
+
+def test_derivation_plan():
+
+    plan: DerivationPlan = DerivationPlan(derivation=CustomDerivation(path="m/0'/1-3/5-6'"))
+    assert plan.name() == "Custom"
+    assert plan.levels() == [range(0x80000000, 0x80000001), range(1, 4), range(0x80000005, 0x80000007)]
+    assert plan.prefix() == (0x80000000, )
+    assert plan.count() == len(plan) == 6
+    assert list(plan.indexes()) == [
+        (0x80000000, first, second) for first in (1, 2, 3) for second in (0x80000005, 0x80000006)
+    ]
+    assert [plan.derivation(components=components).path() for components, _ in plan] == [
+        f"m/0'/{first}/{second}'" for first in (1, 2, 3) for second in (5, 6)
+    ]
+
+    for derivation in [
+        BIP44Derivation(coin_type=0, account=(0, 1), address=(0, 2)),
+        CIP1852Derivation(role=1, address=(3, 4)),
+        ElectrumDerivation(change=(0, 1), address=(2, 4)),
+        MoneroDerivation(minor=(0, 2), major=1),
+        HDWDerivation(account=1, ecc="SLIP10-Ed25519", address=(1, 2))
+    ]:
+        plan: DerivationPlan = DerivationPlan(derivation=derivation)
+        leaves: list = list(plan)
+        assert len(leaves) == plan.count()
+        for components, indexes in leaves:
+            leaf = plan.derivation(components=components)
+            assert type(leaf) is type(derivation)
+            assert tuple(leaf.indexes()) == indexes
+        assert leaves[-1][1] == tuple(derivation.indexes())
+
+    assert DerivationPlan(derivation=BIP44Derivation(coin_type=60)).count() == 1
+
+    plan: DerivationPlan = DerivationPlan(derivation=BIP44Derivation(account=(0, 9), address=(0, 999999)))
+    assert plan.count() == 10_000_000
+    assert plan.levels()[-1] == range(0, 1_000_000)
+    assert next(iter(plan))[1] == (0x8000002C, 0x80000000, 0x80000000, 0, 0)
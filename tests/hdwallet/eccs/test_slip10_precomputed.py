@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from ecdsa.ecdsa import (
+    generator_secp256k1, generator_256
+)
+from ecdsa.ellipticcurve import INFINITY
+from ecdsa import (
+    SigningKey, curves, keys
+)
+
+import pytest
+
+from hdwallet.eccs.slip10.precomputed import FixedBaseTable
+from hdwallet.eccs.slip10.nist256p1 import (
+    SLIP10Nist256p1ECC, SLIP10Nist256p1Point, SLIP10Nist256p1PrivateKey
+)
+from hdwallet.eccs.slip10.secp256k1 import (
+    SLIP10Secp256k1ECCECDSA, SLIP10Secp256k1PointECDSA, SLIP10Secp256k1PrivateKeyECDSA
+)
+
+SCALARS = [
+    1, 2, 63, 64, 65, 0xFFFFFFFF,
+    0xe8f32e723decf4051aefac8e2c93c9c5b214313817cdb01a1494b917c8436b35,
+    0x4a7f2f9e7d4b3e1f5c6a8b9d0e1f2a3b4c5d6e7f8091a2b3c4d5e6f708192a3b,
+]
+
+
+def test_slip10_precomputed_fixed_base_table():
+
+    for generator in [generator_secp256k1, generator_256]:
+        table = FixedBaseTable(generator, window=4, threshold=0)
+        order = generator.order()
+        for scalar in SCALARS + [order - 1, order + 5]:
+            assert table.multiply(scalar) == generator * scalar
+        assert table.multiply(0) is INFINITY
+        assert table.multiply(order) is INFINITY
+        assert len(table.table()) == 64
+        assert len(table.table()[0]) == 16
+
+    table = FixedBaseTable(generator_secp256k1, threshold=2)
+    assert table.multiply(SCALARS[6]) == generator_secp256k1 * SCALARS[6]
+    assert table.multiply(SCALARS[7]) == generator_secp256k1 * SCALARS[7]
+    assert table._table is None
+    assert table.multiply(SCALARS[6]) == generator_secp256k1 * SCALARS[6]
+    assert table._table is not None
+
+
+def test_slip10_precomputed_generator_multiplication():
+
+    for ecc, point_class, generator in [
+        (SLIP10Secp256k1ECCECDSA, SLIP10Secp256k1PointECDSA, generator_secp256k1),
+        (SLIP10Nist256p1ECC, SLIP10Nist256p1Point, generator_256)
+    ]:
+        for scalar in SCALARS:
+            point = ecc.GENERATOR * scalar
+            assert isinstance(point, point_class)
+            assert point.raw_encoded() == point_class(generator * scalar).raw_encoded()
+            assert (scalar * ecc.GENERATOR).raw_encoded() == point.raw_encoded()
+
+
+def test_slip10_precomputed_signing_key():
+
+    for generator, curve, private_key_class in [
+        (generator_secp256k1, curves.SECP256k1, SLIP10Secp256k1PrivateKeyECDSA),
+        (generator_256, curves.NIST256p, SLIP10Nist256p1PrivateKey)
+    ]:
+        table = FixedBaseTable(generator, threshold=1)
+        for scalar in SCALARS:
+            key_bytes: bytes = scalar.to_bytes(32, "big")
+            signing_key = table.signing_key(key_bytes, curve=curve)
+            expected = SigningKey.from_string(key_bytes, curve=curve)
+            assert signing_key.to_string() == expected.to_string()
+            assert signing_key.get_verifying_key().to_string() == expected.get_verifying_key().to_string()
+            assert private_key_class.from_bytes(key_bytes).public_key().raw_compressed() == (
+                expected.get_verifying_key().to_string("compressed")
+            )
+        assert table._table is not None
+        for key_bytes in [bytes(32), generator.order().to_bytes(32, "big"), bytes(31)]:
+            with pytest.raises(keys.MalformedPointError):
+                table.signing_key(key_bytes, curve=curve)
+            with pytest.raises(ValueError, match="Invalid private key bytes"):
+                private_key_class.from_bytes(key_bytes)
@@ -5,9 +5,16 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+import pickle
+import pytest
+
 from hdwallet.cryptocurrencies import Bitcoin as Cryptocurrency
+from hdwallet.crypto import hmac_sha512
 from hdwallet.derivations import CustomDerivation
-from hdwallet.hds import BIP32HD
+from hdwallet.exceptions import Error
+from hdwallet.hds import (
+    BIP32HD, BIP32Node
+)
 
 
 def test_bip32_hd(data):
@@ -91,3 +98,137 @@ def test_bip32_hd(data):
         address=Cryptocurrency.ADDRESSES.P2WSH_IN_P2SH,
         script_address_prefix=Cryptocurrency.NETWORKS.MAINNET.SCRIPT_ADDRESS_PREFIX
     ) == data["hds"]["BIP32"]["derivation"]["addresses"]["p2wsh-in-p2sh"]
+
+
+def test_bip32_hd_node_cache():
+    bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC, wif_prefix=Cryptocurrency.NETWORKS.MAINNET.WIF_PREFIX, cache_size=8
+    )
+    bip32_hd.from_seed(seed="000102030405060708090a0b0c0d0e0f")
+
+    bip32_hd.update_derivation(derivation=CustomDerivation(path="m/0'/1"))
+    assert bip32_hd.xprivate_key() == "xprv9wTYmMFdV23N2TdNG573QoEsfRrWKQgWeibmLntzniatZvR9BmLnvSxqu53Kw1UmYPxLgboyZQaXwTCg8MSY3H2EU4pWcQDnRnrVA1xe8fs"
+    assert bip32_hd.cache_info() == {"hits": 0, "misses": 1, "size": 2, "max_size": 8}
+
+    bip32_hd.update_derivation(derivation=CustomDerivation(path="m/0'/1/2'"))
+    assert bip32_hd.xprivate_key() == "xprv9z4pot5VBttmtdRTWfWQmoH1taj2axGVzFqSb8C9xaxKymcFzXBDptWmT7FwuEzG3ryjH4ktypQSAewRiNMjANTtpgP4mLTj34bhnZX7UiM"
+    assert bip32_hd.cache_info() == {"hits": 2, "misses": 2, "size": 3, "max_size": 8}
+
+    bip32_hd.update_derivation(derivation=CustomDerivation(path="m/0'"))
+    assert bip32_hd.xprivate_key() == "xprv9uHRZZhk6KAJC1avXpDAp4MDc3sQKNxDiPvvkX8Br5ngLNv1TxvUxt4cV1rGL5hj6KCesnDYUhd7oWgT11eZG7XnxHrnYeSvkzY7d2bhkJ7"
+    assert bip32_hd.depth() == 1
+    assert bip32_hd.cache_info() == {"hits": 3, "misses": 2, "size": 3, "max_size": 8}
+
+    for index in range(10):
+        bip32_hd.update_derivation(derivation=CustomDerivation(path=f"m/0'/1/{index}"))
+    assert bip32_hd.cache_info()["size"] == 8
+
+    bip32_hd.cache_clear()
+    assert bip32_hd.cache_info() == {"hits": 0, "misses": 0, "size": 0, "max_size": 8}
+
+
+def test_bip32_hd_derive_children():
+    bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC, wif_prefix=Cryptocurrency.NETWORKS.MAINNET.WIF_PREFIX
+    )
+    bip32_hd.from_seed(seed="000102030405060708090a0b0c0d0e0f")
+
+    children = bip32_hd.derive_children(parent_path="m/0'/1", start=0, count=3)
+    assert [child.index for child in children] == [0, 1, 2]
+    assert bip32_hd.path() == "m/"
+
+    for child in children:
+        bip32_hd.update_derivation(derivation=CustomDerivation(path=f"m/0'/1/{child.index}"))
+        assert child.depth == bip32_hd.depth()
+        assert child.private_key.hex() == bip32_hd.private_key()
+        assert child.public_key.hex() == bip32_hd.public_key()
+        assert child.chain_code.hex() == bip32_hd.chain_code()
+        assert child.fingerprint.hex() == bip32_hd.fingerprint()
+        assert child.parent_fingerprint.hex() == bip32_hd.parent_fingerprint()
+
+    hardened = bip32_hd.derive_children(parent_path="m/0'/1", start=0x80000002, count=1)[0]
+    bip32_hd.update_derivation(derivation=CustomDerivation(path="m/0'/1/2'"))
+    assert bip32_hd.xprivate_key() == "xprv9z4pot5VBttmtdRTWfWQmoH1taj2axGVzFqSb8C9xaxKymcFzXBDptWmT7FwuEzG3ryjH4ktypQSAewRiNMjANTtpgP4mLTj34bhnZX7UiM"
+    assert hardened.private_key.hex() == bip32_hd.private_key()
+    assert hardened.chain_code.hex() == bip32_hd.chain_code()
+
+
+def test_bip32_hd_invalid_child_boundary():
+
+    class Context:
+
+        def __init__(self, il: int) -> None:
+            self.il = il
+
+        def compute(self, data: bytes) -> bytes:
+            return self.il.to_bytes(32, "big") + bytes(32)
+
+    bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC, wif_prefix=Cryptocurrency.NETWORKS.MAINNET.WIF_PREFIX
+    )
+    bip32_hd.from_seed(seed="000102030405060708090a0b0c0d0e0f")
+    order: int = Cryptocurrency.ECC.ORDER
+
+    for il, valid in [(order + 1, False), (order, False), (order - 1, True)]:
+        for node in [bip32_hd._node, bip32_hd._node.replace(private_key=None)]:
+            node = node.replace()
+            object.__setattr__(node, "_hmac", Context(il))
+            assert (node.child_raw(1) is not None) == valid
+            assert (node.child(1) is not None) == valid
+            bip32_hd._node = node
+            assert len(bip32_hd.derive_children(start=1, count=1)) == int(valid)
+
+
+def test_bip32_hd_xpublic_key_derivation():
+    bip32_hd: BIP32HD = BIP32HD(ecc=Cryptocurrency.ECC)
+    bip32_hd.from_xpublic_key(
+        xpublic_key="xpub6D4BDPcP2GT577Vvch3R8wDkScZWzQzMMUm3PWbmWvVJrZwQY4VUNgqFJPMM3No2dFDFGTsxxpG5uJh7n7epu4trkrX7x7DogT5Uv6fcLW5"
+    )
+
+    bip32_hd.update_derivation(derivation=CustomDerivation(path="m/2"))
+    assert bip32_hd.public_key() == "02e8445082a72f29b75ca48748a914df60622a609cacfce8ed0e35804560741d29"
+    assert bip32_hd.chain_code() == "cfb71883f01676f587d023cc53a35bc7f88f724b1f8c2892ac1275ac822a3edd"
+
+    children = bip32_hd.derive_children(parent_path="m/", start=0, count=4)
+    for child in children:
+        bip32_hd.update_derivation(derivation=CustomDerivation(path=f"m/{child.index}"))
+        assert child.private_key is None
+        assert child.public_key.hex() == bip32_hd.public_key()
+        assert child.chain_code.hex() == bip32_hd.chain_code()
+        assert child.fingerprint.hex() == bip32_hd.fingerprint()
+
+
+def test_bip32_node():
+    bip32_hd: BIP32HD = BIP32HD(
+        ecc=Cryptocurrency.ECC, wif_prefix=Cryptocurrency.NETWORKS.MAINNET.WIF_PREFIX
+    )
+    bip32_hd.from_seed(seed="000102030405060708090a0b0c0d0e0f")
+    bip32_hd.update_derivation(derivation=CustomDerivation(path="m/0'/1"))
+
+    root: BIP32Node = bip32_hd._root_node
+    node: BIP32Node = root.child(0x80000000).child(1)
+
+    assert node == bip32_hd._node
+    assert node.depth() == 2
+    assert node.index() == 1
+    assert node.private_key().hex() == bip32_hd.private_key()
+    assert node.chain_code().hex() == bip32_hd.chain_code()
+    assert node.public_key().hex() == bip32_hd.public_key()
+    assert node.fingerprint().hex() == bip32_hd.fingerprint() == "bef5a2f9"
+    assert node.parent_fingerprint().hex() == bip32_hd.parent_fingerprint() == "5c1bd648"
+    assert bip32_hd.private_key_bytes() == node.private_key()
+    assert bip32_hd.chain_code_bytes() == node.chain_code()
+    assert bip32_hd.public_key_bytes() == node.public_key()
+    assert bip32_hd.public_key_bytes(public_key_type="uncompressed").hex() == bip32_hd.uncompressed()
+
+    with pytest.raises(Error, match="BIP32Node is immutable"):
+        node._depth = 3
+
+    assert pickle.loads(pickle.dumps(node)) == node
+    assert node.replace(index=2) != node
+    assert root.child(0x80000000).child(1) is not node
+
+    context = node.chain_code_hmac()
+    assert context is node.chain_code_hmac()
+    assert context.compute(b"data") == hmac_sha512(node.chain_code(), b"data")
+    assert pickle.loads(pickle.dumps(node)).chain_code_hmac().compute(b"data") == context.compute(b"data")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from concurrent.futures import (
+    ProcessPoolExecutor, ThreadPoolExecutor
+)
+
+import asyncio
+
+from hdwallet import HDWallet
+from hdwallet.aio import AsyncHDWallet
+from hdwallet.cryptocurrencies import Bitcoin as Cryptocurrency
+from hdwallet.derivations import BIP44Derivation
+from hdwallet.hds import BIP44HD
+from hdwallet.mnemonics import BIP39Mnemonic
+from hdwallet.parallel import ParallelDeriver
+
+MNEMONIC: str = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+
+
+def hdwallet() -> HDWallet:
+    return HDWallet(
+        cryptocurrency=Cryptocurrency, hd=BIP44HD, network=Cryptocurrency.NETWORKS.MAINNET
+    )
+
+
+def test_async_hdwallet():
+
+    expected: HDWallet = hdwallet().from_mnemonic(
+        mnemonic=BIP39Mnemonic(mnemonic=MNEMONIC)
+    ).from_derivation(
+        derivation=BIP44Derivation(coin_type=Cryptocurrency.COIN_TYPE, address=(0, 24))
+    )
+
+    async def run(executor) -> None:
+        wallet: AsyncHDWallet = AsyncHDWallet(hdwallet=hdwallet(), executor=executor)
+        await wallet.from_mnemonic(mnemonic=BIP39Mnemonic(mnemonic=MNEMONIC))
+        await wallet.from_derivation(
+            derivation=BIP44Derivation(coin_type=Cryptocurrency.COIN_TYPE, address=(0, 24))
+        )
+        assert wallet.hdwallet().seed() == expected.seed()
+        assert await wallet.dump() == expected.dump()
+        assert await wallet.dumps() == expected.dumps()
+        assert await wallet.derive_children(parent_path="m/44'/0'/0'/0", count=3) == expected.derive_children(
+            parent_path="m/44'/0'/0'/0", count=3
+        )
+        assert [item async for item in wallet.iter_derivations(chunk_size=7)] == expected.dumps(exclude={"root"})
+        assert [item async for item in wallet.iter_addresses(
+            parent_path="m/44'/0'/0'/0", index=(0, 49), chunk_size=8, prefetch=3
+        )] == list(ParallelDeriver(
+            hdwallet=expected, parent_path="m/44'/0'/0'/0", workers=1
+        ).derive(index=(0, 49)))
+
+    asyncio.run(run(None))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        asyncio.run(run(executor))
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        asyncio.run(run(executor))
+
+
+def test_async_hdwallet_cancellation():
+
+    chunks: list = []
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def submit(self, *args, **kwargs):
+            chunks.append(args)
+            return super(CountingExecutor, self).submit(*args, **kwargs)
+
+    async def run(executor) -> None:
+        wallet: AsyncHDWallet = AsyncHDWallet(hdwallet=hdwallet().from_mnemonic(
+            mnemonic=BIP39Mnemonic(mnemonic=MNEMONIC)
+        ), executor=executor)
+
+        addresses = wallet.iter_addresses(parent_path="m/44'/0'/0'/0", index=(0, 99_999), chunk_size=10, prefetch=2)
+        async for item in addresses:
+            if item.index == 14:
+                break
+        await addresses.aclose()
+        assert len(chunks) == 3
+
+        async def consume() -> None:
+            async for _ in wallet.iter_addresses(parent_path="m/44'/0'/0'/0", index=(0, 99_999), chunk_size=10):
+                await asyncio.sleep(0)
+
+        chunks.clear()
+        task: asyncio.Task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        submitted: int = len(chunks)
+        await asyncio.sleep(0.05)
+        assert len(chunks) == submitted < 10_000
+
+    with CountingExecutor(max_workers=2) as executor:
+        asyncio.run(run(executor))
+
+
+def test_async_hdwallet_concurrent_updates():
+
+    expected: HDWallet = hdwallet().from_mnemonic(
+        mnemonic=BIP39Mnemonic(mnemonic=MNEMONIC)
+    ).from_derivation(
+        derivation=BIP44Derivation(coin_type=Cryptocurrency.COIN_TYPE, address=3)
+    )
+
+    async def run(executor) -> None:
+        wallet: AsyncHDWallet = AsyncHDWallet(hdwallet=hdwallet(), executor=executor)
+        await asyncio.gather(
+            wallet.from_mnemonic(mnemonic=BIP39Mnemonic(mnemonic=MNEMONIC)),
+            wallet.from_derivation(derivation=BIP44Derivation(coin_type=Cryptocurrency.COIN_TYPE, address=3))
+        )
+        assert wallet.hdwallet().seed() == expected.seed()
+        assert wallet.hdwallet().address() == expected.address()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        asyncio.run(run(executor))
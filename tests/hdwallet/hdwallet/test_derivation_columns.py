@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from array import array
+
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.columns import DerivationColumns
+from hdwallet.cryptocurrencies import Bitcoin as Cryptocurrency
+from hdwallet.derivations import CustomDerivation
+from hdwallet.exceptions import Error
+from hdwallet.hds import BIP32HD
+from hdwallet.seeds import BIP39Seed
+
+
+def hdwallet() -> HDWallet:
+    return HDWallet(
+        cryptocurrency=Cryptocurrency, hd=BIP32HD, network=Cryptocurrency.NETWORKS.MAINNET
+    ).from_seed(
+        seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+    ).from_derivation(
+        derivation=CustomDerivation(path="m/0'/0-4")
+    )
+
+
+def test_derivation_columns():
+
+    children = hdwallet().derive_children(parent_path="m/0'", start=0, count=5)
+    columns = DerivationColumns(fields=["index", "public_key", "hash"]).extend(children)
+
+    assert len(columns) == 5
+    assert columns.kind("index") == "int" and columns.kind("public_key") == "bytes"
+    assert columns.column("index") == array("I", range(5))
+    assert columns.column("public_key") == b"".join(child.public_key for child in children)
+    assert [row.as_dict() for row in columns] == [
+        dict(index=child.index, public_key=child.public_key, hash=child.hash) for child in children
+    ]
+    assert columns[-1].public_key == children[-1].public_key
+    assert columns[2]["hash"] == children[2].hash
+    assert columns.nbytes() == 5 * (4 + 33 + 20)
+
+    with pytest.raises(IndexError):
+        columns[5]
+    with pytest.raises(Error):
+        columns.append(dict(index=5, public_key=b"\x02", hash=children[0].hash))
+    assert len(columns) == 5
+    with pytest.raises(Error):
+        DerivationColumns(fields=["index", "index"])
+
+
+def test_hdwallet_columns():
+
+    dumps = hdwallet().dumps(exclude={"root"})
+    columns = hdwallet().columns(fields=["at:path", "at:index", "public_key", "addresses:p2wpkh"])
+
+    assert columns.kind("public_key") == "hex" and columns.kind("addresses:p2wpkh") == "str"
+    assert [row.as_dict() for row in columns] == [
+        {
+            "at:path": dump["at"]["path"], "at:index": dump["at"]["index"],
+            "public_key": dump["public_key"], "addresses:p2wpkh": dump["addresses"]["p2wpkh"]
+        } for dump in dumps
+    ]
+    assert columns.column("addresses:p2wpkh") == [dump["addresses"]["p2wpkh"] for dump in dumps]
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import (
+    Bitcoin, BitcoinCash
+)
+from hdwallet.derivations import (
+    BIP44Derivation, CHANGES
+)
+from hdwallet.hds import (
+    BIP32HD, BIP44HD
+)
+from hdwallet.seeds import BIP39Seed
+from hdwallet.utils import select_keys
+
+
+def test_select_keys():
+
+    calls: list = []
+
+    def lazy(value: str):
+        def compute() -> str:
+            calls.append(value)
+            return value
+        return compute
+
+    nested: dict = dict(
+        at=dict(path="m/0", index=0), address=lazy("address"), wif=lazy("wif"), addresses=dict(
+            p2pkh=lazy("p2pkh"), p2sh=lazy("p2sh"), **{"legacy-p2pkh": lazy("legacy-p2pkh")}
+        )
+    )
+
+    assert select_keys(nested, include={"at:path", "address"}) == dict(at=dict(path="m/0"), address="address")
+    assert calls == ["address"]
+    assert select_keys(nested, include={"addresses:legacy-p2pkh"}) == dict(addresses={"legacy-p2pkh": "legacy-p2pkh"})
+    assert select_keys(nested, include={"at"}) == dict(at=dict(path="m/0", index=0))
+    assert select_keys(nested, include={"addresses"}, exclude={"p2sh"}) == dict(
+        addresses={"p2pkh": "p2pkh", "legacy-p2pkh": "legacy-p2pkh"}
+    )
+    assert calls == ["address", "legacy-p2pkh", "p2pkh", "legacy-p2pkh"]
+
+
+def test_dump_include():
+
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=Bitcoin, hd=BIP44HD, network=Bitcoin.NETWORKS.MAINNET
+    ).from_seed(
+        seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+    ).from_derivation(
+        derivation=BIP44Derivation(
+            coin_type=Bitcoin.COIN_TYPE, account=0, change=CHANGES.EXTERNAL_CHAIN, address=(0, 1)
+        )
+    )
+
+    dumps: list = hdwallet.dumps(exclude={"root"})
+    full: dict = hdwallet.dump()
+    assert hdwallet.dump(include={"xpublic_key", "at:path"}) == dict(derivation=dict(
+        at=dict(path=full["derivation"]["at"]["path"]), xpublic_key=full["derivation"]["xpublic_key"]
+    ))
+    assert hdwallet.dump(include={"symbol", "wif"}, exclude={"derivation"}) == dict(symbol="BTC")
+    assert hdwallet.dump(include={"at"}, exclude={"root", "depth"}) == dict(at={
+        key: value for key, value in full["derivation"]["at"].items() if key != "depth"
+    })
+
+    assert hdwallet.dump(include={"address"}, exclude={"root"}) == dict(
+        at=dict(address=full["derivation"]["at"]["address"]), address=full["derivation"]["address"]
+    )
+
+    hdwallet.update_derivation(
+        derivation=BIP44Derivation(
+            coin_type=Bitcoin.COIN_TYPE, account=0, change=CHANGES.EXTERNAL_CHAIN, address=(0, 1)
+        )
+    )
+    assert list(hdwallet.iter_derivations(include={"at:path", "address"})) == [
+        dict(at=dict(path=item["at"]["path"]), address=item["address"]) for item in dumps
+    ]
+
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=BitcoinCash, hd=BIP32HD, network=BitcoinCash.NETWORKS.MAINNET
+    ).from_seed(
+        seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+    ).from_derivation(
+        derivation=BIP44Derivation(coin_type=BitcoinCash.COIN_TYPE)
+    )
+    full: dict = hdwallet.dump(exclude={"root"})
+    assert hdwallet.dump(include={"addresses:legacy-p2pkh"}, exclude={"root"}) == dict(addresses={
+        "legacy-p2pkh": full["addresses"]["legacy-p2pkh"]
+    })
+
+
+def test_dump_addresses_fan_out():
+
+    for public_key_type in ["compressed", "uncompressed"]:
+        hdwallet: HDWallet = HDWallet(
+            cryptocurrency=Bitcoin, hd=BIP32HD, network=Bitcoin.NETWORKS.MAINNET, public_key_type=public_key_type
+        ).from_seed(
+            seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+        ).from_derivation(
+            derivation=BIP44Derivation(coin_type=Bitcoin.COIN_TYPE, address=3)
+        )
+        assert hdwallet.dump(include={"addresses"}, exclude={"root"}) == dict(addresses={
+            address.lower().replace("-", "_"): hdwallet.address(address=address)
+            for address in Bitcoin.ADDRESSES.get_addresses()
+        })
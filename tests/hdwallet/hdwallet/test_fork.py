@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from concurrent.futures import ThreadPoolExecutor
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import Bitcoin
+from hdwallet.derivations import (
+    BIP44Derivation, ElectrumDerivation
+)
+from hdwallet.entropies import ElectrumV2Entropy
+from hdwallet.hds import (
+    BIP44HD, ElectrumV2HD
+)
+from hdwallet.seeds import BIP39Seed
+
+
+def test_fork():
+
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=Bitcoin, hd=BIP44HD, network=Bitcoin.NETWORKS.MAINNET
+    ).from_seed(
+        seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+    ).from_derivation(
+        derivation=BIP44Derivation(coin_type=Bitcoin.COIN_TYPE, address=3)
+    )
+    dump: dict = hdwallet.dump()
+
+    fork: HDWallet = hdwallet.fork()
+    assert fork.dump() == dump
+    fork.update_derivation(derivation=BIP44Derivation(coin_type=Bitcoin.COIN_TYPE, account=1, address=7))
+    assert fork.path() == "m/44'/0'/1'/0/7"
+    assert hdwallet.dump() == dump
+    fork.clean_derivation()
+    assert hdwallet.path() == "m/44'/0'/0'/0/3"
+
+    def derive(address: int) -> dict:
+        return hdwallet.fork().update_derivation(
+            derivation=BIP44Derivation(coin_type=Bitcoin.COIN_TYPE, account=address % 3, address=address)
+        ).dump(exclude={"root"})
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        dumps: list = list(executor.map(derive, range(40)))
+    for address, item in enumerate(dumps):
+        assert item == hdwallet.fork().update_derivation(
+            derivation=BIP44Derivation(coin_type=Bitcoin.COIN_TYPE, account=address % 3, address=address)
+        ).dump(exclude={"root"})
+    assert hdwallet.dump() == dump
+
+
+def test_fork_electrum_v2():
+
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=Bitcoin, hd=ElectrumV2HD, network=Bitcoin.NETWORKS.MAINNET
+    ).from_entropy(
+        entropy=ElectrumV2Entropy(entropy="0909d49a61e5289873d16ddbe3f781eedf")
+    ).from_derivation(
+        derivation=ElectrumDerivation(change=0, address=1)
+    )
+    dump: dict = hdwallet.dump()
+
+    fork: HDWallet = hdwallet.fork().update_derivation(derivation=ElectrumDerivation(change=1, address=5))
+    assert fork.address() == hdwallet.fork().update_derivation(
+        derivation=ElectrumDerivation(change=1, address=5)
+    ).address() != hdwallet.address()
+    assert hdwallet.dump() == dump
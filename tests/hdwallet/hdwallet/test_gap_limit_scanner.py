@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import Bitcoin as Cryptocurrency
+from hdwallet.derivations import CustomDerivation
+from hdwallet.hds import BIP32HD
+from hdwallet.scanner import GapLimitScanner
+from hdwallet.seeds import BIP39Seed
+
+
+def test_gap_limit_scanner():
+
+    def hdwallet() -> HDWallet:
+        return HDWallet(
+            cryptocurrency=Cryptocurrency, hd=BIP32HD, network=Cryptocurrency.NETWORKS.MAINNET
+        ).from_seed(
+            seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+        )
+
+    _hdwallet: HDWallet = hdwallet()
+    used: set = set()
+    for path, address in [
+        ("m/44'/0'/0'/0/3", "P2PKH"),
+        ("m/44'/0'/0'/0/10", "P2PKH"),
+        ("m/44'/0'/0'/1/0", "P2PKH"),
+        ("m/84'/0'/0'/0/0", "P2WPKH"),
+        ("m/84'/0'/1'/0/4", "P2WPKH"),
+        ("m/86'/0'/0'/0/1", "P2TR")
+    ]:
+        _hdwallet.update_derivation(derivation=CustomDerivation(path=path))
+        used.add(_hdwallet.address(address=address))
+
+    scanner: GapLimitScanner = GapLimitScanner(hdwallet=hdwallet(), used=used, gap_limit=5, batch_size=3)
+    assert scanner.semantics() == ["BIP44", "BIP49", "BIP84", "BIP86"]
+
+    chains = scanner.scan()
+    assert [
+        (chain.semantic, chain.account, chain.change, chain.last_index) for chain in chains
+    ] == [
+        ("BIP44", 0, 0, 3), ("BIP44", 0, 1, 0),
+        ("BIP84", 0, 0, 0), ("BIP84", 0, 1, None),
+        ("BIP84", 1, 0, 4), ("BIP84", 1, 1, None),
+        ("BIP86", 0, 0, 1), ("BIP86", 0, 1, None)
+    ]
+    assert [item.path for item in chains[0].used] == ["m/44'/0'/0'/0/3"]
+
+    chain = GapLimitScanner(hdwallet=hdwallet(), used=used, gap_limit=7).scan_chain(semantic="BIP44")
+    assert [item.index for item in chain.used] == [3, 10]
+    assert chain.last_index == 10
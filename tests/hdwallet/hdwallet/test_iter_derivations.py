@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import Bitcoin as Cryptocurrency
+from hdwallet.derivations import (
+    BIP44Derivation, CustomDerivation, CHANGES
+)
+from hdwallet.hds import (
+    BIP32HD, BIP44HD
+)
+from hdwallet.seeds import BIP39Seed
+
+
+def test_iter_derivations():
+
+    def hdwallet() -> HDWallet:
+        return HDWallet(
+            cryptocurrency=Cryptocurrency, hd=BIP44HD, network=Cryptocurrency.NETWORKS.MAINNET
+        ).from_seed(
+            seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+        ).from_derivation(
+            derivation=BIP44Derivation(
+                coin_type=Cryptocurrency.COIN_TYPE, account=(0, 1), change=CHANGES.EXTERNAL_CHAIN, address=(0, 2)
+            )
+        )
+
+    dumps = hdwallet().dumps(exclude={"root"})
+    derivations = list(hdwallet().iter_derivations())
+    assert derivations == dumps
+    assert [item["at"]["path"] for item in derivations] == [
+        "m/44'/0'/0'/0/0", "m/44'/0'/0'/0/1", "m/44'/0'/0'/0/2",
+        "m/44'/0'/1'/0/0", "m/44'/0'/1'/0/1", "m/44'/0'/1'/0/2"
+    ]
+
+    _hdwallet: HDWallet = hdwallet()
+    for index, item in enumerate(_hdwallet.iter_derivations(exclude={"indexes"})):
+        assert "indexes" not in item["at"]
+        if index == 1:
+            break
+    assert _hdwallet.dump() == hdwallet().dump()
+
+
+def test_iter_derivations_prefix_reuse(monkeypatch):
+
+    calls: list = []
+    drive = BIP32HD.drive
+
+    def counted_drive(self, index: int):
+        calls.append(index)
+        return drive(self, index)
+
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=Cryptocurrency, hd=BIP32HD, network=Cryptocurrency.NETWORKS.MAINNET
+    ).from_seed(
+        seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+    ).from_derivation(
+        derivation=CustomDerivation(path="m/44'/0'/0'/0-1/0-9")
+    )
+    expected: list = [
+        HDWallet(
+            cryptocurrency=Cryptocurrency, hd=BIP32HD, network=Cryptocurrency.NETWORKS.MAINNET
+        ).from_seed(
+            seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+        ).from_derivation(
+            derivation=CustomDerivation(path=f"m/44'/0'/0'/{change}/{address}")
+        ).dump(exclude={"root"}) for change in range(2) for address in range(10)
+    ]
+
+    monkeypatch.setattr(BIP32HD, "drive", counted_drive)
+    assert list(hdwallet.iter_derivations()) == expected
+    assert len(calls) == 3 + 2 + 20
+    assert hdwallet.path() == "m/44'/0'/0'/1/9"
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.addresses import (
+    ADDRESSES, P2PKHAddress, P2WPKHAddress
+)
+from hdwallet.cryptocurrencies import Bitcoin as Cryptocurrency
+from hdwallet.derivations import CustomDerivation
+from hdwallet.exceptions import (
+    AddressError, HDError
+)
+from hdwallet.hds import (
+    BIP32HD, ElectrumV1HD
+)
+from hdwallet.seeds import BIP39Seed
+
+
+def test_node_accessors():
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=Cryptocurrency, hd=BIP32HD, network=Cryptocurrency.NETWORKS.MAINNET
+    ).from_seed(
+        seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+    )
+
+    node = hdwallet.node(parent_path="m/44'/0'/0'/0")
+    hdwallet.update_derivation(derivation=CustomDerivation(path="m/44'/0'/0'/0"))
+    assert node.public_key().hex() == hdwallet.public_key()
+    assert hdwallet.node().public_key() == node.public_key()
+
+    encoder, options = hdwallet.address_encoder()
+    assert encoder is P2PKHAddress
+    assert encoder.encode(public_key=node.public_key(), **options) == hdwallet.address()
+    encoder, options = hdwallet.address_encoder(address=P2WPKHAddress)
+    assert encoder.encode(public_key=node.public_key(), **options) == hdwallet.address(address="P2WPKH")
+
+    assert ADDRESSES.is_public_key_hash(name="P2WPKH-In-P2SH")
+    assert not ADDRESSES.is_public_key_hash(name="P2TR")
+
+    with pytest.raises(AddressError):
+        hdwallet.address_encoder(address="Ethereum")
+    with pytest.raises(HDError):
+        HDWallet(cryptocurrency=Cryptocurrency, hd=ElectrumV1HD).node()
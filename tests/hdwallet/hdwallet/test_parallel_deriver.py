@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import Bitcoin as Cryptocurrency
+from hdwallet.derivations import CustomDerivation
+from hdwallet.exceptions import HDError
+from hdwallet.hds import (
+    BIP32HD, ElectrumV1HD
+)
+from hdwallet.parallel import ParallelDeriver
+from hdwallet.seeds import BIP39Seed
+
+
+def test_parallel_deriver():
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=Cryptocurrency, hd=BIP32HD, network=Cryptocurrency.NETWORKS.MAINNET
+    ).from_seed(
+        seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+    )
+
+    deriver: ParallelDeriver = ParallelDeriver(
+        hdwallet=hdwallet, parent_path="m/44'/0'/0'/0", workers=2, chunk_size=3
+    )
+    assert deriver.chunks(index=(0, 7, False)) == [(0, 3, False), (3, 6, False), (6, 8, False)]
+    assert deriver.chunks(index="5") == [(5, 6, False)]
+
+    derived = list(deriver.derive(index=(0, 7)))
+    assert [item.index for item in derived] == list(range(8))
+    assert derived == list(ParallelDeriver(
+        hdwallet=hdwallet, parent_path="m/44'/0'/0'/0", workers=1, chunk_size=3
+    ).derive(index="0-7"))
+
+    for item in derived:
+        hdwallet.update_derivation(derivation=CustomDerivation(path=f"m/44'/0'/0'/0/{item.index}"))
+        assert item.public_key.hex() == hdwallet.public_key()
+        assert item.address == hdwallet.address()
+
+    hardened = list(ParallelDeriver(
+        hdwallet=hdwallet, parent_path="m/44'", workers=1
+    ).derive(index=(0, 1, True)))
+    hdwallet.update_derivation(derivation=CustomDerivation(path="m/44'/1'"))
+    assert hardened[1].index == 0x80000001
+    assert hardened[1].address == hdwallet.address()
+
+    with pytest.raises(HDError):
+        ParallelDeriver(
+            hdwallet=HDWallet(cryptocurrency=Cryptocurrency, hd=ElectrumV1HD)
+        )
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import time
+
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.cache import (
+    ICache, LRUCache
+)
+from hdwallet.cryptocurrencies import (
+    Bitcoin, Litecoin, Monero
+)
+from hdwallet.derivations import (
+    BIP44Derivation, CustomDerivation, ElectrumDerivation, MoneroDerivation
+)
+from hdwallet.entropies import (
+    ElectrumV1Entropy, MoneroEntropy
+)
+from hdwallet.exceptions import Error
+from hdwallet.hds import (
+    BIP32HD, BIP44HD, ElectrumV1HD, MoneroHD
+)
+from hdwallet.seeds import BIP39Seed
+
+
+class DictCache(ICache):
+
+    def __init__(self) -> None:
+        self.entries: dict = { }
+
+    def get(self, key, default=None):
+        return self.entries.get(key, default)
+
+    def put(self, key, value) -> None:
+        self.entries[key] = value
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+def test_lru_cache_ttl():
+
+    cache: LRUCache = LRUCache(max_size=2, ttl=0.05)
+    assert cache.ttl() == 0.05
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert "a" in cache
+    time.sleep(0.06)
+    assert "a" not in cache
+    assert len(cache) == 0
+    cache.put("a", 1)
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.info() == {"hits": 1, "misses": 1, "size": 0, "max_size": 2}
+
+    for ttl in [0, -1, "1", True]:
+        with pytest.raises(Error, match="Invalid cache TTL"):
+            LRUCache(ttl=ttl)
+
+
+def test_hdwallet_lookup():
+
+    cache: LRUCache = LRUCache(max_size=64)
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=Bitcoin, hd=BIP44HD, network=Bitcoin.NETWORKS.MAINNET, cache=cache
+    ).from_seed(
+        seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+    )
+    assert hdwallet.cache() is cache
+    path: str = hdwallet.path()
+
+    derivation: BIP44Derivation = BIP44Derivation(coin_type=Bitcoin.COIN_TYPE, address=5)
+    expected: HDWallet = hdwallet.fork().update_derivation(derivation=derivation)
+    assert hdwallet.lookup(derivation=derivation) == expected.address()
+    assert hdwallet.lookup(derivation=derivation) == expected.address()
+    assert hdwallet.lookup(derivation=derivation, field="address", address="P2TR") == expected.address(address="P2TR")
+    assert hdwallet.lookup(derivation=derivation, field="xpublic_key") == expected.xpublic_key()
+    assert cache.info() == {"hits": 1, "misses": 3, "size": 3, "max_size": 64}
+
+    assert hdwallet.lookup(derivation=derivation, field="wif") == expected.wif()
+    assert len(cache) == 3
+    assert hdwallet.path() == path
+
+    other: HDWallet = HDWallet(
+        cryptocurrency=Bitcoin, hd=BIP44HD, network=Bitcoin.NETWORKS.MAINNET, cache=cache
+    ).from_seed(
+        seed=BIP39Seed(seed="fffcf9f6f3f0edeae7e4e1dedbd8d5d2cfccc9c6c3c0bdbab7b4b1aeaba8a5a29f9c999693908d8a8784817e7b7875726f6c696663605d5a5754514e4b484542")
+    )
+    assert other.lookup(derivation=derivation) == other.fork().update_derivation(derivation=derivation).address()
+    assert other.lookup(derivation=derivation) != hdwallet.lookup(derivation=derivation)
+
+    derivation: CustomDerivation = CustomDerivation(path="m/0/0")
+    for cryptocurrency, network in [
+        (Bitcoin, Bitcoin.NETWORKS.MAINNET), (Litecoin, Litecoin.NETWORKS.MAINNET), (Bitcoin, Bitcoin.NETWORKS.TESTNET)
+    ]:
+        coin: HDWallet = HDWallet(
+            cryptocurrency=cryptocurrency, hd=BIP32HD, network=network, cache=cache
+        ).from_seed(
+            seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+        )
+        assert coin.lookup(derivation=derivation, address="P2PKH") == coin.fork().update_derivation(
+            derivation=derivation
+        ).address(address="P2PKH")
+
+    with pytest.raises(Error, match="Invalid lookup field"):
+        hdwallet.lookup(derivation=derivation, field="dump")
+    with pytest.raises(Error, match="Invalid cache instance"):
+        HDWallet(cryptocurrency=Bitcoin, cache=dict())
+
+
+def test_hdwallet_lookup_backend():
+
+    backend: DictCache = DictCache()
+    for hdwallet, derivation in [
+        (
+            HDWallet(cryptocurrency=Bitcoin, hd=ElectrumV1HD, cache=backend).from_entropy(
+                entropy=ElectrumV1Entropy(entropy="ad0c193bff3d2de77ed60a2d78d356fe")
+            ),
+            ElectrumDerivation(change=1, address=4)
+        ),
+        (
+            HDWallet(cryptocurrency=Monero, hd=MoneroHD, cache=backend).from_entropy(
+                entropy=MoneroEntropy(entropy="ad0c193bff3d2de77ed60a2d78d356fe")
+            ),
+            MoneroDerivation(minor=2, major=1)
+        )
+    ]:
+        field: str = "sub_address" if hdwallet.hd() == "Monero" else "address"
+        value: str = hdwallet.fork().update_derivation(derivation=derivation).__getattribute__(field)()
+        assert hdwallet.lookup(derivation=derivation, field=field) == value
+        assert hdwallet.lookup(derivation=derivation, field=field) == value
+    assert len(backend.entries) == 2
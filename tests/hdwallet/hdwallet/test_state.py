@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import (
+    Bitcoin, Cardano, Monero
+)
+from hdwallet.derivations import (
+    BIP44Derivation, CIP1852Derivation, CustomDerivation, ElectrumDerivation, MoneroDerivation
+)
+from hdwallet.entropies import (
+    ElectrumV1Entropy, ElectrumV2Entropy, MoneroEntropy
+)
+from hdwallet.exceptions import (
+    Error, HDError
+)
+from hdwallet.hds import (
+    BIP32HD, BIP44HD, BIP84HD, CardanoHD, ElectrumV1HD, ElectrumV2HD, MoneroHD
+)
+from hdwallet.seeds import (
+    BIP39Seed, CardanoSeed
+)
+from hdwallet.utils import (
+    pack_state, unpack_state
+)
+
+
+EXCLUDE: set = {"entropy", "strength", "mnemonic", "words", "language", "passphrase"}
+
+
+def test_pack_state():
+
+    values: tuple = (None, True, False, 0, 2 ** 64, b"\x00\x01", "BIP32", ("m/0", (1, 2), []), [b"", ""])
+    assert unpack_state(pack_state(values)) == (
+        None, True, False, 0, 2 ** 64, b"\x00\x01", "BIP32", ("m/0", (1, 2), ()), (b"", "")
+    )
+
+    state: bytes = pack_state(values)
+    for data in [state[:-1], b"X", b"I\x05\x01", b"T\x00\x02N"]:
+        with pytest.raises(Error, match="Invalid state data"):
+            unpack_state(data)
+    with pytest.raises(Error):
+        pack_state([1.5])
+
+
+def test_hdwallet_state():
+
+    hdwallets: list = [
+        HDWallet(
+            cryptocurrency=Bitcoin, hd=BIP44HD, network=Bitcoin.NETWORKS.MAINNET
+        ).from_seed(
+            seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+        ).from_derivation(
+            derivation=BIP44Derivation(coin_type=Bitcoin.COIN_TYPE, address=(0, 2))
+        ),
+        HDWallet(
+            cryptocurrency=Bitcoin, hd=BIP84HD, network=Bitcoin.NETWORKS.TESTNET
+        ).from_seed(
+            seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+        ),
+        HDWallet(
+            cryptocurrency=Bitcoin, hd=BIP32HD, public_key_type="uncompressed"
+        ).from_xpublic_key(
+            xpublic_key="xpub661MyMwAqRbcFtXgS5sYJABqqG9YLmC4Q1Rdap9gSE8NqtwybGhePY2gZ29ESFjqJoCu1Rupje8YtGqsefD265TMg7usUDFdp6W1EGMcet8"
+        ).from_derivation(
+            derivation=CustomDerivation(path="m/0/1-2")
+        ),
+        HDWallet(
+            cryptocurrency=Cardano, hd=CardanoHD, cardano_type="shelley-icarus", address_type="staking"
+        ).from_seed(
+            seed=CardanoSeed(seed="fca87b68fdffa968895901c894f678f6", cardano_type="shelley-icarus")
+        ).from_derivation(
+            derivation=CIP1852Derivation(account=0, role="external-chain", address=1)
+        ),
+        HDWallet(
+            cryptocurrency=Bitcoin, hd=ElectrumV1HD
+        ).from_entropy(
+            entropy=ElectrumV1Entropy(entropy="ad0c193bff3d2de77ed60a2d78d356fe")
+        ).from_derivation(
+            derivation=ElectrumDerivation(change=1, address=(3, 4))
+        ),
+        HDWallet(
+            cryptocurrency=Bitcoin, hd=ElectrumV2HD, mode="segwit", mnemonic_type="segwit"
+        ).from_entropy(
+            entropy=ElectrumV2Entropy(entropy="0909d49a61e5289873d16ddbe3f781eedf")
+        ).from_derivation(
+            derivation=ElectrumDerivation(change=0, address=2)
+        ),
+        HDWallet(
+            cryptocurrency=Monero, hd=MoneroHD
+        ).from_entropy(
+            entropy=MoneroEntropy(entropy="ad0c193bff3d2de77ed60a2d78d356fe")
+        ).from_derivation(
+            derivation=MoneroDerivation(minor=2, major=1)
+        )
+    ]
+
+    for hdwallet in hdwallets:
+        state: bytes = hdwallet.to_state()
+        assert isinstance(state, bytes) and len(state) < 1024
+        restored: HDWallet = HDWallet.from_state(state)
+        assert restored.dumps(exclude=EXCLUDE) == hdwallet.dumps(exclude=EXCLUDE)
+        assert restored.to_state() == state
+
+    with pytest.raises(Error, match="Invalid HDWallet state"):
+        HDWallet.from_state(pack_state(("HDWallet", "BTC")))
+
+    bip44: BIP44HD = BIP44HD(ecc=Bitcoin.ECC)
+    with pytest.raises(HDError):
+        bip44.from_state(hdwallets[-1]._hd.to_state())
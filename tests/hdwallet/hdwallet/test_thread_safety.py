@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# Copyright © 2020-2025, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import Bitcoin
+from hdwallet.derivations import BIP44Derivation
+from hdwallet.hds import (
+    HDS, BIP32HD, BIP44HD
+)
+from hdwallet.seeds import BIP39Seed
+
+
+def test_hd_slots():
+
+    for hd in HDS.classes():
+        assert all("__slots__" in vars(cls) for cls in hd.__mro__[:-1])
+
+    hd: BIP32HD = BIP32HD(ecc=Bitcoin.ECC)
+    assert not hasattr(hd, "__dict__")
+    assert hd.seed() is None and hd.strict() is None
+    with pytest.raises(AttributeError):
+        hd._unknown = None
+
+
+def test_concurrent_dumps():
+
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=Bitcoin, hd=BIP44HD, network=Bitcoin.NETWORKS.MAINNET
+    ).from_seed(
+        seed=BIP39Seed(seed="000102030405060708090a0b0c0d0e0f")
+    ).from_derivation(
+        derivation=BIP44Derivation(coin_type=Bitcoin.COIN_TYPE, account=(0, 1), address=(0, 4))
+    )
+    dump: dict = hdwallet.dump()
+    dumps: list = hdwallet.dumps(exclude={"root"})
+    assert hdwallet.dump() == dump
+
+    def work(position: int) -> tuple:
+        return (
+            hdwallet.dumps(exclude={"root"}),
+            hdwallet.derive_children(parent_path="m/44'/0'/0'/0", start=position, count=5),
+            hdwallet.dump()
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results: list = list(executor.map(work, range(16)))
+    for position, (_dumps, children, _dump) in enumerate(results):
+        assert _dumps == dumps and _dump == dump
+        assert children == hdwallet.derive_children(parent_path="m/44'/0'/0'/0", start=position, count=5)
+    assert hdwallet.dump() == dump
@@ -5,10 +5,15 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+from concurrent.futures import ThreadPoolExecutor
+
 import json
 import os
 import pytest
 
+from hdwallet.exceptions import (
+    Error, MnemonicError, SeedError
+)
 from hdwallet.seeds.bip39 import BIP39Seed
 
 
@@ -29,3 +34,40 @@ def test_bip39_seeds(data):
                     mnemonic= data["seeds"]["BIP39"][words][lang]["mnemonic"], passphrase=passphrase
                 ) == data["seeds"]["BIP39"][words][lang]["passphrases"][passphrase]
 
+
+
+def test_bip39_seeds_from_mnemonics():
+
+    mnemonics: list = [
+        "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
+        "legal winner thank year wave sausage worth useful legal winner thank yellow",
+        "letter advice cage absurd amount doctor acoustic avoid letter advice cage above",
+        "zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo wrong"
+    ] * 3
+    passphrases: list = [None, "", "TREZOR", "hdwallet"] * 3
+
+    assert list(BIP39Seed.from_mnemonics(mnemonics, passphrases, workers=3)) == [
+        BIP39Seed.from_mnemonic(mnemonic=mnemonic, passphrase=passphrase)
+        for mnemonic, passphrase in zip(mnemonics, passphrases)
+    ]
+    assert list(BIP39Seed.from_mnemonics(iter(mnemonics), "TREZOR", workers=1)) == [
+        BIP39Seed.from_mnemonic(mnemonic=mnemonic, passphrase="TREZOR") for mnemonic in mnemonics
+    ]
+    assert list(BIP39Seed.from_mnemonics(mnemonics)) == [
+        BIP39Seed.from_mnemonic(mnemonic=mnemonic) for mnemonic in mnemonics
+    ]
+    assert list(BIP39Seed.from_mnemonics([])) == []
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert list(BIP39Seed.from_mnemonics(mnemonics[:4], executor=executor)) == [
+            BIP39Seed.from_mnemonic(mnemonic=mnemonic) for mnemonic in mnemonics[:4]
+        ]
+
+    with pytest.raises(SeedError, match="Mnemonics and passphrases count mismatch"):
+        list(BIP39Seed.from_mnemonics(mnemonics, passphrases[:-1], workers=2))
+    with pytest.raises(MnemonicError, match="Invalid BIP39 mnemonic words"):
+        list(BIP39Seed.from_mnemonics(mnemonics[:2] + ["abandon abandon"], workers=2))
+    with pytest.raises(Error, match="Invalid workers count"):
+        BIP39Seed.from_mnemonics(mnemonics, workers=0)
+    with pytest.raises(Error, match="Invalid executor instance"):
+        BIP39Seed.from_mnemonics(mnemonics, executor=2)
@@ -9,6 +9,7 @@ import json
 import os
 import pytest
 
+from hdwallet.cryptocurrencies import Cardano
 from hdwallet.seeds.cardano import CardanoSeed
 
 
@@ -38,3 +39,18 @@ def test_cardano_seeds(data):
                         cardano_type=cardano_type
                     ) == data["seeds"]["Cardano"][words][cardano_type][lang]["passphrases"][passphrase]
 
+
+def test_cardano_seeds_from_mnemonics():
+
+    mnemonics: list = [
+        "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
+        "legal winner thank year wave sausage worth useful legal winner thank yellow",
+        "zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo wrong"
+    ]
+    passphrases: list = [None, "cardano", "hdwallet"]
+
+    for cardano_type in Cardano.TYPES.get_cardano_types():
+        assert list(CardanoSeed.from_mnemonics(mnemonics, passphrases, workers=2, cardano_type=cardano_type)) == [
+            CardanoSeed.from_mnemonic(mnemonic=mnemonic, passphrase=passphrase, cardano_type=cardano_type)
+            for mnemonic, passphrase in zip(mnemonics, passphrases)
+        ]
@@ -9,8 +9,10 @@ import pytest
 from hdwallet.crypto import (
     hmac_sha256, hmac_sha512, blake2b, blake2b_32, blake2b_40, blake2b_160, blake2b_224, blake2b_256, blake2b_512,
     chacha20_poly1305_encrypt, chacha20_poly1305_decrypt, sha256, double_sha256, hash160, crc32, xmodem_crc,  
-    pbkdf2_hmac_sha512, kekkak256, ripemd160, sha512, sha512_256, sha3_256
+    pbkdf2_hmac_sha512, kekkak256, ripemd160, sha512, sha512_256, sha3_256, HASHES,
+    hash160_many, sha256d_many, keccak256_many, HMACSHA512
 )
+from hdwallet.exceptions import Error
 
 # def test_hmac_sha256():
 #     assert hmac_sha256("key", "data") == b'todo_mock'
@@ -82,3 +84,94 @@ from hdwallet.crypto import (
 
 # def test_sha3_256():
 #     assert sha3_256("data") == b'todo_mock'
+
+
+def test_hash_backends(monkeypatch):
+
+    report: dict = HASHES.report()
+    assert set(report) == set(HASHES.primitives())
+    for primitive, backend in report.items():
+        assert backend == HASHES.backends(primitive)[0]
+
+    assert ripemd160(b"abc").hex() == "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"
+    assert hash160("0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798").hex() == (
+        "751e76e8199196d454941c45d1b3a323f1433bd6"
+    )
+    assert xmodem_crc(b"123456789").hex() == "31c3"
+    try:
+        for primitive in HASHES.primitives():
+            digests: set = set()
+            for backend in HASHES.backends(primitive):
+                assert HASHES.use(primitive, backend) == HASHES.report()[primitive] == backend
+                digests.add(HASHES.digests[primitive](bytes(range(100))))
+            assert len(digests) == 1
+        HASHES.use("ripemd160", "python")
+        assert ripemd160(b"abc").hex() == "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"
+
+        with pytest.raises(Error, match="Invalid ripemd160 hash backend"):
+            HASHES.use("ripemd160", "unknown")
+        with pytest.raises(Error, match="Invalid hash primitive"):
+            HASHES.setup(overrides="md5=hashlib")
+        assert HASHES.setup(overrides="ripemd160=python, xmodem_crc=crcmod")["ripemd160"] == "python"
+        assert HASHES.report()["xmodem_crc"] == "crcmod"
+        assert xmodem_crc(b"123456789").hex() == "31c3"
+        with pytest.raises(Error, match="Invalid ripemd160 hash backend"):
+            HASHES.setup(overrides="ripemd160=openssl")
+
+        monkeypatch.setenv("HDWALLET_HASH_BACKENDS", "ripemd160=openssl,md5=hashlib,xmodem_crc=crcmod")
+        with pytest.warns(RuntimeWarning) as record:
+            report: dict = HASHES.setup()
+        assert len(record) == 2
+        assert report["ripemd160"] == HASHES.backends("ripemd160")[0]
+        assert report["xmodem_crc"] == "crcmod"
+    finally:
+        HASHES.setup(overrides="")
+
+
+def test_batch_hashing():
+
+    items: list = [bytes([2 + (index % 2)]) + bytes([index]) * 32 for index in range(50)]
+    buffer: bytes = b"".join(items)
+
+    for batch, single, size in [
+        (hash160_many, hash160, 20), (sha256d_many, double_sha256, 32), (keccak256_many, kekkak256, 32)
+    ]:
+        expected: bytes = b"".join([single(item) for item in items])
+        assert batch(items) == expected
+        assert batch(buffer, width=33) == expected
+        assert batch(bytearray(buffer), width=33) == expected
+        assert batch(memoryview(buffer), width=33) == expected
+        assert batch(items, width=33) == expected
+        assert len(expected) == size * len(items)
+        assert batch([]) == b"" and batch(b"", width=33) == b""
+
+    with pytest.raises(Error, match="Invalid batch buffer"):
+        hash160_many(buffer)
+    with pytest.raises(Error, match="Invalid batch buffer"):
+        hash160_many(buffer, width=32)
+    with pytest.raises(Error, match="Invalid batch item"):
+        hash160_many(["00" * 33])
+    with pytest.raises(Error, match="Invalid batch item"):
+        hash160_many(items + ["00" * 33])
+    with pytest.raises(Error, match="Invalid batch item length"):
+        hash160_many(items, width=65)
+    with pytest.raises(Error, match="Invalid batch item length"):
+        hash160_many(items + [bytes(65)], width=33)
+    with pytest.raises(Error, match="Invalid batch,"):
+        hash160_many(item for item in items)
+    assert hash160_many(tuple(items)) == hash160_many(items)
+
+
+def test_hmac_sha512_context():
+
+    for key in [b"", b"\x01" * 32, b"\x02" * 128, b"\x03" * 200, "chain code"]:
+        context: HMACSHA512 = HMACSHA512(key)
+        for data in [b"", b"\x00" * 37, b"data" * 100]:
+            assert context.compute(data) == hmac_sha512(key, data)
+            assert HMACSHA512(key, data).digest() == hmac_sha512(key, data)
+            assert context.copy().update(data[:10]).update(data[10:]).digest() == hmac_sha512(key, data)
+        assert context.digest() == hmac_sha512(key, b"")
+
+    prefix: HMACSHA512 = HMACSHA512(b"key", b"\x00")
+    assert prefix.compute(b"data") == hmac_sha512(b"key", b"\x00data")
+    assert prefix.digest() == hmac_sha512(b"key", b"\x00")
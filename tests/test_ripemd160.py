@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+import hashlib
+import os
+
+import pytest
+
+from hdwallet.libs.ripemd160 import (
+    ripemd160, ripemd160_many
+)
+
+
+VECTORS: list = [
+    (b"", "9c1185a5c5e9fc54612808977ee8f548b2258d31"),
+    (b"a", "0bdc9d2d256b3ee9daae347be6f4dc835a467ffe"),
+    (b"abc", "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"),
+    (b"message digest", "5d0689ef49d2fae572b881b123a85ffa21595f36"),
+    (b"abcdefghijklmnopqrstuvwxyz", "f71c27109c692c1b56bbdceb5b9d2865b3708dbc"),
+    (b"abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq", "12a053384a9c0c88e405a06c27dcf49ada62eb2b"),
+    (b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789", "b0e20b6e3116640286ed3a87a5713079b21f5189"),
+    (b"1234567890" * 8, "9b752e45573d4b39f4dbd3323cab82bf63326bfb"),
+    (b"a" * 1000000, "52783243c1697bdbe16d37f97f68f08325dc1528")
+]
+
+
+def test_ripemd160():
+
+    for message, digest in VECTORS:
+        assert ripemd160(message).hex() == digest
+
+    assert ripemd160(bytes(32)).hex() == "d1a70126ff7a149ca6f9b638db084480440ff842"
+    assert ripemd160(bytearray(b"abc")).hex() == "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"
+    assert ripemd160_many([message for message, _ in VECTORS[:-1]] + [bytes(32)]) == [
+        ripemd160(message) for message, _ in VECTORS[:-1]
+    ] + [ripemd160(bytes(32))]
+    assert ripemd160_many([]) == []
+
+
+@pytest.mark.skipif("ripemd160" not in hashlib.algorithms_available, reason="OpenSSL RIPEMD-160 is not available")
+def test_ripemd160_openssl():
+
+    messages: list = [os.urandom(length) for length in range(0, 200)] + [os.urandom(32) for _ in range(50)]
+    assert ripemd160_many(messages) == [hashlib.new("ripemd160", message).digest() for message in messages]